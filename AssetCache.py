@@ -0,0 +1,62 @@
+# Name        : AssetCache class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains AssetCache class, which keeps copies of the
+#               window's images (background and arrows) already resized
+#               and saved in a format Tkinter can load by itself, so that
+#               they don't have to be decoded and resized with Pillow every
+#               time the program starts. A copy is made again whenever the
+#               original file changes.
+
+from tkinter import PhotoImage # Used to load the resized images straight into Tkinter
+from PIL import Image # Used to resize the images the first time
+from AtomicWrite import atomic_write # Used to write the resized images safely
+import os # Used to check when the original files were last changed
+
+# Class for the cache of resized images
+class AssetCache():
+
+    # Class initialization
+    def __init__(self, directory):
+
+        # Set the directory the resized images are kept in, and create it if it doesn't exist
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    # Method to get the start of the file name of a resized image (its name and size), which
+    # is shared by the copies made from every version of the original
+    def prefix(self, path, dims):
+        name = os.path.splitext(os.path.basename(path))[0]
+        return f"{name}-{dims[0]}x{dims[1]}-"
+
+    # Method to get an image resized to dims, as a Tkinter PhotoImage
+    def photo(self, path, dims):
+        # The time the original file was last changed is added to the prefix, so a changed
+        # file gets a new copy
+        prefix = self.prefix(path, dims)
+        version = prefix + str(os.stat(path).st_mtime_ns)
+
+        # Images with transparency are kept as PNG, and other images as PPM (which has no
+        # compression, so it is the fastest format for Tkinter to load)
+        for extension in (".ppm", ".png"):
+            cached = os.path.join(self.directory, version + extension)
+            if os.path.exists(cached):
+                return PhotoImage(file=cached)
+
+        # Resize the original (with antialiasing), and save it in the format that suits it
+        image = Image.open(path)
+        transparent = image.mode in ("RGBA", "LA") or "transparency" in image.info
+        image = image.convert("RGBA" if transparent else "RGB").resize(dims, Image.LANCZOS)
+        extension, image_format = (".png", "PNG") if transparent else (".ppm", "PPM")
+
+        # Write the image atomically, so a half-written image is never loaded
+        cached = os.path.join(self.directory, version + extension)
+        with atomic_write(cached, "wb") as f:
+            image.save(f, image_format)
+
+        # Remove the copies made from older versions of the original
+        for name in os.listdir(self.directory):
+            if name.startswith(prefix) and not name.startswith(version + "."):
+                os.remove(os.path.join(self.directory, name))
+
+        return PhotoImage(file=cached)
@@ -0,0 +1,93 @@
+# Name        : AsyncImdbClient class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains AsyncImdbClient class, which lets asyncio code
+#               (like the JSON server) make IMDb-API requests. Identical
+#               requests made at the same time are only sent once, the
+#               number of requests running at once is capped, and a request
+#               is cancelled once nobody is waiting for it anymore.
+
+from concurrent.futures import ThreadPoolExecutor # Used to run the pooled session's requests
+import asyncio # Used to run requests from an event loop
+import functools # Used to pass arguments to functions run on the thread pool
+
+# Class for the asyncio IMDb-API client
+class AsyncImdbClient():
+
+    # Class initialization
+    def __init__(self, client, max_requests):
+
+        # Set the (blocking) ImdbClient whose pooled session, timeouts, and retries are used
+        self.client = client
+
+        # Cap on the number of requests that can run at once, and the threads they run on
+        self.limit = asyncio.Semaphore(max_requests)
+        self.pool = ThreadPoolExecutor(max_workers=max_requests)
+
+        # Requests that are currently running, as key -> [task, number of callers waiting on it]
+        self.in_flight = {}
+
+    # Method to make a request, where key identifies the request (so that identical
+    # requests can be recognized) and function(*args) makes it using the ImdbClient
+    async def request(self, key, function, *args):
+
+        # If the same request is already running, wait on it instead of starting another
+        entry = self.in_flight.get(key)
+        if entry is None:
+            entry = self.in_flight[key] = [asyncio.create_task(self.run(function, *args)), 0]
+            entry[0].add_done_callback(lambda task: self.forget(key, entry))
+
+        entry[1] += 1
+        try:
+            # The task is shielded so that cancelling one caller doesn't cancel the
+            # request for every other caller waiting on it
+            return await asyncio.shield(entry[0])
+
+        finally:
+            entry[1] -= 1
+
+            # If every caller has been cancelled, nobody needs the request anymore (and
+            # a new caller asking for it again should start a fresh request)
+            if entry[1] == 0 and not entry[0].done():
+                entry[0].cancel()
+                self.forget(key, entry)
+
+    # Method to stop tracking a request once it has finished
+    def forget(self, key, entry):
+        if self.in_flight.get(key) is entry:
+            del self.in_flight[key]
+
+    # Method that runs a request on the thread pool once there is room under the cap
+    async def run(self, function, *args):
+        async with self.limit:
+            future = asyncio.get_running_loop().run_in_executor(self.pool, functools.partial(function, *args))
+
+            try:
+                return await asyncio.shield(future)
+
+            # A thread can't be stopped part-way through a request, so if the request is
+            # cancelled, its place under the cap is kept until the thread has finished
+            except asyncio.CancelledError:
+                await asyncio.wait([future])
+                raise
+
+    # Method to search for movies by title
+    async def search_movie(self, query):
+        return await self.request(("SearchMovie", query), self.client.search_movie, query)
+
+    # Method to search for movies that match certain genres
+    async def advanced_search(self, genres):
+        return await self.request(("AdvancedSearch", genres), self.client.advanced_search, genres)
+
+    # Method to get the details of a movie
+    async def title(self, movie_id):
+        return await self.request(("Title", movie_id), self.client.title, movie_id)
+
+    # Method to get the ratings of a movie
+    async def ratings(self, movie_id):
+        return await self.request(("Ratings", movie_id), self.client.ratings, movie_id)
+
+    # Method to cancel every running request (used when the server stops)
+    def cancel_all(self):
+        for task, waiting in list(self.in_flight.values()):
+            task.cancel()
@@ -0,0 +1,34 @@
+# Name        : atomic_write function file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains the atomic_write function, used by every part of
+#               Moview that saves a file. The file is written to a
+#               temporary file in the same directory first, then renamed
+#               into place. The rename is atomic, so a crash (or a full
+#               disk) can never leave a half-written file behind.
+
+from contextlib import contextmanager # Used to write the file inside a "with" block
+import os # Used to create the directory and rename the file into place
+import tempfile # Used to write to a temporary file first
+
+# Function to open a file to be written atomically, for use with "with" (e.g.
+# "with atomic_write(path) as f: f.write(text)"), in the given mode ("w" or "wb"). The
+# file only replaces the one at path once the block finishes without an error
+@contextmanager
+def atomic_write(path, mode="w"):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+        os.replace(temp_path, path)
+
+    # If anything went wrong, remove the temporary file instead of leaving it behind
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
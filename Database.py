@@ -0,0 +1,170 @@
+# Name        : Database class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains Database class, which stores every user's
+#               credentials and watchlist in a single SQLite database,
+#               and moves over the data from the older text files the
+#               first time it is opened.
+
+import os # Used to find the older text files
+import sqlite3 # Used to store the data in an SQLite database
+import threading # Used to make the database safe to use from background threads
+
+# Class for the Moview database
+class Database():
+
+    # Tables (and indexes) in the database. Each user's watchlist keeps its movies in
+    # the order they were added using a position number, and the index on (user_id,
+    # position) lets a watchlist be read in that order without sorting
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            password TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS movies (
+            id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            image_url TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS watchlist (
+            user_id INTEGER NOT NULL REFERENCES users (id),
+            movie_id TEXT NOT NULL REFERENCES movies (id),
+            position INTEGER NOT NULL,
+            PRIMARY KEY (user_id, movie_id)
+        );
+        CREATE INDEX IF NOT EXISTS watchlist_order ON watchlist (user_id, position);
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    # Class initialization
+    def __init__(self, directory):
+
+        # Set the directory that the database (and the older text files) are in
+        self.directory = directory
+
+        # Lock used so that background threads don't use the connection at the same time
+        self.lock = threading.Lock()
+
+        # Open the database. WAL mode lets the database be read while it is being
+        # written to, and makes each write much cheaper than the default mode
+        self.connection = sqlite3.connect(os.path.join(self.directory, "moview.db"), check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(self.SCHEMA)
+
+        # Move over the data from the older text files (only happens once)
+        self.migrate()
+
+    # Method to copy the users and watchlists from "creds.txt" and each user's text file
+    # into the database, the first time the database is opened
+    def migrate(self):
+        with self.lock, self.connection:
+            if self.connection.execute("SELECT 1 FROM settings WHERE key = 'migrated'").fetchone():
+                return
+
+            creds_path = os.path.join(self.directory, "creds.txt")
+            if os.path.exists(creds_path):
+
+                # Each line of "creds.txt" is a username and password separated by "|"
+                with open(creds_path, "r") as f:
+                    creds = [line.strip().split("|", 1) for line in f if "|" in line]
+
+                for name, password in creds:
+                    self.connection.execute("INSERT OR IGNORE INTO users (name, password) VALUES (?, ?)", (name, password))
+
+                    # Each line of a user's text file is a movie's id, title, and poster url separated by "|"
+                    list_path = os.path.join(self.directory, f"{name}.txt")
+                    if os.path.exists(list_path):
+                        with open(list_path, "r") as f:
+                            for line in f:
+                                movie = line.strip().split("|")
+                                if len(movie) == 3:
+                                    self.add_movie(name, *movie)
+
+            self.connection.execute("INSERT INTO settings (key, value) VALUES ('migrated', '1')")
+
+    # Method to get the names of every user
+    def users(self):
+        with self.lock:
+            return [row[0] for row in self.connection.execute("SELECT name FROM users ORDER BY id")]
+
+    # Method to get a user's password (or None if the user doesn't exist)
+    def password(self, name):
+        with self.lock:
+            row = self.connection.execute("SELECT password FROM users WHERE name = ?", (name,)).fetchone()
+            return row[0] if row else None
+
+    # Method to create a new user
+    def create_user(self, name, password):
+        with self.lock, self.connection:
+            self.connection.execute("INSERT INTO users (name, password) VALUES (?, ?)", (name, password))
+
+    # Method to get a user's watchlist, as a list of [id, title, poster url] lists in
+    # the order the movies were added
+    def watchlist(self, name):
+        with self.lock:
+            rows = self.connection.execute("""
+                SELECT movies.id, movies.title, movies.image_url
+                FROM watchlist
+                JOIN users ON users.id = watchlist.user_id
+                JOIN movies ON movies.id = watchlist.movie_id
+                WHERE users.name = ?
+                ORDER BY watchlist.position
+            """, (name,)).fetchall()
+
+            return [list(row) for row in rows]
+
+    # Method to add a movie to the end of a user's watchlist (the lock must be held,
+    # and a transaction open, when calling this)
+    def add_movie(self, name, movie_id, title, image_url):
+        self.connection.execute("""
+            INSERT INTO movies (id, title, image_url) VALUES (?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET title = excluded.title, image_url = excluded.image_url
+        """, (movie_id, title, image_url))
+
+        # The index on (user_id, position) means finding the last position doesn't
+        # need to look through the whole watchlist
+        self.connection.execute("""
+            INSERT OR IGNORE INTO watchlist (user_id, movie_id, position)
+            SELECT users.id, ?, COALESCE((SELECT MAX(position) FROM watchlist WHERE user_id = users.id), 0) + 1
+            FROM users WHERE users.name = ?
+        """, (movie_id, name))
+
+    # Method to apply a batch of changes to a user's watchlist in one transaction. Each
+    # change is a (movie id, movie) tuple, where the movie is an [id, title, poster url]
+    # list if it was added, or None if it was removed
+    def apply_changes(self, name, changes):
+        with self.lock, self.connection:
+            for movie_id, movie in changes:
+
+                # Remove the movie first, so that a movie that was removed and then added
+                # again ends up at the end of the watchlist
+                self.connection.execute("""
+                    DELETE FROM watchlist
+                    WHERE movie_id = ? AND user_id = (SELECT id FROM users WHERE name = ?)
+                """, (movie_id, name))
+
+                if movie is not None:
+                    self.add_movie(name, *movie)
+
+    # Method to add a movie to a user's watchlist if it isn't in it, or remove it if
+    # it is. Returns True if the movie was added, and False if it was removed
+    def toggle(self, name, movie_id, title, image_url):
+
+        # Everything happens in one transaction, so the check and the change can't be
+        # split up by another session changing the same watchlist
+        with self.lock, self.connection:
+            removed = self.connection.execute("""
+                DELETE FROM watchlist
+                WHERE movie_id = ? AND user_id = (SELECT id FROM users WHERE name = ?)
+            """, (movie_id, name)).rowcount
+
+            if not removed:
+                self.add_movie(name, movie_id, title, image_url)
+
+            return not removed
@@ -0,0 +1,66 @@
+# Name        : FailedPosterCache class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains FailedPosterCache class, which remembers (in
+#               memory, for a set time) which poster urls couldn't be
+#               loaded and why, so that a broken poster is shown as the
+#               placeholder straight away instead of being downloaded and
+#               decoded again every time it comes up.
+
+from collections import OrderedDict # Used to keep the failures in the order they were added
+import threading # Used to make the cache safe to use from the poster worker threads
+import time # Used to tell when a failure has expired
+
+# Class for the cache of failed poster urls
+class FailedPosterCache():
+
+    # Class initialization, with the number of seconds a failure is remembered for, and the
+    # most failures remembered at once
+    def __init__(self, ttl, max_entries):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        # Failures, as url -> [reason, time it expires], ordered from oldest to newest
+        self.failures = OrderedDict()
+        self.lock = threading.Lock()
+
+        # Counters used to measure how well the cache is working, and the number of
+        # failures added for each reason
+        self.hits = 0
+        self.expired = 0
+        self.reasons = {}
+
+    # Method to get the reason a url failed (or None if it hasn't failed recently)
+    def get(self, url):
+        with self.lock:
+            failure = self.failures.get(url)
+            if failure is None:
+                return None
+
+            # Forget the failure once it has expired, so the url is tried again
+            if time.monotonic() >= failure[1]:
+                del self.failures[url]
+                self.expired += 1
+                return None
+
+            self.hits += 1
+            return failure[0]
+
+    # Method to remember that a url failed, and why (e.g. "http 404" or "decode error")
+    def put(self, url, reason):
+        with self.lock:
+            self.failures.pop(url, None)
+            self.failures[url] = [reason, time.monotonic() + self.ttl]
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+            # Forget the oldest failures once there are too many
+            while len(self.failures) > self.max_entries:
+                self.failures.popitem(last=False)
+
+    # Method to get the cache's counters
+    def stats(self):
+        with self.lock:
+            return {"hits": self.hits,
+                    "expired": self.expired,
+                    "entries": len(self.failures),
+                    "reasons": dict(self.reasons)}
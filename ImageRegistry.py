@@ -0,0 +1,97 @@
+# Name        : ImageRegistry class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains ImageRegistry class, which keeps track of every
+#               PhotoImage the Moview window is holding on to, and how much
+#               memory they use on each screen. Once they use more than the
+#               memory budget, the images on screens that aren't showing are
+#               let go of (oldest first). Each screen loads its images again
+#               (from the poster caches) when it is shown again.
+
+from collections import OrderedDict # Used to keep the images in the order they were added
+
+# Class for the registry of the window's images (only used from the Tkinter thread)
+class ImageRegistry():
+
+    # Number of bytes Tkinter uses for each pixel of a PhotoImage (red, green, blue and alpha)
+    PIXEL_BYTES = 4
+
+    # Class initialization, with the memory budget (in bytes), and the metrics the images
+    # that are let go of are counted in
+    def __init__(self, max_bytes, metrics):
+        self.max_bytes = max_bytes
+        self.metrics = metrics
+
+        # Images, as (screen, key) -> [PhotoImage, bytes, release function], ordered from
+        # oldest to newest, along with the bytes used by each screen's images and in total
+        self.images = OrderedDict()
+        self.screen_bytes = {}
+        self.total_bytes = 0
+
+        # Screen that is showing (its images are never let go of)
+        self.visible = None
+
+        # Number of images that have been let go of to keep within the budget
+        self.released = 0
+
+    # Method to add an image that a screen is holding on to. release() is called if the
+    # image has to be let go of, and should stop the screen using it (the screen is
+    # expected to load it again the next time it is shown). An image already added under
+    # the same key is replaced
+    def add(self, screen, key, image, release):
+        self.remove(screen, key)
+
+        size = image.width() * image.height() * self.PIXEL_BYTES
+        self.images[(screen, key)] = [image, size, release]
+        self.change(screen, size)
+
+        self.enforce()
+
+    # Method to stop keeping track of an image that a screen has let go of itself
+    def remove(self, screen, key):
+        entry = self.images.pop((screen, key), None)
+        if entry is not None:
+            self.change(screen, -entry[1])
+
+    # Method to stop keeping track of every image on a screen (when the screen is deleted)
+    def remove_screen(self, screen):
+        for key in [key for key in self.images if key[0] == screen]:
+            self.remove(*key)
+
+    # Method to record that a screen is now showing, letting go of images on the other
+    # screens if they use more than the budget
+    def show(self, screen):
+        self.visible = screen
+        self.enforce()
+
+    # Method to let go of the oldest images on screens that aren't showing, until the images
+    # fit within the budget (or only the showing screen's images are left)
+    def enforce(self):
+        if self.total_bytes <= self.max_bytes:
+            return
+
+        for screen, key in list(self.images):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if screen == self.visible:
+                continue
+
+            # The image is removed before release() is called, since release() may call remove() too
+            image, size, release = self.images.pop((screen, key))
+            self.change(screen, -size)
+            self.released += 1
+            self.metrics.count("ui_images_released_total", screen=screen)
+            release()
+
+    # Method to update the bytes used by a screen's images (and in total)
+    def change(self, screen, size):
+        self.screen_bytes[screen] = self.screen_bytes.get(screen, 0) + size
+        self.total_bytes += size
+
+    # Method to get the memory used by the images, in total and on each screen
+    def stats(self):
+        return {"images": len(self.images),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "screen_bytes": dict(self.screen_bytes),
+                "released": self.released}
@@ -0,0 +1,186 @@
+# Name        : ImdbClient class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains ImdbClient class, which makes every request to
+#               IMDb-API (and its poster images) through one shared,
+#               pooled session with timeouts and automatic retries.
+
+from concurrent.futures import Future # Used to share one request's result between threads
+from RequestScheduler import RequestScheduler # Used for the request priority classes
+from urllib.parse import urlsplit # Used to get the server each request is sent to
+import threading # Used to make the client safe to use from several threads at once
+import time # Used to remember when each server last couldn't be reached
+
+# Error raised when IMDb-API answers with an error message (it sends these with a 200
+# status, like when its own daily limit has been reached). It is an OSError, like the
+# requests library's errors, so that it is handled the same way as a failed request
+class ApiError(OSError):
+    pass
+
+# Class for the IMDb-API client
+class ImdbClient():
+
+    # (connect, read) timeouts in seconds for each kind of request. AdvancedSearch
+    # has to search the whole database, so it is given longer to respond
+    TIMEOUTS = {"SearchMovie": (3.05, 15),
+                "AdvancedSearch": (3.05, 30),
+                "Title": (3.05, 15),
+                "Ratings": (3.05, 15),
+                "poster": (3.05, 10)}
+
+    # Number of times a request is retried after a server (5xx) or connection error,
+    # and the backoff factor between those retries (0.5s, 1s, 2s, ...)
+    RETRIES = 3
+    BACKOFF = 0.5
+
+    # Number of seconds that requests to a server fail straight away (without trying to
+    # connect) after a request to it couldn't connect, so that cached data is used quickly
+    # while offline
+    OFFLINE_WAIT = 30
+
+    # Class initialization
+    def __init__(self, key, pool_size, scheduler, base_url, metrics):
+
+        # Set the API key, the start of every IMDb-API link, the scheduler every request
+        # has to go through, and the metrics each request is recorded in
+        self.key = key
+        self.base_url = base_url
+        self.scheduler = scheduler
+        self.metrics = metrics
+
+        # The session is only created when the first request is made (see open_session()),
+        # with up to pool_size connections kept alive
+        self.pool_size = pool_size
+        self.session = None
+
+        # Errors that mean a server couldn't be reached (set once requests is imported), and
+        # the time until which requests to each server fail straight away after one of them,
+        # as server -> time (so a poster host that is down doesn't stop IMDb-API requests)
+        self.connection_errors = ()
+        self.offline_until = {}
+
+        # Requests that are currently being made, as url -> Future for the response. If a
+        # second thread asks for the same url while it is still loading, it waits for the
+        # first request rather than making its own
+        self.in_flight = {}
+        self.lock = threading.Lock()
+
+    # Method to make a GET request with the timeouts for the given kind of request,
+    # once the scheduler allows a request of the given priority to be sent
+    def get(self, kind, url, priority):
+
+        # Check whether another thread is already requesting this url
+        with self.lock:
+            request = self.in_flight.get(url)
+            first = request is None
+            if first:
+                request = self.in_flight[url] = Future()
+
+        # If so, wait for its response (or error) instead of making the same request again
+        if not first:
+            self.metrics.count("api_coalesced_total", kind=kind)
+            return request.result()
+
+        host = urlsplit(url).netloc
+
+        try:
+            # While the server is offline, fail straight away rather than waiting for every retry again
+            if time.monotonic() < self.offline_until.get(host, 0):
+                raise ConnectionError(f"{host} can't be reached right now")
+
+            # Wait for the request's turn (every kind of request except posters counts
+            # towards the API key's quota)
+            with self.metrics.span("api_queue", kind=kind):
+                self.scheduler.acquire(priority, kind != "poster")
+            try:
+                with self.metrics.span("api_request", kind=kind):
+                    response = self.open_session().get(url, timeout=self.TIMEOUTS[kind])
+            finally:
+                self.scheduler.release()
+
+            # Raise an error if the request failed, rather than carrying on with an error page
+            response.raise_for_status()
+
+            self.metrics.count("api_bytes_total", len(response.content), kind=kind)
+            self.metrics.observe("api_response_bytes", len(response.content), self.metrics.BYTE_BUCKETS, kind=kind)
+
+            request.set_result(response)
+            return response
+
+        # Pass the error on to any threads waiting on this request as well
+        except Exception as error:
+            if isinstance(error, self.connection_errors):
+                self.offline_until[host] = time.monotonic() + self.OFFLINE_WAIT
+
+            self.metrics.count("api_errors_total", kind=kind)
+            request.set_exception(error)
+            raise
+
+        finally:
+            with self.lock:
+                del self.in_flight[url]
+
+    # Method to get the session, creating it the first time it is needed
+    def open_session(self):
+        with self.lock:
+            if self.session is not None:
+                return self.session
+
+            # The requests library is imported here rather than at the top of the file, since
+            # loading it takes a noticeable part of the program's startup time, and nothing
+            # needs it until the first request is made
+            from requests.adapters import HTTPAdapter # Used to configure the session's connection pools
+            from urllib3.util.retry import Retry # Used to retry failed requests with exponential backoff
+            import requests # Used for making internet requests
+
+            # Retry GET requests on connection errors and 5xx responses, waiting twice as
+            # long after every failed attempt. Once the retries run out, the last response
+            # is returned so that raise_for_status() can report it
+            retry = Retry(total=self.RETRIES, backoff_factor=self.BACKOFF,
+                          status_forcelist=(500, 502, 503, 504),
+                          allowed_methods=frozenset(["GET"]), raise_on_status=False)
+
+            # Connection pools for the session. The poster worker threads all share them, so
+            # each pool keeps up to pool_size connections alive (one per worker thread)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size, max_retries=retry)
+
+            # Create the session, which reuses connections (keep-alive) between requests
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+            self.session = session
+            self.connection_errors = (requests.ConnectionError,)
+            return session
+
+    # Method to make an IMDb-API request and return its json data as a dictionary, raising
+    # an ApiError if IMDb-API answered with an error message instead (so that it is never
+    # mistaken for real data and cached)
+    def get_json(self, kind, url, priority):
+        data = self.get(kind, url, priority).json()
+
+        if data.get("errorMessage"):
+            self.metrics.count("api_errors_total", kind=kind)
+            raise ApiError(f"IMDb-API {kind} error: {data['errorMessage']}")
+
+        return data
+
+    # Method to search for movies by title
+    def search_movie(self, query, priority=RequestScheduler.FOREGROUND):
+        return self.get_json("SearchMovie", f"{self.base_url}/en/API/SearchMovie/{self.key}/{query}", priority)
+
+    # Method to search for movies that match certain genres
+    def advanced_search(self, genres, priority=RequestScheduler.VISIBLE):
+        return self.get_json("AdvancedSearch", f"{self.base_url}/API/AdvancedSearch/{self.key}/?genres={genres}", priority)
+
+    # Method to get the details of a movie
+    def title(self, movie_id, priority=RequestScheduler.FOREGROUND):
+        return self.get_json("Title", f"{self.base_url}/en/API/Title/{self.key}/{movie_id}", priority)
+
+    # Method to get the ratings of a movie
+    def ratings(self, movie_id, priority=RequestScheduler.FOREGROUND):
+        return self.get_json("Ratings", f"{self.base_url}/API/Ratings/{self.key}/{movie_id}", priority)
+
+    # Method to download a poster, returning its raw bytes
+    def poster(self, url, priority=RequestScheduler.VISIBLE):
+        return self.get("poster", url, priority).content
@@ -0,0 +1,93 @@
+# Name        : MetadataCache class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains MetadataCache class, which keeps the details and
+#               ratings of every movie viewed on disk, so that opening a
+#               movie again doesn't need any IMDb-API calls (which also
+#               saves on the API key's daily limit).
+
+from AtomicWrite import atomic_write # Used to write cache files atomically
+import json # Used to store each movie's record as a json file
+import os # Used to work with the cache directory and its files
+import threading # Used to make the cache safe to use from background threads
+import time # Used to check how old each part of a record is
+
+# Class for the on-disk movie metadata cache
+class MetadataCache():
+
+    # Class initialization
+    def __init__(self, directory, details_ttl, ratings_ttl):
+
+        # Set the cache directory, and how long (in seconds) each part of a record stays
+        # fresh. The details (title, genres, runtime, plot) almost never change, while the
+        # ratings change all the time, so they are given separate time limits
+        self.directory = directory
+        self.details_ttl = details_ttl
+        self.ratings_ttl = ratings_ttl
+
+        # Lock used so that background threads don't modify the cache at the same time
+        self.lock = threading.Lock()
+
+        # Records that have already been read from disk, as movie id -> record
+        self.records = {}
+
+        # Create the cache directory if it doesn't exist yet
+        os.makedirs(self.directory, exist_ok=True)
+
+    # Method to get the path of the file used for a movie's record
+    def path(self, movie_id):
+        return os.path.join(self.directory, f"{movie_id}.json")
+
+    # Method to get a movie's full record, reading it from disk the first time
+    # (the lock must be held when calling this)
+    def record(self, movie_id):
+        if movie_id not in self.records:
+            try:
+                with open(self.path(movie_id), "r") as f:
+                    self.records[movie_id] = json.load(f)
+
+            # If the movie isn't cached (or its file is unreadable), start with an empty record
+            except (OSError, ValueError):
+                self.records[movie_id] = {}
+
+        return self.records[movie_id]
+
+    # Method to get the cached details and ratings for a movie. Each one is None
+    # if it isn't cached, or if it is older than its time limit (unless stale is True,
+    # which is used when IMDb-API can't be reached and old information is better than none)
+    def get(self, movie_id, stale=False):
+        now = time.time()
+
+        with self.lock:
+            record = self.record(movie_id)
+
+            details = record.get("details")
+            if details is not None and not stale and now - record["details_time"] > self.details_ttl:
+                details = None
+
+            ratings = record.get("ratings")
+            if ratings is not None and not stale and now - record["ratings_time"] > self.ratings_ttl:
+                ratings = None
+
+            return details, ratings
+
+    # Method to store a movie's details and/or ratings in the cache
+    def put(self, movie_id, details=None, ratings=None):
+        now = time.time()
+
+        with self.lock:
+            record = dict(self.record(movie_id))
+
+            if details is not None:
+                record["details"] = details
+                record["details_time"] = now
+
+            if ratings is not None:
+                record["ratings"] = ratings
+                record["ratings_time"] = now
+
+            self.records[movie_id] = record
+
+            # Write the record atomically, so a crash can never leave a half-written record behind
+            with atomic_write(self.path(movie_id)) as f:
+                json.dump(record, f)
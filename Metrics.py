@@ -0,0 +1,198 @@
+# Name        : Metrics class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains Metrics class, which times the slow parts of
+#               Moview (requests, poster decoding, drawing screens) and
+#               counts things like bytes downloaded and cache hits, so
+#               that it can be seen where the time goes. The results can
+#               be saved as a JSON snapshot or as a Prometheus text file.
+#               When metrics are turned off, every method returns
+#               straight away.
+
+from AtomicWrite import atomic_write # Used to save the files safely
+from contextlib import contextmanager, nullcontext # Used to time a block of code with "with"
+import json # Used to save the JSON snapshot
+import threading # Used to make the metrics safe to update from several threads at once
+import time # Used to time each span
+
+# Class for Moview's metrics
+class Metrics():
+
+    # Start of the name of every metric
+    PREFIX = "moview_"
+
+    # Upper bounds of the histogram buckets for durations (in seconds) and for sizes (in bytes)
+    TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    BYTE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+    # Span returned when metrics are turned off, which does nothing on entering or leaving
+    NO_SPAN = nullcontext()
+
+    # Class initialization, with the file to save the metrics to when the program closes
+    # (ending in ".json" for a JSON snapshot, otherwise Prometheus text), or None to turn
+    # metrics off
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = path is not None
+
+        # Counters, as (name, labels) -> total, gauges, as (name, labels) -> current value,
+        # and histograms, as (name, labels) -> [bucket upper bounds, count in each bucket, sum, count]
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+        # Functions whose numbers are turned into gauges whenever the metrics are read, as
+        # a list of [name, function, label] (see collect())
+        self.collectors = []
+
+    # Method to add to a counter (labels are given as keyword arguments, e.g. kind="Title")
+    def count(self, name, amount=1, **labels):
+        if not self.enabled:
+            return
+
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    # Method to set a gauge to its current value (like the number of bytes something is using)
+    def set(self, name, value, **labels):
+        if not self.enabled:
+            return
+
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.gauges[key] = value
+
+    # Method to add a function returning a dictionary of numbers (like a cache's stats()),
+    # each of which is set as a "<name>_<key>" gauge whenever the metrics are read or saved.
+    # A value that is itself a dictionary is set as one gauge for each of its keys, which
+    # are given as the label named label
+    def collect(self, name, function, label=None):
+        self.collectors.append([name, function, label])
+
+    # Method to set the gauges of every function added with collect()
+    def gather(self):
+        if not self.enabled:
+            return
+
+        for name, function, label in self.collectors:
+            for key, value in function().items():
+                if isinstance(value, dict):
+                    for label_value, number in value.items():
+                        self.set(f"{name}_{key}", number, **{label: label_value})
+                else:
+                    self.set(f"{name}_{key}", value)
+
+    # Method to record a value (a duration in seconds, unless other buckets are given) in a histogram
+    def observe(self, name, value, buckets=TIME_BUCKETS, **labels):
+        if not self.enabled:
+            return
+
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [buckets, [0] * len(buckets), 0, 0]
+
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram[1][i] += 1
+                    break
+
+            histogram[2] += value
+            histogram[3] += 1
+
+    # Method to time a block of code, recording its duration in the "<name>_seconds"
+    # histogram (used as "with metrics.span(...):")
+    def span(self, name, **labels):
+        if not self.enabled:
+            return self.NO_SPAN
+
+        return self.timed(name + "_seconds", labels)
+
+    # Generator used by span() to time the block of code
+    @contextmanager
+    def timed(self, name, labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    # Method to get all of the metrics as a dictionary that can be turned into JSON
+    def snapshot(self):
+        self.gather()
+
+        with self.lock:
+            counters = [{"name": self.PREFIX + name, "labels": dict(labels), "value": value}
+                        for (name, labels), value in sorted(self.counters.items())]
+
+            gauges = [{"name": self.PREFIX + name, "labels": dict(labels), "value": value}
+                      for (name, labels), value in sorted(self.gauges.items())]
+
+            histograms = []
+            for (name, labels), (buckets, counts, total, count) in sorted(self.histograms.items()):
+                histograms.append({"name": self.PREFIX + name, "labels": dict(labels),
+                                   "buckets": dict(zip(map(str, buckets), counts)),
+                                   "sum": total, "count": count})
+
+        return {"time": time.time(), "counters": counters, "gauges": gauges, "histograms": histograms}
+
+    # Method to get all of the metrics in the Prometheus text format
+    def prometheus(self):
+        self.gather()
+        lines = []
+
+        with self.lock:
+            typed = set()
+            for (name, labels), value in sorted(self.counters.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {self.PREFIX}{name} counter")
+                    typed.add(name)
+                lines.append(f"{self.PREFIX}{name}{self.label_text(labels)} {value}")
+
+            for (name, labels), value in sorted(self.gauges.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {self.PREFIX}{name} gauge")
+                    typed.add(name)
+                lines.append(f"{self.PREFIX}{name}{self.label_text(labels)} {value}")
+
+            for (name, labels), (buckets, counts, total, count) in sorted(self.histograms.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {self.PREFIX}{name} histogram")
+                    typed.add(name)
+
+                # Prometheus buckets count every value up to their bound, so they add up
+                cumulative = 0
+                for bound, bucket_count in zip(buckets, counts):
+                    cumulative += bucket_count
+                    lines.append(f"{self.PREFIX}{name}_bucket{self.label_text(labels + (('le', bound),))} {cumulative}")
+
+                lines.append(f"{self.PREFIX}{name}_bucket{self.label_text(labels + (('le', '+Inf'),))} {count}")
+                lines.append(f"{self.PREFIX}{name}_sum{self.label_text(labels)} {total}")
+                lines.append(f"{self.PREFIX}{name}_count{self.label_text(labels)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+    # Method to turn a metric's labels into the Prometheus "{key="value",...}" form
+    def label_text(self, labels):
+        if not labels:
+            return ""
+
+        return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+    # Method to save the metrics to the file given when they were turned on (does nothing
+    # if metrics are off)
+    def export(self):
+        if not self.enabled:
+            return
+
+        if self.path.endswith(".json"):
+            text = json.dumps(self.snapshot(), indent=2)
+        else:
+            text = self.prometheus()
+
+        # Write the metrics atomically, so that anything reading the file never sees it half-written
+        with atomic_write(self.path) as f:
+            f.write(text)
@@ -0,0 +1,226 @@
+# Name        : MovieServer class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains MovieServer class, which makes a MovieService
+#               available as a small HTTP/JSON server (run with
+#               "python main.py --serve"), so that several users can share
+#               one set of caches and connection pools.
+
+from concurrent.futures import ThreadPoolExecutor # Used to run the service's (blocking) methods
+from AsyncImdbClient import AsyncImdbClient # Used to make IMDb-API requests from the event loop
+from RequestScheduler import QuotaExceeded # Used to recognize requests dropped to save the quota
+from urllib.parse import parse_qs, urlsplit # Used to read the path and query of each request
+import asyncio # Used to serve many connections at once from a single thread
+import functools # Used to pass arguments to functions run on the thread pool
+import json # Used to read request bodies and write responses
+
+# Exception raised when a request can't be understood (which the client is told with
+# a "bad request" response)
+class BadRequest(Exception):
+    pass
+
+# Class for the JSON server
+class MovieServer():
+
+    # Class that the service's methods (running on the server's threads) make their IMDb-API
+    # requests with. Each request is handed to the asyncio client on the event loop, so
+    # that identical requests from different users at the same time are only sent once
+    class LoopClient():
+
+        # Class initialization, with the asyncio client and the event loop it runs on
+        def __init__(self, api, loop):
+            self.api = api
+            self.loop = loop
+
+        # Method to run one of the asyncio client's requests on the event loop and wait for it
+        def run(self, request):
+            return asyncio.run_coroutine_threadsafe(request, self.loop).result()
+
+        # Methods matching the ImdbClient's requests (the asyncio client always uses each
+        # request's default priority)
+        def search_movie(self, query, priority=None):
+            return self.run(self.api.search_movie(query))
+
+        def advanced_search(self, genres, priority=None):
+            return self.run(self.api.advanced_search(genres))
+
+        def title(self, movie_id, priority=None):
+            return self.run(self.api.title(movie_id))
+
+        def ratings(self, movie_id, priority=None):
+            return self.run(self.api.ratings(movie_id))
+
+    # Text sent along with each status code used by the server
+    REASONS = {200: "OK", 400: "Bad Request", 403: "Forbidden", 404: "Not Found",
+               405: "Method Not Allowed", 429: "Too Many Requests", 502: "Bad Gateway"}
+
+    # Class initialization
+    def __init__(self, service, workers):
+
+        # Set the service that answers the requests
+        self.service = service
+
+        # The service's methods block while they wait on the disk or the database, so
+        # they run on this pool of threads while the event loop keeps serving other requests
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+
+        # Client used for IMDb-API requests, so that identical requests from different
+        # users at the same time are only sent once, and the client the service's methods
+        # use to send their requests through it (created once the event loop is running)
+        self.api = AsyncImdbClient(self.service.api, workers)
+        self.client = None
+
+    # Method to run one of the service's methods on the thread pool and wait for its result
+    async def call(self, function, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(self.pool, functools.partial(function, *args, **kwargs))
+
+    # Method to read a request, as its method, target (like "/search?q=avatar"), and json body
+    async def read_request(self, reader):
+        try:
+            # Read the request line (like "GET /search?q=avatar HTTP/1.1") and the headers
+            method, target, version = (await reader.readline()).decode("latin-1").split()
+
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            # Read the body (if there is one) as json
+            length = int(headers.get("content-length", 0))
+            body = json.loads(await reader.readexactly(length)) if length else {}
+
+        except (ValueError, asyncio.IncompleteReadError) as error:
+            raise BadRequest(str(error))
+
+        if not isinstance(body, dict):
+            raise BadRequest("The body must be a json object")
+
+        return method, target, body
+
+    # Method to get a field of a request's body, or of its query string
+    def field(self, values, name):
+        if name not in values:
+            raise BadRequest(f"Missing field: {name}")
+
+        # Query strings give a list of the values of each field, of which the first is used
+        value = values[name]
+        return value[0] if isinstance(value, list) else value
+
+    # Method that handles a single connection (one request and its response)
+    async def handle(self, reader, writer):
+        try:
+            status, result = await self.route(*await self.read_request(reader))
+
+        # Requests that can't be understood get a "bad request" response. Errors raised
+        # by the service itself (even a KeyError or ValueError) are IMDb-API's fault, so
+        # they aren't caught here
+        except BadRequest as error:
+            status, result = 400, {"error": str(error)}
+
+        # The API key's daily quota has run out
+        except QuotaExceeded as error:
+            status, result = 429, {"error": str(error)}
+
+        # Anything else went wrong while talking to IMDb-API
+        except Exception as error:
+            status, result = 502, {"error": str(error)}
+
+        # Send the response as json, then close the connection
+        payload = json.dumps(result).encode("utf-8")
+        writer.write((f"HTTP/1.1 {status} {self.REASONS[status]}\r\n"
+                      f"Content-Type: application/json\r\n"
+                      f"Content-Length: {len(payload)}\r\n"
+                      f"Connection: close\r\n\r\n").encode("latin-1") + payload)
+
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    # Method used to search for movies (the service decides what to request, and its
+    # requests are sent through the asyncio client)
+    async def movie_search(self, query):
+        return await self.call(self.service.movie_search, query, api=self.client)
+
+    # Method to obtain the details for a movie (using the cached details, even if they are
+    # out of date, when IMDb-API can't be reached)
+    async def movie_details(self, movie_id):
+        return await self.call(self.service.movie_details, movie_id, api=self.client)
+
+    # Method used to get the movies similar to a movie (using the local recommendations
+    # when IMDb-API can't be reached)
+    async def similar_movies(self, movie_id):
+        genres = (await self.movie_details(movie_id))["genres"]
+        return await self.call(self.service.similar_movies, genres, movie_id, api=self.client)
+
+    # Method to answer a request, returning the status code and the data to send back.
+    #   GET  /search?q=<query>   -> search results
+    #   GET  /movie/<id>         -> a movie's details
+    #   GET  /similar/<id>       -> movies similar to a movie
+    #   GET  /budget             -> how much of the API key's daily quota is left
+    #   GET  /metrics            -> JSON snapshot of the metrics (empty unless they are on)
+    #   POST /users              -> create a user ({"name", "password"})
+    #   POST /watchlist          -> a user's watchlist ({"name", "password"})
+    #   POST /watchlist/toggle   -> add/remove a movie ({"name", "password", "id", "title", "image_url"})
+    async def route(self, method, target, body):
+        url = urlsplit(target)
+        path = url.path.strip("/").split("/")
+
+        if method == "GET":
+            if path == ["search"]:
+                return 200, await self.movie_search(self.field(parse_qs(url.query), "q"))
+
+            if len(path) == 2 and path[0] == "movie":
+                return 200, await self.movie_details(path[1])
+
+            if len(path) == 2 and path[0] == "similar":
+                return 200, await self.similar_movies(path[1])
+
+            if path == ["budget"]:
+                return 200, await self.call(self.service.budget)
+
+            if path == ["metrics"]:
+                return 200, self.service.metrics.snapshot()
+
+        elif method == "POST":
+            if path == ["users"]:
+                name, password = self.field(body, "name"), self.field(body, "password")
+                if await self.call(self.service.user_exists, name):
+                    return 403, {"error": "User already exists"}
+
+                await self.call(self.service.create_user, name, password)
+                return 200, {"created": True}
+
+            if path[0] == "watchlist":
+
+                # Every watchlist request needs the user's password
+                name, password = self.field(body, "name"), self.field(body, "password")
+                if not await self.call(self.service.check_password, name, password):
+                    return 403, {"error": "Incorrect username or password"}
+
+                if path == ["watchlist"]:
+                    return 200, await self.call(self.service.watchlist, name)
+
+                if path == ["watchlist", "toggle"]:
+                    added = await self.call(self.service.toggle_watchlist, name, self.field(body, "id"),
+                                            self.field(body, "title"), self.field(body, "image_url"))
+                    return 200, {"added": added}
+
+        else:
+            return 405, {"error": f"Method {method} not allowed"}
+
+        return 404, {"error": f"No such path: {url.path}"}
+
+    # Method to start the server and keep serving until the program is stopped
+    async def serve(self, host, port):
+        self.client = self.LoopClient(self.api, asyncio.get_running_loop())
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Moview server listening on http://{host}:{port}")
+
+        try:
+            async with server:
+                await server.serve_forever()
+
+        # Stop any requests that are still running when the server stops
+        finally:
+            self.api.cancel_all()
@@ -0,0 +1,551 @@
+# Name        : MovieService class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains MovieService class, which does all of Moview's
+#               searching, movie details, recommendations, and user/watchlist
+#               work without any Tkinter code, returning plain data. The
+#               Moview window and the JSON server (MovieServer) both use it,
+#               so they share the same caches and connection pools.
+
+from PIL import Image, JpegImagePlugin # Used to decode and resize posters
+from io import BytesIO # Used to convert raw bytecode into BytesIO object for Pillow
+from concurrent.futures import ThreadPoolExecutor # Used to download posters concurrently
+from PosterCache import PosterCache # Used to keep downloaded posters on disk
+from ThumbnailCache import ThumbnailCache # Used to keep resized posters in memory
+from FailedPosterCache import FailedPosterCache # Used to remember which posters couldn't be loaded
+from ImdbClient import ImdbClient # Used for making requests to IMDb-API
+from RequestScheduler import RequestScheduler, QuotaExceeded # Used to prioritize requests and budget the API key
+from MetadataCache import MetadataCache # Used to keep the details of viewed movies on disk
+from SearchCache import SearchCache # Used to answer searches without IMDb-API where possible
+from Recommender import Recommender # Used to recommend similar movies without calling IMDb-API
+from Database import Database # Used to store users and their watchlists
+from Watchlist import Watchlist # Used to hold a logged-in user's watchlist in memory
+from Metrics import Metrics # Used to record where the time goes
+import os # Used to build the paths of the cache directories, and to read the metrics setting
+import re # Used to recognize poster urls that can be asked for at a smaller size
+import threading # Used to make the placeholder only once for each size
+import warnings # Used to raise an error if images are too large
+
+# Error raised when a downloaded poster isn't an image Pillow can decode
+class PosterDecodeError(Exception):
+    pass
+
+# Class for the Moview service
+class MovieService():
+
+    # API key for IMDb-API, and the start of every IMDb-API link
+    KEY = "k_zax1xbn5"
+    API_URL = "https://imdb-api.com"
+
+    # Maximum number of posters that are downloaded and decoded at the same time
+    POSTER_WORKERS = 8
+
+    # Number of threads used for IMDb-API requests that run alongside another request
+    # (kept apart from the poster workers, so they never wait behind queued posters)
+    API_WORKERS = 4
+
+    # Number of threads used to prefetch posters (kept apart from the poster workers, so a
+    # poster that is on screen never waits behind prefetched ones)
+    PREFETCH_WORKERS = 2
+
+    # Number of IMDb-API calls the API key is allowed per day, and the rate limit
+    # (calls per second, and the most that can be made in a burst) kept under
+    DAILY_QUOTA = 100
+    REQUEST_RATE = 2
+    REQUEST_BURST = 5
+
+    # Directory where the database of users and watchlists is stored
+    DATABASE_DIR = "database"
+
+    # Directory where downloaded data is cached, and the maximum size (in bytes)
+    # of the poster cache within it
+    CACHE_DIR = "cache"
+    POSTER_CACHE_BYTES = 200 * 1024 * 1024
+
+    # Maximum amount of decoded pixel data (in bytes) kept in memory for resized posters
+    THUMBNAIL_CACHE_BYTES = 64 * 1024 * 1024
+
+    # How long (in seconds) a cached movie's details (title, genres, runtime, plot)
+    # and ratings are used before they are requested again
+    DETAILS_TTL = 30 * 24 * 60 * 60
+    RATINGS_TTL = 24 * 60 * 60
+
+    # Number of searches whose results are kept in memory
+    SEARCH_CACHE_ENTRIES = 256
+
+    # Maximum number of similar movies recommended for a movie, and the number of local
+    # recommendations needed before IMDb-API no longer has to be asked for more
+    RECOMMENDATIONS = 50
+    MIN_LOCAL_RECOMMENDATIONS = 15
+
+    # Environment variable with the file to save metrics to when the program closes (ending
+    # in ".json" for a JSON snapshot, otherwise Prometheus text). Metrics are off if it isn't set
+    METRICS_ENV = "MOVIEW_METRICS"
+
+    # Image shown when a poster can't be loaded (bundled with Moview, so it never has to be
+    # downloaded)
+    PLACEHOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "placeholder.jpg")
+
+    # How long (in seconds) a poster that couldn't be loaded is shown as the placeholder
+    # before it is tried again, and the most failed posters remembered at once
+    FAILED_POSTER_TTL = 60 * 60
+    FAILED_POSTER_ENTRIES = 4096
+
+    # Sizes posters are shown at (in movie lists, and on a movie's page). Every size is
+    # made whenever a poster is decoded, so a poster is only ever downloaded and decoded once
+    POSTER_SIZES = ((81, 123), (122, 185))
+
+    # Poster urls from Amazon's image server (which IMDb's posters are kept on), as the
+    # start of the url followed by the image options
+    AMAZON_POSTER = re.compile(r"^(https://m\.media-amazon\.com/images/M/[^/.]+)\._V1_[^/]*\.jpg$")
+
+    # Class initialization
+    def __init__(self):
+
+        # Create the metrics every part of the service is timed with
+        self.metrics = Metrics(os.environ.get(self.METRICS_ENV))
+
+        # Open the database of users and watchlists
+        self.db = Database(self.DATABASE_DIR)
+
+        # Create a bounded pool of worker threads used to download and decode posters
+        self.poster_pool = ThreadPoolExecutor(max_workers=self.POSTER_WORKERS)
+
+        # Create the pool of worker threads used to make IMDb-API requests that run alongside
+        # another request. The poster pool runs its jobs in the order they were added, so a
+        # request put on it would have to wait for every prefetched poster queued before it
+        self.api_pool = ThreadPoolExecutor(max_workers=self.API_WORKERS)
+
+        # Create the small pool of worker threads used to prefetch posters, for the same reason
+        self.prefetch_pool = ThreadPoolExecutor(max_workers=self.PREFETCH_WORKERS)
+
+        # Create the scheduler every request goes through, which lets one request per
+        # poster worker be sent at a time, most important first
+        self.scheduler = RequestScheduler(os.path.join(self.CACHE_DIR, "quota.json"), self.DAILY_QUOTA,
+                                          self.REQUEST_RATE, self.REQUEST_BURST, self.POSTER_WORKERS)
+
+        # Create the client used for every request to IMDb-API, with one pooled
+        # connection per poster worker
+        self.api = ImdbClient(self.KEY, self.POSTER_WORKERS, self.scheduler, self.API_URL, self.metrics)
+
+        # Create the on-disk cache for poster downloads
+        self.poster_cache = PosterCache(os.path.join(self.CACHE_DIR, "posters"), self.POSTER_CACHE_BYTES)
+
+        # Create the in-memory cache for decoded and resized posters
+        self.thumbnail_cache = ThumbnailCache(self.THUMBNAIL_CACHE_BYTES)
+
+        # Create the in-memory cache of posters that couldn't be loaded
+        self.failed_posters = FailedPosterCache(self.FAILED_POSTER_TTL, self.FAILED_POSTER_ENTRIES)
+
+        # The placeholder resized to each size it has been needed at, as dims -> Pillow image
+        self.placeholders = {}
+        self.placeholder_lock = threading.Lock()
+
+        # Create the on-disk cache for movie details and ratings
+        self.metadata_cache = MetadataCache(os.path.join(self.CACHE_DIR, "metadata"), self.DETAILS_TTL, self.RATINGS_TTL)
+
+        # Create the in-memory cache for search results
+        self.search_cache = SearchCache(self.SEARCH_CACHE_ENTRIES)
+
+        # Create the local recommendation engine, which learns from every movie seen
+        self.recommender = Recommender(os.path.join(self.CACHE_DIR, "recommender.json"))
+
+        # Publish each cache's counters (hits, misses, evictions, and space used) as gauges,
+        # so that they can be seen in the metrics when sizing the caches
+        self.metrics.collect("poster_cache", self.poster_cache.stats)
+        self.metrics.collect("thumbnail_cache", self.thumbnail_cache.stats)
+        self.metrics.collect("search_cache", self.search_cache.stats)
+        self.metrics.collect("failed_posters", self.failed_posters.stats, "reason")
+
+        # When using reading images from the internet using Pillow, the default behaviour is to display
+        # a warning message if an image is too large. In order to avoid this, we can use the warnings
+        # library (that comes with Python) to raise an error instead, so that it can be caught using a
+        # try-except block.
+        warnings.simplefilter('error', Image.DecompressionBombWarning)
+
+    # Method to stop the service's background threads, and save the recommender's movies
+    # and the metrics (if they are on)
+    def close(self):
+        self.poster_pool.shutdown(wait=False, cancel_futures=True)
+        self.api_pool.shutdown(wait=False, cancel_futures=True)
+        self.prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self.recommender.flush()
+        self.metrics.export()
+
+    # Method to get a report of how much of the API key's budget is left for today
+    def budget(self):
+        return self.scheduler.budget()
+
+    # Method to check whether a user exists
+    def user_exists(self, name):
+        return self.db.password(name) is not None
+
+    # Method to check whether a password is correct for a user
+    def check_password(self, name, password):
+        return self.db.password(name) == password
+
+    # Method to create a new user (whose watchlist starts off empty)
+    def create_user(self, name, password):
+        self.db.create_user(name, password)
+
+    # Method to load a user's watchlist into memory for a session (changes to it are
+    # only saved when its flush() method is called)
+    def open_watchlist(self, name):
+        return Watchlist(self.db, name)
+
+    # Method to get a user's watchlist, as a list with each movie's id, title, and poster url
+    def watchlist(self, name):
+        return self.db.watchlist(name)
+
+    # Method to add a movie to a user's watchlist if it isn't in it, or remove it if it is,
+    # saving the change straight away. Returns True if the movie was added
+    def toggle_watchlist(self, name, movie_id, title, image_url):
+        return self.db.toggle(name, movie_id, title, image_url)
+
+    # Function to get a resized Pillow image from an online URL (safe to call from
+    # several threads at once)
+    def poster_image(self, url, dims, priority=RequestScheduler.VISIBLE):
+        with self.metrics.span("poster_image"):
+            return self.load_poster_image(url, dims, priority)
+
+    # Method to get a resized Pillow image for poster_image()
+    def load_poster_image(self, url, dims, priority):
+
+        # If this poster has already been decoded at this size, reuse it
+        poster = self.thumbnail_cache.get(url, dims)
+        if poster is not None:
+            self.metrics.count("poster_cache_hits_total", cache="thumbnail")
+            return poster
+
+        # If this poster couldn't be loaded recently, show the placeholder straight away
+        reason = self.failed_posters.get(url)
+        if reason is not None:
+            self.metrics.count("poster_placeholders_total", reason=reason)
+            return self.placeholder(dims)
+
+        # Try and except used because sometimes images can't be downloaded or decoded
+        try:
+            return self.decode_poster(url, dims, priority)
+        
+        # If the image can't be used, show the placeholder image instead, and remember why
+        # (unless the failure is likely to be temporary)
+        except Exception as error:
+            reason = self.failure_reason(error)
+            if reason is not None:
+                self.failed_posters.put(url, reason)
+
+            self.metrics.count("poster_placeholders_total", reason=reason or "temporary")
+            return self.placeholder(dims)
+
+    # Method to get the reason a poster couldn't be loaded (like "http 404", "decode error" or
+    # "decompression bomb"), or None if the failure is likely to be temporary (no internet
+    # connection, the server being busy or down, or the API key's quota running out), so the
+    # poster should be tried again next time
+    def failure_reason(self, error):
+        if isinstance(error, (Image.DecompressionBombError, Image.DecompressionBombWarning)):
+            return "decompression bomb"
+
+        if isinstance(error, PosterDecodeError):
+            return "decode error"
+
+        # Errors from the requests library have the response, if there was one. Only errors
+        # the server won't recover from (like 404) are remembered, not 429 or 5xx errors
+        response = getattr(error, "response", None)
+        if response is not None and response.status_code != 429 and response.status_code < 500:
+            return f"http {response.status_code}"
+
+        return None
+
+    # Method to get the placeholder image at a size. The first time it is needed, it is
+    # made at every size in POSTER_SIZES at once
+    def placeholder(self, dims):
+        dims = tuple(dims)
+
+        with self.placeholder_lock:
+            if dims not in self.placeholders:
+                sizes = set(self.POSTER_SIZES)
+                sizes.add(dims)
+                with open(self.PLACEHOLDER_PATH, "rb") as f:
+                    self.placeholders.update(self.resize_poster(f.read(), sizes))
+
+            return self.placeholders[dims]
+
+    # Method to decode a poster at every size in POSTER_SIZES (and at dims, if it isn't one
+    # of them) from a single download, storing them all in the thumbnail cache. Returns the
+    # poster at dims
+    def decode_poster(self, url, dims, priority):
+
+        # Use the cached copy of the image if there is one, otherwise
+        # request the image from the internet
+        poster_request = self.poster_cache.get(url)
+        cached = poster_request is not None
+        if cached:
+            self.metrics.count("poster_cache_hits_total", cache="disk")
+        else:
+            self.metrics.count("poster_cache_misses_total")
+            poster_request = self.download_poster(url, priority)
+
+        sizes = set(self.POSTER_SIZES)
+        sizes.add(tuple(dims))
+
+        # Errors from decoding the image (other than it being too large) are raised as a
+        # PosterDecodeError, so that they can be told apart from errors anywhere else
+        with self.metrics.span("poster_decode"):
+            try:
+                posters = self.resize_poster(poster_request, sizes)
+            except (Image.DecompressionBombError, Image.DecompressionBombWarning):
+                raise
+            except Exception as error:
+                raise PosterDecodeError(f"poster could not be decoded: {error}") from error
+
+        # Only store the download once it is known to be a usable image. If it can't be
+        # written (like when the disk is full), the poster is still shown, just not cached
+        if not cached:
+            try:
+                self.poster_cache.put(url, poster_request)
+            except OSError:
+                self.metrics.count("poster_cache_write_errors_total")
+
+        for size, poster in posters.items():
+            self.thumbnail_cache.put(url, size, poster)
+
+        return posters[tuple(dims)]
+
+    # Method to download a poster, asking the server for a smaller copy of it first if it
+    # can make one (see poster_variant()). The original is downloaded if the smaller copy
+    # can't be downloaded or isn't an image
+    def download_poster(self, url, priority):
+        variant = self.poster_variant(url)
+
+        if variant is not None:
+            try:
+                poster_request = self.api.poster(variant, priority)
+                Image.open(BytesIO(poster_request))
+                self.metrics.count("poster_variants_total", result="used")
+                return poster_request
+            except Exception:
+                self.metrics.count("poster_variants_total", result="failed")
+
+        return self.api.poster(url, priority)
+
+    # Method to get the url of a smaller copy of a poster (still at least as large as every
+    # size in POSTER_SIZES), made by the server the poster comes from, or None if the
+    # server can't make one
+    def poster_variant(self, url):
+        width = max(size[0] for size in self.POSTER_SIZES)
+        height = max(size[1] for size in self.POSTER_SIZES)
+
+        # IMDb-API has copies of its images at other sizes in place of "original"
+        original = f"{self.API_URL}/images/original/"
+        if url.startswith(original):
+            return f"{self.API_URL}/images/{width}x{height}/{url[len(original):]}"
+
+        # Amazon's image server resizes an image to the height given at the end of its url
+        match = self.AMAZON_POSTER.match(url)
+        if match is not None:
+            return f"{match.group(1)}._V1_UY{height}_.jpg"
+
+        return None
+
+    # Method to decode a downloaded poster and resize it to each of the given sizes. Returns
+    # a dictionary of size -> Pillow image
+    def resize_poster(self, poster_request, sizes):
+        largest = (max(size[0] for size in sizes), max(size[1] for size in sizes))
+
+        # JPEGs are decoded straight at the smallest scale (1/2, 1/4 or 1/8) that is still at
+        # least as large as the largest size, which takes a fraction of the time and memory of
+        # decoding every pixel. Image.open() would refuse to open a JPEG with a very large
+        # number of pixels, even though only the scaled copy is ever decoded, so they are
+        # opened directly and the scaled copy's size is checked instead
+        if poster_request[:3] == b"\xff\xd8\xff":
+            poster = JpegImagePlugin.JpegImageFile(BytesIO(poster_request))
+            poster.draft("RGB", largest)
+            if poster.width * poster.height > Image.MAX_IMAGE_PIXELS:
+                raise Image.DecompressionBombError(f"poster is too large to decode ({poster.width}x{poster.height})")
+        else:
+            poster = Image.open(BytesIO(poster_request))
+
+        poster.load()
+
+        # Resize the poster to each size (with antialiasing)
+        return {size: poster.resize(size, Image.LANCZOS) for size in sizes}
+
+    # Method used to search for movies. Requests are made with api (the service's own
+    # client if it isn't given), which is how the JSON server sends them its own way
+    def movie_search(self, query, api=None):
+        api = api or self.api
+
+        # Use the cached results if the same query was searched for before (results filtered
+        # from a shorter search are only a preview, so the API is still asked)
+        results, complete = self.search_cache.lookup(query)
+        if complete:
+            return results
+
+        # Otherwise, get the results using the API client, which turns the json data into a
+        # Python-useable dictionary, turn them into the search results list, and cache them
+        results = self.search_results(api.search_movie(query))
+        self.search_cache.put(query, results)
+        return results
+
+    # Method to get whatever results are already cached for a query, without making any
+    # requests, as (results, complete). The results are None if there is nothing cached
+    # to go on, and complete is False if they might be missing some movies
+    def cached_search(self, query):
+        return self.search_cache.lookup(query)
+
+    # Method to turn the json data from a SearchMovie request into a list of search results
+    def search_results(self, raw_results):
+
+        # List to store the search results
+        search_results = []
+
+        # Get the results item from the dictionary
+        results_dict = raw_results["results"]
+
+        # Iterate through the results dictionary 
+        for result in results_dict:
+            
+            # Create a list with the movie's id, title, description, and poster url (the
+            # poster is only loaded once the movie is scrolled into view)
+            movie_info = [result["id"], result["title"], result["description"], result["image"]]
+            
+            # Append this list to the search results list
+            search_results.append(movie_info)
+
+        # Return the search results list
+        return search_results
+
+    # Method used to search for movies that match certain genres (given as a string
+    # like "Action, Drama"). The original movie provided is never included, since we
+    # wouldn't want to recommend a movie that is the exact same as the one being
+    # viewed by the user. Requests are made with api (the service's own client if it isn't given)
+    def similar_movies(self, genres, avoid, priority=RequestScheduler.VISIBLE, api=None):
+        api = api or self.api
+
+        # Get the list of similar movies from the local recommender. Each movie is a list
+        # with the movie's id, title, description, and poster url (the poster is only
+        # loaded once the movie's page of recommendations is shown)
+        similars_results = self.recommender.recommend(genres, avoid, self.RECOMMENDATIONS)
+
+        # If the program hasn't seen enough movies with these genres yet, ask IMDb-API
+        if len(similars_results) < self.MIN_LOCAL_RECOMMENDATIONS:
+
+            # Get the results using the API client, which turns the json data into a Python-useable
+            # dictionary, add them to the recommender, and get the recommendations again. If the
+            # scheduler drops the request to save the daily quota, or IMDb-API can't be reached,
+            # the local results are used
+            try:
+                self.learn_similars(api.advanced_search(self.genre_tags(genres), priority))
+                similars_results = self.recommender.recommend(genres, avoid, self.RECOMMENDATIONS)
+            except (QuotaExceeded, OSError):
+                pass
+
+        # Return the list of similar movies
+        return similars_results
+
+    # Method to remove spacing between genres (so that the string can be used in a url)
+    def genre_tags(self, genres):
+        return ''.join(genres.split())
+
+    # Method to add the movies from the json data of an AdvancedSearch request to the recommender
+    def learn_similars(self, raw_similars):
+
+        # Get the results item from the dictionary
+        similars_dict = raw_similars["results"]
+
+        self.recommender.add([(result["id"], result["title"], result["description"], result["image"],
+                               result.get("genres"), result.get("imDbRating")) for result in similars_dict])
+
+    # Method to obtain the details for a movie. Requests are made with api (the service's
+    # own client if it isn't given)
+    def movie_details(self, movie_id, priority=RequestScheduler.FOREGROUND, api=None):
+        api = api or self.api
+
+        # Get the parts of the movie's information that are already cached (each one
+        # is None if it isn't cached or has gone stale)
+        details, ratings = self.metadata_cache.get(movie_id)
+        details_dict = ratings_dict = None
+
+        try:
+            # If the ratings are needed, start getting them on the worker pool straight away,
+            # so that the details and ratings requests happen at the same time
+            if ratings is None:
+                ratings_request = self.api_pool.submit(api.ratings, movie_id, priority)
+
+            # Get the details (as a Python-useable dictionary) using the API client
+            if details is None:
+                details_dict = api.title(movie_id, priority)
+
+            # Wait for the ratings (as a Python-useable dictionary) from the API client
+            if ratings is None:
+                ratings_dict = ratings_request.result()
+
+        # If IMDb-API can't be reached (or the daily quota has run out), use the cached
+        # information even if it is out of date, as long as all of it is cached
+        except (QuotaExceeded, OSError):
+            details, ratings = self.metadata_cache.get(movie_id, stale=True)
+            if details is None or ratings is None:
+                raise
+            details_dict = ratings_dict = None
+
+        # Combine the cached and requested information into the movie's details
+        return self.details_record(movie_id, details, ratings, details_dict, ratings_dict)
+
+    # Method to combine a movie's cached details and ratings (each None if it wasn't cached)
+    # with the json data from its Title and Ratings requests (each None if it wasn't
+    # requested), caching any new information, and return the movie's details
+    def details_record(self, movie_id, details, ratings, details_dict, ratings_dict):
+
+        # Tuple of all the relevant keys needed for movie information
+        KEY_LIST = ("fullTitle",
+                    "genres",
+                    "runtimeStr",
+                    "plot",
+                    "contentRating")
+
+        # Tuple of all the relevant keys needed for rating information
+        RATING_LIST = ("imDb",
+                    "metacritic",
+                    "rottenTomatoes")
+
+        if details_dict is not None:
+
+            # Create an "image_url" key, and set it to the url of the movie's poster
+            details = {"image_url": details_dict["image"]}
+
+            # Iterates through the tuple of movie information keys, and appends the corresponding
+            # item from the details_dict (if it exists, otherwise set it to "N/A")
+            for i in KEY_LIST:
+                details[i] = (details_dict[i] if details_dict[i] != None else "N/A")
+
+            self.metadata_cache.put(movie_id, details=details)
+
+        if ratings_dict is not None:
+            ratings = {}
+
+            # Iterates through the tuple of movie rating keys, and appends the corresponding
+            # item from the ratings_dict (if it exists, otherwise set it to "N/A")
+            for i in RATING_LIST:
+                ratings[i] = (ratings_dict[i] if ratings_dict[i] not in (None, "") else "N/A")
+
+            self.metadata_cache.put(movie_id, ratings=ratings)
+
+        # If anything new was requested, let the recommender learn about the movie
+        if details_dict is not None or ratings_dict is not None:
+            self.recommender.add([(movie_id, details["fullTitle"], "", details["image_url"],
+                                   details["genres"], ratings["imDb"])])
+
+        # Initialize the dictionary for storing key details, with an "id" key set to the
+        # movie's id, followed by the movie's details and ratings
+        key_details = {"id": movie_id}
+        key_details.update(details)
+        key_details.update(ratings)
+
+        # Return the dictionary with the relevant information
+        return key_details
+
+    # Method to start loading posters on the prefetch pool without waiting for them, so
+    # that they are already cached by the time they are needed. Returns the list of futures,
+    # so that the posters that haven't started yet can be cancelled if they aren't needed
+    def prefetch_posters(self, urls, dims):
+        return [self.prefetch_pool.submit(self.poster_image, url, dims, RequestScheduler.PREFETCH) for url in urls]
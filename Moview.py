@@ -2,17 +2,22 @@
 # Programmers : Sanchaai, Aqib, & Landry
 # Date        : 06/17/22
 # Description : Contains Moview class, which serves most of the primary
-#               functions for the Moview application. Note, "requests",
-#               "pillow", and "pyglet" must be pip installed!
+#               functions for the Moview application (drawing each screen,
+#               with the work behind them done by MovieService). Note,
+#               "requests", "pillow", and "pyglet" must be pip installed!
 
 from tkinter import messagebox # Used to notify user of certain events
 from tkinter import * # Used to create the primary GUI interface
-from PIL import Image,ImageTk # Used to load non-.gif/.ppm format images in Tkinter
-from io import BytesIO # Used to convert raw bytecode into BytesIO object for Pillow
-import pyglet # Used to load custom fonts for Tkinter
-import random # Used to shuffle the list of similar movies
-import requests # Used for making internet requests
-import warnings # Used to raise an error if images are too large
+from PIL import ImageTk # Used to load non-.gif/.ppm format images in Tkinter
+from MovieService import MovieService # Used for everything that doesn't involve the GUI
+from TaskRunner import TaskRunner # Used to run network requests without freezing the window
+from VirtualList import VirtualList # Used to draw long lists of movies one screenful at a time
+from RequestScheduler import QuotaExceeded # Used to tell the user when the daily quota has run out
+from Profiler import Profiler # Used to profile each screen change (when profiling is on)
+from AssetCache import AssetCache # Used to load the window's images already resized
+from StartupTimer import StartupTimer # Used to time how long the program takes to start
+from ImageRegistry import ImageRegistry # Used to keep the memory used by the window's images within a budget
+import os # Used to build the path of the resized images' directory
 import winsound # Used to play background music
 
 # Class for Moview Program
@@ -22,14 +27,42 @@ class Moview():
     TITLE_FONT = "LIBRARY3AM"
     BODY_FONT = "Gidole Regular"
 
-    # API key for IMDb-API
-    KEY = "k_zax1xbn5"
-
-    # Class initialization
-    def __init__(self, win):
+    # Number of screens' worth of network work that can run in the background at once
+    TASK_WORKERS = 4
+
+    # Number of movies a list needs before its posters are drawn as atlas pages (a few large
+    # images, each holding the posters of several rows) rather than one image per row, or
+    # None to always draw one image per row
+    ATLAS_THRESHOLD = 100
+
+    # Most memory (in bytes) the window's images can use before the images on screens
+    # that aren't showing are let go of
+    IMAGE_BUDGET = 32 * 1024 * 1024
+
+    # How long (in milliseconds) to wait after the last watchlist change before writing
+    # the changes to the database, so that several quick changes are written together
+    WRITE_DELAY = 2000
+
+    # Number of milliseconds the user has to stop typing for before a search is made, and
+    # the shortest query that is searched for as the user types
+    SEARCH_DELAY = 300
+    MIN_SEARCH_LENGTH = 2
+
+    # Methods that change to a screen, which are each profiled when profiling is on, and the
+    # methods that finish off a screen change (loading it in the background, or drawing it
+    # once it has loaded), which are profiled along with the screen change they belong to
+    PROFILED_SCREENS = ("start", "login", "pwd_field", "new_user", "create_pwd", "home",
+                        "display_watchlist", "search", "search_results", "movie_display")
+    PROFILED_STEPS = ("load_movie", "show_results", "show_movie")
+
+    # Class initialization, with the directory to save profiles to (or None to not profile),
+    # the timer started when the program started (if there is one), and the memory budget
+    # for the window's images (or None to use IMAGE_BUDGET)
+    def __init__(self, win, profile_dir=None, timer=None, image_budget=None):
         
-        # Set window variable
+        # Set window variable, and the timer for each step of startup
         self.win = win
+        self.timer = timer or StartupTimer()
 
         # Configure window title
         win.title("Moview")
@@ -44,73 +77,181 @@ class Moview():
         self.canvas = Canvas(self.win, width = 1000, height = 666, highlightthickness=0, bg="black")
         self.canvas.pack()
 
-        # Create frame used for search results
-        self.frame = Frame(self.canvas) # Used for search results
+        # Local PhotoImage initializations (background + left & right arrows), loaded from
+        # copies that have already been resized (with antialiasing), which are only made
+        # again when the original files change
+        assets = AssetCache(os.path.join(MovieService.CACHE_DIR, "assets"))
+        self.img = assets.photo("assets/background.jpg", (1000, 666))
+        self.left_arrow = assets.photo("assets/left.png", (35, 35))
+        self.right_arrow = assets.photo("assets/right.png", (35, 35))
+        self.timer.mark("assets")
 
-        # Local PhotoImage initializations (background + left & right arrows)
-        # Uses Pillow's/Tkinter's modules to open jpg/png files and resize them (with antialising)
-        self.img = ImageTk.PhotoImage(Image.open("assets/background.jpg").resize((1000, 666), Image.ANTIALIAS))
-        self.left_arrow = ImageTk.PhotoImage(Image.open("assets/left.png").resize((35, 35), Image.ANTIALIAS))
-        self.right_arrow = ImageTk.PhotoImage(Image.open("assets/right.png").resize((35, 35), Image.ANTIALIAS))
+        # Create the background image, which stays behind every screen
+        self.canvas.create_image(0, 0, anchor=NW, image=self.img)
 
-        # Use the Pyglet library to load locally stored fonts such that they can be used by Tkinter
-        pyglet.font.add_file("assets/Gidole-Regular.ttf")
-        pyglet.font.add_file("assets/library.ttf")
+        # Screens that have been built, as screen name -> list of the screen's widgets, and
+        # the name of the screen that is showing (None until the first screen is shown)
+        self.screens = {}
+        self.screen = None
+
+        # Create the service that does all of the searching, movie details, recommendations,
+        # and user/watchlist work (everything that isn't drawing the screens)
+        self.service = MovieService()
+
+        # Create the registry that keeps track of the memory used by every screen's images
+        self.image_registry = ImageRegistry(image_budget or self.IMAGE_BUDGET, self.service.metrics)
+        self.service.metrics.collect("ui_images", self.image_registry.stats, "screen")
+
+        # The logged-in user's watchlist (None while nobody is logged in), and the
+        # scheduled write of its changes to the database (None if nothing is scheduled)
+        self.watchlist = None
+        self.flush_job = None
+
+        # The search scheduled to run once the user stops typing (None if there isn't one)
+        self.search_job = None
+
+        # Futures of the posters being prefetched for the similar movies' pages either side
+        # of the one shown (cancelled once they aren't needed)
+        self.sim_prefetches = []
+
+        # Create the task runner used to load each screen's data in the background
+        self.tasks = TaskRunner(self.win, self.TASK_WORKERS)
+
+        # Create the profiler, and if profiling is on, replace each screen's methods with
+        # ones that profile them (buttons are given the replaced methods, since they are
+        # all created after this point)
+        self.profiler = Profiler(profile_dir)
+        if self.profiler.enabled:
+            for name in self.PROFILED_SCREENS:
+                setattr(self, name, self.profiler.screen(name, getattr(self, name)))
+            for name in self.PROFILED_STEPS:
+                setattr(self, name, self.profiler.step(getattr(self, name)))
+
+        # Stop the background threads when the window is closed
+        self.win.protocol("WM_DELETE_WINDOW", self.close)
+        self.timer.mark("setup")
+
+        # Call method to start the program, and record when the first screen has been drawn
+        # (Tkinter draws it once it is idle, just before this callback runs)
+        self.start()
+        self.timer.mark("first_screen")
+        self.win.after_idle(self.timer.mark, "first_paint")
 
-        # When using reading images from the internet using Pillow, the default behaviour is to display
-        # a warning message if an image is too large. In order to avoid this, we can use the warnings
-        # library (that comes with Python) to raise an error instead, so that it can be caught using a
-        # try-except block.
-        warnings.simplefilter('error', Image.DecompressionBombWarning)
+        # Load the custom fonts in the background, since loading them doesn't need to hold
+        # up the first screen
+        self.tasks.run(self.load_fonts, self.fonts_loaded, self.fonts_loaded, keep=True)
 
         # Uses the winsound library to play jazz music in the background (looped asynchronously)
         winsound.PlaySound("assets/JazzMusic.wav", winsound.SND_ASYNC | winsound.SND_LOOP)
 
-        # Call method to start the program
-        self.start()
-
-    # Method to delete all items on screen and restore the background image + frame
-    def clear_screen(self):
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor=NW, image=self.img)
-
-        self.frame.destroy()
-        self.frame = Frame(self.canvas)
+    # Method to load the locally stored fonts such that they can be used by Tkinter (runs in
+    # the background). Pyglet is imported here, since importing it is slow
+    def load_fonts(self):
+        import pyglet # Used to load custom fonts for Tkinter
 
-    # Function to get a PhotoImage from an online URL
-    def image_object(self, url, dims):
-
-        # Try and except used because sometimes images are too large,
-        # which raises an error due to security reasons
-        try:
-            # Requests image from the internet
-            poster_request = requests.get(url).content
+        pyglet.font.add_file("assets/Gidole-Regular.ttf")
+        pyglet.font.add_file("assets/library.ttf")
 
-            # Uses BytesIO to convert the received data into a BytesIO object,
-            # a form of data that can be opened by Pillow
-            bytes_poster = BytesIO(poster_request)
+    # Method called once the fonts have loaded (or failed to load), which finishes startup
+    def fonts_loaded(self, result):
+        self.timer.mark("fonts")
+        self.timer.report(self.service.metrics)
+
+        # Screens built before the fonts were ready use the fallback fonts, so they are
+        # built again (with the custom fonts) the next time they are shown. The start screen
+        # is normally showing by now, so if it is, it is built again straight away
+        for name in [name for name in self.screens if name != self.screen]:
+            self.forget_screen(name)
+
+        if self.screen == "start":
+            self.forget_screen("start")
+            self.screen = None
+            self.start()
+
+    # Method to change to a screen, building it with build() the first time it is shown.
+    # Each screen's items are kept once they are built and tagged with the screen's name,
+    # so changing screens only hides the old screen's items and shows the new one's
+    def show_screen(self, name, build):
+
+        # Any data still loading for the previous screen is no longer needed, and neither
+        # is a search waiting for the user to stop typing
+        self.tasks.cancel_all()
+        self.cancel_prefetches()
+        if self.search_job is not None:
+            self.win.after_cancel(self.search_job)
+            self.search_job = None
+
+        self.canvas.delete("loading")
+
+        if name not in self.screens:
+            self.screens[name] = []
+            build()
+
+        if self.screen is not None and self.screen != name:
+            self.canvas.itemconfigure(self.screen, state="hidden")
+        self.canvas.itemconfigure(name, state="normal")
+        self.screen = name
+
+        # Images on the screens that were hidden can now be let go of, if they use too much memory
+        self.image_registry.show(name)
+
+    # Method to place a widget on the canvas (using a tkinter window) as part of a screen,
+    # so that it is shown and hidden along with the rest of the screen. Any extra tags
+    # are added to the window as well
+    def place_widget(self, screen, x, y, widget, anchor=CENTER, tags=()):
+        self.screens[screen].append(widget)
+        self.canvas.create_window(x, y, anchor=anchor, window=widget, tags=(screen,) + tags)
+
+    # Method to delete a screen's items and widgets, so that it is built again the next
+    # time it is shown
+    def forget_screen(self, name):
+        self.canvas.delete(name)
+        for widget in self.screens.pop(name):
+            widget.destroy()
+        self.image_registry.remove_screen(name)
+
+    # Method to load a poster on the worker pool, and call done(image) with the
+    # resized image on the Tkinter thread once it is ready
+    def load_poster(self, url, dims, done):
+        return self.tasks.run(lambda: self.service.poster_image(url, dims), done, lambda error: None,
+                              self.service.poster_pool)
+
+    # Method to run work() in the background, and call done(result) on the Tkinter thread
+    # once it is finished (nothing is called if it fails)
+    def run_task(self, work, done):
+        return self.tasks.run(work, done, lambda error: None)
+
+    # Method to show that a screen's data is still loading
+    def show_loading(self):
+        self.canvas.create_text(500, 330, text="Loading...", anchor=CENTER,
+                                font=(self.BODY_FONT, 20), fill="white", tags="loading")
+
+    # Method called when a screen's data couldn't be loaded
+    def load_failed(self, error):
+        self.canvas.delete("loading")
+        if isinstance(error, QuotaExceeded):
+            messagebox.showinfo("Error", "Today's IMDb-API limit has been reached. Please try again tomorrow.")
+        else:
+            messagebox.showinfo("Error", "Could not load from IMDb-API. Please try again.")
 
-            # Uses Pillow's/Tkinter's modules to open the image (from BytesIO object format)
-            # and resize them (with antialising)
-            poster = ImageTk.PhotoImage(Image.open(bytes_poster).resize(dims, Image.ANTIALIAS))
-
-            # Return the image object
-            return poster
-        
-        # If the image is too large, repeat the above with the default placeholder image
-        except:
-            poster_request = requests.get("https://imdb-api.com/images/original/nopicture.jpg").content
-            bytes_poster = BytesIO(poster_request)
-            poster = ImageTk.PhotoImage(Image.open(bytes_poster).resize(dims, Image.ANTIALIAS))
-            return poster
+    # Method to stop everything running in the background and close the window
+    def close(self):
+        self.flush_watchlist()
+        self.tasks.shutdown()
+        self.service.close()
+        self.profiler.close()
+        self.win.destroy()
 
     # Method for creating start screen 
     def start(self):
-        self.clear_screen()
+        self.show_screen("start", self.build_start)
+
+    # Method to build the start screen's items (the first time it is shown)
+    def build_start(self):
 
         # Creates title text
         self.canvas.create_text(500, 290, text="MOVIEW", anchor=CENTER,
-                                font=(self.TITLE_FONT, 50), fill="white")
+                                font=(self.TITLE_FONT, 50), fill="white", tags="start")
 
         # Login button
         login_btn = Button(width=23, text="Login", font=(self.BODY_FONT, 20),
@@ -118,22 +259,29 @@ class Moview():
                     command=self.login)
 
         # Places login button on canvas using a tkinter window
-        self.canvas.create_window(500, 390, anchor=CENTER, window=login_btn)
+        self.place_widget("start", 500, 390, login_btn)
 
     # Method for creating login screen 
     def login(self):
-        self.clear_screen()
+        self.show_screen("login", self.build_login)
+
+        # Start with an empty username entry box
+        self.user_entry.delete(0, END)
+        self.user_entry.focus_set()
+
+    # Method to build the login screen's items (the first time it is shown)
+    def build_login(self):
 
         # Creates login heading text
         self.canvas.create_text(500, 220, text="LOGIN", anchor=CENTER,
-                                font=(self.TITLE_FONT, 30), fill="white")
+                                font=(self.TITLE_FONT, 30), fill="white", tags="login")
 
         # Username entry box
         self.user_entry = Entry(width=23, relief="ridge", bd=0, bg="#060606", fg="white",
                                 font=(self.BODY_FONT, 15), highlightbackground="grey", highlightthickness=1, insertbackground="white")
 
         # Places username entry on canvas using a tkinter window
-        self.canvas.create_window(500, 320, window=self.user_entry)
+        self.place_widget("login", 500, 320, self.user_entry)
 
         # Submit button
         submit_btn = Button(width=10, text="Submit", font=(self.BODY_FONT, 15),
@@ -141,47 +289,43 @@ class Moview():
                     command=self.user_valid)
 
         # Places submit button on canvas using a tkinter window
-        self.canvas.create_window(500, 410, anchor=CENTER, window=submit_btn)
+        self.place_widget("login", 500, 410, submit_btn)
 
     # Method to check if user is valid
     def user_valid(self):
-        
-        # Var to indicate the user has been found within list of users
-        found = False
 
         # Gets username from entry box
         self.uname = self.user_entry.get()
         
-        # Opens credentials file and searches for the user
-        with open("database/creds.txt", "r") as f:
-            while (found == False) and ((line := f.readline()) != ""):
-                line = line.strip().split("|")
-
-                # If the user does exist, save the correct password and
-                # prompt the user to enter a password
-                if line[0] == self.uname:
-                    found = True
-                    self.correct_pwd = line[1]
-                    self.pwd_field()
-
-        # If the entire list of users is searched to no avail, create new user
-        if found == False:
+        # If the user does exist, prompt the user to enter a password
+        if self.service.user_exists(self.uname):
+            self.pwd_field()
+
+        # If the user isn't in the database, create new user
+        else:
             self.new_user()
             
     # Method for creating password entry screen
     def pwd_field(self):
-        self.clear_screen()
+        self.show_screen("pwd_field", self.build_pwd_field)
+
+        # Start with an empty password entry box
+        self.pwd_entry.delete(0, END)
+        self.pwd_entry.focus_set()
+
+    # Method to build the password entry screen's items (the first time it is shown)
+    def build_pwd_field(self):
 
         # Creates password heading text
         self.canvas.create_text(500, 220, text="ENTER PASSWORD", anchor=CENTER,
-                                font=(self.TITLE_FONT, 30), fill="white")
+                                font=(self.TITLE_FONT, 30), fill="white", tags="pwd_field")
 
         # Password entry box
         self.pwd_entry = Entry(width=23, relief="ridge", bd=0, bg="#060606", fg="white", show="•",
                                 font=(self.BODY_FONT, 15), highlightbackground="grey", highlightthickness=1, insertbackground="white")
 
         # Places password entry on canvas using a tkinter window
-        self.canvas.create_window(500, 320, window=self.pwd_entry)
+        self.place_widget("pwd_field", 500, 320, self.pwd_entry)
 
         # Submit button
         submit_btn = Button(width=10, text="Submit", font=(self.BODY_FONT, 15),
@@ -189,7 +333,7 @@ class Moview():
                     command=self.pwd_valid)
 
         # Places submit button on canvas using a tkinter window
-        self.canvas.create_window(500, 410, anchor=CENTER, window=submit_btn)
+        self.place_widget("pwd_field", 500, 410, submit_btn)
 
     # Method to validate password
     def pwd_valid(self):
@@ -197,9 +341,9 @@ class Moview():
         # Gets password from entry box
         self.pwd = self.pwd_entry.get()
 
-        # If the password matches the correct password, take user to home screen
-        if self.pwd == self.correct_pwd:
-            self.home()
+        # If the password matches the correct password, start the user's session
+        if self.service.check_password(self.uname, self.pwd):
+            self.start_session()
         
         # Otherwise, display a message to show that the password was incorrect,
         # and take the user back to the login screen
@@ -209,40 +353,50 @@ class Moview():
 
     # Method for creating a user-creation screen
     def new_user(self):
-        self.clear_screen()
+        self.show_screen("new_user", self.build_new_user)
+
+    # Method to build the user-creation screen's items (the first time it is shown)
+    def build_new_user(self):
 
         # Creates text to explain the user isn't found, and prompts to create a new one
         self.canvas.create_text(500, 220, text="USER NOT FOUND", anchor=CENTER,
-                                font=(self.TITLE_FONT, 30), fill="white")
+                                font=(self.TITLE_FONT, 30), fill="white", tags="new_user")
 
         self.canvas.create_text(500, 320, text="Create new user?", anchor=CENTER,
-                                font=(self.BODY_FONT, 20), fill="white")
+                                font=(self.BODY_FONT, 20), fill="white", tags="new_user")
 
         # Yes and No buttons
         no_btn = Button(width=10, text="No", relief="ridge",
                     font=(self.BODY_FONT, 15), bg="#060606", fg="white",
                     command=self.login)
-        self.canvas.create_window(420, 410, anchor=CENTER, window=no_btn)
+        self.place_widget("new_user", 420, 410, no_btn)
 
         yes_btn = Button(width=10, text="Yes", relief="ridge",
                     font=(self.BODY_FONT, 15), bg="#060606", fg="white",
                     command=self.create_pwd)
-        self.canvas.create_window(580, 410, anchor=CENTER, window=yes_btn)
+        self.place_widget("new_user", 580, 410, yes_btn)
 
     # Method for creating a password-creation screen
     def create_pwd(self):
-        self.clear_screen()
+        self.show_screen("create_pwd", self.build_create_pwd)
+
+        # Start with an empty password entry box
+        self.new_pwd_entry.delete(0, END)
+        self.new_pwd_entry.focus_set()
+
+    # Method to build the password-creation screen's items (the first time it is shown)
+    def build_create_pwd(self):
 
         # Creates password heading text
         self.canvas.create_text(500, 220, text="CREATE PASSWORD", anchor=CENTER,
-                                font=(self.TITLE_FONT, 30), fill="white")
+                                font=(self.TITLE_FONT, 30), fill="white", tags="create_pwd")
 
         # Password entry box
-        self.pwd_entry = Entry(width=23, relief="ridge", bd=0, bg="#060606", fg="white", show="•",
+        self.new_pwd_entry = Entry(width=23, relief="ridge", bd=0, bg="#060606", fg="white", show="•",
                                 font=(self.BODY_FONT, 15), highlightbackground="grey", highlightthickness=1, insertbackground="white")
 
         # Places password entry on canvas using a tkinter window
-        self.canvas.create_window(500, 320, window=self.pwd_entry)
+        self.place_widget("create_pwd", 500, 320, self.new_pwd_entry)
 
         # Submit button
         submit_btn = Button(width=10, text="Submit", font=(self.BODY_FONT, 15),
@@ -250,316 +404,300 @@ class Moview():
                     command=self.create_user)
 
         # Places submit button on canvas using a tkinter window
-        self.canvas.create_window(500, 410, anchor=CENTER, window=submit_btn)
+        self.place_widget("create_pwd", 500, 410, submit_btn)
 
     # Method to create a new user within the text files
     def create_user(self):
 
-        # Append the new credentials to the "creds.txt" file, using "|" as a separator
-        with open("database/creds.txt", "a") as f:
-            f.write(f"{self.uname}|{self.pwd_entry.get()}\n")
-        
-        # Create a new file for the user's watchlist, and close it
-        new_user = open(f"database/{self.uname}.txt", "w")
-        new_user.close()
+        # Add the new credentials to the database (the user's watchlist starts off empty)
+        self.service.create_user(self.uname, self.new_pwd_entry.get())
+
+        # Start the new user's session
+        self.start_session()
+
+    # Method to start a user's session once they have logged in
+    def start_session(self):
+
+        # Load the user's watchlist into memory (this is the only time it is read from
+        # the database until the user logs in again)
+        self.watchlist = self.service.open_watchlist(self.uname)
 
         # Take user to the home screen
         self.home()
 
+    # Method to log the user out
+    def logout(self):
+
+        # Save any watchlist changes that haven't been written yet, and end the session
+        self.flush_watchlist()
+        self.watchlist = None
+
+        # Take user back to the start screen
+        self.start()
+
+    # Method to write the watchlist's changes to the database WRITE_DELAY milliseconds from now
+    # (if another change is made before then, the write is pushed back again)
+    def schedule_flush(self):
+        if self.flush_job is not None:
+            self.win.after_cancel(self.flush_job)
+
+        self.flush_job = self.win.after(self.WRITE_DELAY, self.flush_watchlist)
+
+    # Method to write the watchlist's changes to the database straight away
+    def flush_watchlist(self):
+        if self.flush_job is not None:
+            self.win.after_cancel(self.flush_job)
+            self.flush_job = None
+
+        if self.watchlist is not None:
+            with self.service.metrics.span("watchlist_flush"):
+                self.watchlist.flush()
+
     # Method for creating home screen
     def home(self):
-        self.clear_screen()
+        self.show_screen("home", self.build_home)
+
+    # Method to build the home screen's items (the first time it is shown)
+    def build_home(self):
 
         # Creates options heading text
         self.canvas.create_text(500, 200, text="WELCOME", anchor=CENTER,
-                                font=(self.TITLE_FONT, 30), fill="white")
+                                font=(self.TITLE_FONT, 30), fill="white", tags="home")
 
         # Button that lets the user search for movies
         search_btn = Button(width=23, text="Search", font=(self.BODY_FONT, 20),
                     relief="ridge", bg="#060606", fg="white",
                     command=self.search)
 
-        self.canvas.create_window(500,300, anchor=CENTER, window=search_btn)
+        self.place_widget("home", 500, 300, search_btn)
 
         # Button that lets the user see their watchlist
         watchlist_btn = Button(width=23, text="Watchlist", font=(self.BODY_FONT, 20),
                     relief="ridge", bg="#060606", fg="white",
                     command=self.display_watchlist)
 
-        self.canvas.create_window(500, 400, anchor=CENTER, window=watchlist_btn)
+        self.place_widget("home", 500, 400, watchlist_btn)
 
         # Button that lets the user logout
         logout_btn = Button(width=14, text="Logout", font=(self.BODY_FONT, 16),
                     relief="ridge", bg="#060606", fg="white",
-                    command=self.start)
-        self.canvas.create_window(800, 590, anchor=NW, window=logout_btn)
+                    command=self.logout)
+        self.place_widget("home", 800, 590, logout_btn, NW)
 
     # Method for getting the user's watchlist
     def get_list(self):
-        self.clear_screen()
 
-        # Empty array to store user's watchlist
-        user_list = []
-        
-        # Opens the user's text file and stores all of the lines in a list
-        with open(f"database/{self.uname}.txt", "r") as f:
-            user_list = f.readlines()
-
-        # For each item in the list, strip the newline character and split
-        # it into a list (by the "|" separator)
-        user_list = [i.strip().split("|") for i in user_list]
-
-        # Convert the final element in each movie's list (the poster url)
-        # into an actual image object using the self.image_object() method
-        for i in range(len(user_list)):
-            user_list[i][-1] = self.image_object(user_list[i][-1], (81, 123))
+        # Get the user's watchlist from memory, as a list with each movie's id,
+        # title, and poster url (the poster is only loaded once the movie is
+        # scrolled into view)
+        with self.service.metrics.span("get_list"):
+            user_list = self.watchlist.entries()
 
         # Return the user's watchlist
         return user_list
 
     # Method for creating the watchlist screen
     def display_watchlist(self):
+        with self.service.metrics.span("screen", screen="display_watchlist"):
+            self.show_screen("display_watchlist", self.build_watchlist)
+
+            # Fill the list with the movies in the user's watchlist (from the
+            # self.get_list() method)
+            self.watchlist_list.set_movies(self.get_list())
 
-        # Get the user's watchlist using the self.get_list() method
-        self.watchlist = self.get_list()
+    # Method to build the watchlist screen's items (the first time it is shown)
+    def build_watchlist(self):
 
         # Create watchlist heading text
         self.canvas.create_text(500, 130, text="Watchlist", anchor=CENTER,
-                                font=(self.TITLE_FONT, 30), fill="white")
+                                font=(self.TITLE_FONT, 30), fill="white", tags="display_watchlist")
 
-        # Place the frame used for displaying the list
-        self.frame.place(x=500, y=180, anchor=N)
+        # Button to return back to home
+        home_btn = Button(width=23, text="Back to Home", font=(self.BODY_FONT, 18),
+                    relief="ridge", bg="#060606", fg="white",
+                    command=self.home)
 
-        # Calculate the region of scroll required using the number of items in the list
-        region_height = 150*len(self.watchlist)
+        self.place_widget("display_watchlist", 500, 580, home_btn)
 
-        # Create a canvas to go within the aforementioned frame, and configure
-        # the dimensions of its scrollable region
-        self.frame_canvas = Canvas(self.frame,width=600, height=350, bg="#060606",
-                             scrollregion=(0,0,500,region_height),
-                             highlightthickness=0)
+        # Create the scrollable list of movies, where each row shows the movie's title
+        self.watchlist_list = self.list_canvas("display_watchlist", self.draw_watchlist_row)
 
-        # Make it so that the frame is actually scrollable (in the vertical axis),
-        # and pack the scrollbar
-        scrollable = Scrollbar(self.frame, orient="vertical",
-                                       command=self.frame_canvas.yview)
-        scrollable.pack(side="right",fill="y")
+    # Method to draw the title of a movie in the watchlist (the poster is drawn by the list itself)
+    def draw_watchlist_row(self, canvas, movie, y_pos, tags):
+        canvas.create_text(110, y_pos+35, anchor=NW, text=self.overflow(movie[1], 25), font=(self.BODY_FONT, 30), fill="white", tags=tags)
 
-        # Ensure that the canvas is also scrollable, and then pack the canvas
-        # such that it fills the frame's canvas
-        self.frame_canvas.configure(yscrollcommand=scrollable.set)
-        self.frame_canvas.pack(fill="both")
+    # Method to create the scrollable list used by the watchlist and search results screens,
+    # as part of the given screen. Returns the list, which starts off empty
+    def list_canvas(self, screen, draw_row):
 
-        # Starting y-position for the items to be displayed in the scrollable region
-        y_pos = 10
-        
-        # Iterate through the items in the watchlist
-        for i in self.watchlist:
-            
-            # Store the movie's id in the movie_tag variable
-            movie_tag = i[0]
+        # Create the frame used for displaying the list, and place it on the screen
+        frame = Frame(self.canvas)
+        self.place_widget(screen, 500, 180, frame, N, (f"{screen}_list",))
 
-            # Output the poster and movie title on the frame's canvas
-            self.frame_canvas.create_image(10, y_pos, anchor=NW, image=i[-1], tags=movie_tag)
-            self.frame_canvas.create_text(110, y_pos+35, anchor=NW, text=self.overflow(i[1], 25), font=(self.BODY_FONT, 30), fill="white", tags=movie_tag)
+        # Create a canvas to go within the aforementioned frame
+        frame_canvas = Canvas(frame, width=600, height=350, bg="#060606",
+                             highlightthickness=0)
 
-            # Binds everything with the same tag (of the current movie's id) to a lambda function (which calls the self.movie_display()
-            # method with the movie's id as the argument). Explanation of the lambda function logic below:
+        # Make it so that the frame is actually scrollable (in the vertical axis),
+        # and pack the scrollbar
+        scrollable = Scrollbar(frame, orient="vertical",
+                                       command=frame_canvas.yview)
+        scrollable.pack(side="right",fill="y")
 
-            # lambda: Lets you write functions inline
-            # event: When using lambdas in button commands, the first parameter is forcefully turned into one that
-            # stores button-press event information, so we dump that into its own variable, "event"
-            # movie_tag=movie_tag: Weird quirk with lambdas within loops, where they only end up using the final value in the
-            # loop as the parameter value. This is remedied by "cementing" the value in the movie_tag variable in its own
-            # parameter. Further reading can be found here: https://stackoverflow.com/a/13355291
-            self.frame_canvas.tag_bind(movie_tag, "<ButtonPress-1>", lambda event, movie_tag=movie_tag: self.movie_display(movie_tag))
+        # Pack the canvas such that it fills the frame's canvas
+        frame_canvas.pack(fill="both")
 
-            # Increase the y-position for the next item
-            y_pos += 150
+        # Create the virtualized list, which sets the scrollable region, connects the
+        # scrollbar, and only draws the rows that are in view (loading their posters
+        # as they appear). Each row's text is drawn by draw_row(canvas, movie, y_pos, tags),
+        # and clicking a row calls the self.movie_display() method with the movie's id
+        return VirtualList(frame_canvas, scrollable, [],
+                           lambda movie, y_pos, tags: draw_row(frame_canvas, movie, y_pos, tags),
+                           self.load_poster, self.movie_display, self.image_registry, screen,
+                           self.run_task, self.ATLAS_THRESHOLD)
 
-        self.frame_canvas.update() # Update the frame canvas with the new items.
-        
-        # Button to return back to home
-        home_btn = Button(width=23, text="Back to Home", font=(self.BODY_FONT, 18),
-                    relief="ridge", bg="#060606", fg="white",
-                    command=self.home)
+    # Method for creating search screen, where the results are shown under the search box
+    # as the user types
+    def search(self):
+        self.show_screen("search", self.build_search)
 
-        self.canvas.create_window(500,580, anchor=CENTER, window=home_btn)
+        # Start with an empty search box and no results
+        self.search_box.delete(0, END)
+        self.search_box.focus_set()
+        self.typed_query = ""
+        self.search_task = None
+        self.show_results("", [])
 
-    # Method for creating search screen
-    def search(self):
-        self.clear_screen()
+    # Method to build the search screen's items (the first time it is shown)
+    def build_search(self):
 
         # Create search heading text
-        self.canvas.create_text(500, 220, text="SEARCH", anchor=CENTER,
-                                font=(self.TITLE_FONT, 30), fill="white")
+        self.canvas.create_text(500, 70, text="SEARCH", anchor=CENTER,
+                                font=(self.TITLE_FONT, 30), fill="white", tags="search")
 
         # Searxh entry box
         self.search_box = Entry(width=23, relief="ridge", bd=0, bg="#060606", fg="white",
                                 font=(self.BODY_FONT, 15), highlightbackground="grey", highlightthickness=1, insertbackground="white")
 
-        # Places search entry on canvas using a tkinter window
-        self.canvas.create_window(500, 320, window=self.search_box)
+        # Places search entry on canvas using a tkinter window, searching whenever its text
+        # changes (or straight away when Enter is pressed)
+        self.place_widget("search", 440, 140, self.search_box)
+        self.search_box.bind("<KeyRelease>", self.query_changed)
+        self.search_box.bind("<Return>", lambda event: self.search_results())
 
         # Places submit button on canvas using a tkinter window
         submit_btn = Button(width=10, text="Submit", font=(self.BODY_FONT, 15),
                     relief="ridge", bg="#060606", fg="white",
                     command=self.search_results)
-        self.canvas.create_window(500, 410, anchor=CENTER, window=submit_btn)
+        self.place_widget("search", 680, 140, submit_btn)
 
-    # Method for displaying search results
-    def search_results(self):
+        # Button to return back to home
+        home_btn = Button(width=23, text="Back to Home", font=(self.BODY_FONT, 18),
+                    relief="ridge", bg="#060606", fg="white",
+                    command=self.home)
+        self.place_widget("search", 500, 580, home_btn)
 
-        # Get the search query from the search box
-        user_query = self.search_box.get()
+        # Create the scrollable list of results, where each row shows the movie's title
+        # and description
+        self.results_list = self.list_canvas("search", self.draw_result_row)
 
-        # If the query is empty, display an appropriate error message
-        if user_query == "":
-            messagebox.showinfo("Error","Search box is empty.")
-            self.search()
-        
-        # Otherwise (if there is a search query)
-        else:
-            self.clear_screen()
-
-            # Get the search results using the self.movie_search() method
-            self.results = self.movie_search(user_query)
-
-            # Create search results heading text
-            self.canvas.create_text(500, 130, text="SEARCH RESULTS", anchor=CENTER,
-                                    font=(self.TITLE_FONT, 30), fill="white")
-
-            # Place the frame used for displaying the list
-            self.frame.place(x=500, y=180, anchor=N)
-
-            # Calculate the region of scroll required using the number of results
-            region_height = 150*len(self.results)
-
-            # Create a canvas to go within the aforementioned frame, and configure
-            # the dimensions of its scrollable region
-            self.frame_canvas = Canvas(self.frame,width=600, height=350, bg="#060606",
-                                scrollregion=(0,0,500,region_height),
-                                highlightthickness=0)
-
-            # Make it so that the frame is actually scrollable (in the vertical axis),
-            # and pack the scrollbar
-            scrollable = Scrollbar(self.frame, orient="vertical",
-                                        command=self.frame_canvas.yview)
-            scrollable.pack(side="right",fill="y")
-
-            # Ensure that the canvas is also scrollable, and then pack the canvas
-            # such that it fills the frame's canvas
-            self.frame_canvas.configure(yscrollcommand=scrollable.set)
-            self.frame_canvas.pack(fill="both")
-    
-            # Starting y-position for the items to be displayed in the scrollable region
-            y_pos = 10
-
-            # Iterate through the results
-            for i in self.results:
-                
-                # Store the movie's id in the movie_tag variable
-                movie_tag = i[0]
-
-                # Output the poster, movie title, and description on the frame's canvas
-                self.frame_canvas.create_image(10, y_pos, anchor=NW, image=i[-1], tags=movie_tag)
-                self.frame_canvas.create_text(110, y_pos+5, anchor=NW, text=self.overflow(i[1], 25), font=(self.BODY_FONT, 30), fill="white", tags=movie_tag)
-                self.frame_canvas.create_text(110, y_pos+55, anchor=NW, text=i[2], font=(self.BODY_FONT, 15), fill="white", tags=movie_tag)
-
-                # Binds everything with the same tag (of the current movie's id) to a lambda function (which calls the self.movie_display()
-                # method with the movie's id as the argument). Explanation of the lambda function logic can be found in the comments of the
-                # self.display_watchlist() method:
-                self.frame_canvas.tag_bind(movie_tag, "<ButtonPress-1>", lambda event, movie_tag=movie_tag: self.movie_display(movie_tag))
-
-                # Increase the y-position for the next item
-                y_pos += 150
-
-            self.frame_canvas.update() # Update the frame canvas with the new items.
-            
-            # Button to go back to search screen again
-            back_btn = Button(width=23, text="Search Again", font=(self.BODY_FONT, 18),
-                        relief="ridge", bg="#060606", fg="white",
-                        command=self.search)
-            self.canvas.create_window(500,580, anchor=CENTER, window=back_btn)
+    # Method called whenever a key is released in the search box. Any cached results for the
+    # new query are shown straight away, and IMDb-API is only asked (if the cached results
+    # aren't complete) once the user has stopped typing for SEARCH_DELAY milliseconds
+    def query_changed(self, event):
+        query = self.search_box.get().strip()
 
-    # Method used to search for movies
-    def movie_search(self, query):
+        # Ignore keys that didn't change the query (like the arrow keys)
+        if query == self.typed_query:
+            return
+        self.typed_query = query
 
-        # List to store the search results
-        search_results = []
+        # The user is still typing, so the search that was waiting is pushed back
+        if self.search_job is not None:
+            self.win.after_cancel(self.search_job)
+            self.search_job = None
 
-        # Get the raw results using the API link and requests.get()
-        raw_results = requests.get(f"https://imdb-api.com/en/API/SearchMovie/{self.KEY}/{query}")
+        # Queries that are too short aren't searched for
+        if len(query) < self.MIN_SEARCH_LENGTH:
+            self.show_results(query, [])
+            return
 
-        # Since the data is in json format, turn it into a Python-useable dictionary
-        # and get the results item from this dictionary
-        results_dict = (raw_results.json())["results"]
+        results, complete = self.service.cached_search(query)
+        if results is not None:
+            self.show_results(query, results)
 
-        # Iterate through the results dictionary 
-        for result in results_dict:
-            
-            # Create a list with the movie's id, title, description, and an image object
-            # of the poster
-            movie_info = [result["id"], result["title"], result["description"],
-                        self.image_object((result["image"]), (81, 123))]
-            
-            # Append this list to the search results list
-            search_results.append(movie_info)
+        if not complete:
+            self.search_job = self.win.after(self.SEARCH_DELAY, self.search_results)
 
-        # Return the search results list
-        return search_results
+    # Method for searching for the query in the search box
+    def search_results(self):
+        if self.search_job is not None:
+            self.win.after_cancel(self.search_job)
+            self.search_job = None
 
-    # Method used to search for movies that match a certain genre
-    def similar_movies(self, tags, avoid):
+        # Get the search query from the search box
+        user_query = self.search_box.get().strip()
 
-        # List to store the similar movies
-        similars_results = []
-    
-        # Get the raw results using the API link and requests.get()
-        raw_similars = requests.get(f"https://imdb-api.com/API/AdvancedSearch/{self.KEY}/?genres={tags}")
+        # If the query is empty, display an appropriate error message
+        if user_query == "":
+            messagebox.showinfo("Error","Search box is empty.")
         
-        # Since the data is in json format, turn it into a Python-useable dictionary
-        # and get the results item from this dictionary
-        similars_dict = raw_similars.json()["results"]
-
-        # Iterate through the results dictionary
-        for result in similars_dict:
-
-            # As long as the movie is not the original movie provided (we wouldn't want to
-            # recommend a movie that is the exact same as the one being viewed by the user)
-            if result["id"] != avoid:
-
-                # Create a list with the movie's id, title, description, and an image object
-                # of the poster
-                similars_info = [result["id"], result["title"], result["description"],
-                                self.image_object((result["image"]), (81, 123))]
-
-                # Append this list to the search results list
-                similars_results.append(similars_info)
-
-        # Shuffle the list of similar movies using random.shuffle()
-        random.shuffle(similars_results)
-
-        # Return the list of similar movies
-        return similars_results
+        # Otherwise (if there is a search query)
+        else:
+            with self.service.metrics.span("screen", screen="search_results"):
+
+                # The search for the previous query is no longer needed (if it has already
+                # started, its results are ignored once they arrive)
+                if self.search_task is not None:
+                    self.search_task.cancel()
+
+                # Show that the results are loading, unless there are already results showing
+                if not self.results_list.movies:
+                    self.show_loading()
+
+                # Get the search results in the background using the service's movie_search() method,
+                # and show them with the self.show_results() method once they have loaded
+                self.search_task = self.tasks.run(lambda: self.service.movie_search(user_query),
+                                                  lambda results: self.show_results(user_query, results),
+                                                  lambda error: self.search_failed(user_query, error))
+
+    # Method for showing the results of a search (once they have loaded, or straight away if
+    # they were cached), unless the query in the search box has changed since
+    def show_results(self, query, results):
+        if query != self.search_box.get().strip():
+            return
+
+        with self.service.metrics.span("render", screen="search_results"):
+            self.canvas.delete("loading")
+
+            # Replace the movies in the list of results, where each row shows the movie's
+            # title and description (titles show up straight away, and posters as they
+            # load). The list is hidden while there is nothing in it, so that it doesn't
+            # cover up the loading text
+            self.results = results
+            self.results_list.set_movies(self.results)
+            self.canvas.itemconfigure("search_list", state="normal" if self.results else "hidden")
+
+    # Method called when a search couldn't be loaded (only reported if it is still the
+    # query in the search box)
+    def search_failed(self, query, error):
+        if query == self.search_box.get().strip():
+            self.load_failed(error)
+
+    # Method to draw the title and description of a search result (the poster is drawn by the list itself)
+    def draw_result_row(self, canvas, movie, y_pos, tags):
+        canvas.create_text(110, y_pos+5, anchor=NW, text=self.overflow(movie[1], 25), font=(self.BODY_FONT, 30), fill="white", tags=tags)
+        canvas.create_text(110, y_pos+55, anchor=NW, text=movie[2], font=(self.BODY_FONT, 15), fill="white", tags=tags)
 
     # Method to cycle the list of similar movies to the right
     # (clicking the button also gives the method information
     # about the button-click event, hence the second parameter)
     def cycle_right(self, event):
 
-        # Delete the similar movies currently on screen
-        self.canvas.delete("sim")
-
-        # Increase the starting point of the range of movies to
-        # be displayed by 5
-        self.sim_range += 5
-
-        # If the index of the last movie that will be displayed
-        # (starting index + 5) is out of range (larger than the
-        # number of similar movies), reset the starting point to 0
-        if (self.sim_range + 5) > len(self.similars):
-            self.sim_range = 0
+        # Move the starting point of the range of movies to be displayed
+        # to the next page of 5, wrapping around to the first page after
+        # the last one (which may hold fewer than 5 movies)
+        self.sim_range = (self.sim_range + 5) % self.similar_pages_length()
 
         # Use the self.display_similars() method to update the
         # display of similar movies on-screen
@@ -570,40 +708,86 @@ class Moview():
     # about the button-click event, hence the second parameter)
     def cycle_left(self, event):
 
-        # Delete the similar movies currently on screen
-        self.canvas.delete("sim")
-
-        # Decrease the starting point of the range of movies to
-        # be displayed by 5
-        self.sim_range -= 5
-
-        # If the starting point is out of range (less than an index
-        # of 0) set the starting point to be 6 fewer than the length
-        # of the list (such that the movies to be displayed are from
+        # Move the starting point of the range of movies to be displayed
+        # to the previous page of 5, wrapping around from the first page
+        # to the last one (such that the movies to be displayed are from
         # the end of the list)
-        if (self.sim_range) < 0:
-            self.sim_range = len(self.similars) - 6
+        self.sim_range = (self.sim_range - 5) % self.similar_pages_length()
 
         # Use the self.display_similars() method to update the
         # display of similar movies on-screen
         self.display_similars()
 
+    # Method to get the number of similar movies rounded up to a whole number of
+    # pages of 5 (so that the starting point of each page is a multiple of 5). This
+    # is never 0, so that cycling through an empty list doesn't divide by zero
+    def similar_pages_length(self):
+        return max(5, -(-len(self.similars) // 5) * 5)
+
     # Method for updating the display of similar movies on-screen
     def display_similars(self):
 
-        # Iterates through 5 similar movies in the range starting
-        # at the point specified by the sim_range variable
-        for i in range(self.sim_range, (self.sim_range+5)):
-
-            # Store the movie's id in the movie_tag variable
-            movie_tag = self.similars[i][0]
-
-            # Output the movie's poster on the canvas
-            self.canvas.create_image((150+((i%5)*160)), 420, anchor=NW, image=self.similars[i][-1], tags=("sim", movie_tag))
-            
-            # Binds the poster with the tag of the current movie's id to a lambda function (which calls the self.movie_display()
-            # method with the movie's id as the argument). Explanation of the lambda function logic below:
-            self.canvas.tag_bind(movie_tag, "<ButtonPress-1>", lambda event, movie_tag=movie_tag: self.movie_display(movie_tag))
+        # Stop loading the posters of the page that was shown before, and let go of its images
+        for task in self.sim_tasks:
+            task.cancel()
+        self.cancel_prefetches()
+        for slot in self.sim_images:
+            self.image_registry.remove("movie_display", ("sim", slot))
+        self.sim_tasks = []
+        self.sim_items = {}
+        self.sim_images = {}
+
+        # Shows (up to) 5 similar movies in the range starting at the point specified by
+        # the sim_range variable, one in each of the 5 poster slots
+        for slot in range(5):
+            i = self.sim_range + slot
+
+            # Empty the slot (until its poster loads, or for good if the page has fewer movies)
+            self.canvas.itemconfigure(f"sim{slot}", image="")
+            if i >= len(self.similars):
+                continue
+
+            self.sim_items[slot] = i
+
+            # Load the poster in the background, and show it with the self.similar_loaded() method
+            self.sim_tasks.append(self.load_poster(self.similars[i][-1], (81, 123),
+                                                   lambda image, slot=slot, i=i: self.similar_loaded(slot, i, image)))
+
+        # Start loading the posters of the pages either side of this one, so that
+        # they are already cached when the arrows are clicked
+        for start in (self.sim_range - 5, self.sim_range + 5):
+            start %= self.similar_pages_length()
+            self.sim_prefetches += self.service.prefetch_posters([movie[-1] for movie in self.similars[start:start+5]],
+                                                                 (81, 123))
+
+    # Method to cancel the prefetched posters that haven't started loading yet
+    def cancel_prefetches(self):
+        for future in self.sim_prefetches:
+            future.cancel()
+        self.sim_prefetches = []
+
+    # Method called (on the Tkinter thread) when a similar movie's poster has loaded
+    def similar_loaded(self, slot, i, image):
+
+        # Ignore posters for pages that are no longer shown
+        if self.sim_items.get(slot) == i:
+            self.sim_images[slot] = ImageTk.PhotoImage(image)
+            self.canvas.itemconfigure(f"sim{slot}", image=self.sim_images[slot])
+            self.image_registry.add("movie_display", ("sim", slot), self.sim_images[slot],
+                                    lambda: self.release_similar(slot))
+
+    # Method called by the image registry to let go of a similar movie's poster (the
+    # details screen loads its posters again whenever it is shown)
+    def release_similar(self, slot):
+        self.sim_images.pop(slot, None)
+        self.canvas.itemconfigure(f"sim{slot}", image="")
+
+    # Method called when one of the similar movie poster slots is clicked, which shows the
+    # details of the movie in it (if there is one)
+    def similar_clicked(self, slot):
+        i = self.sim_items.get(slot)
+        if i is not None:
+            self.movie_display(self.similars[i][0])
 
     # Method to trim long text and add "..." if required
     def overflow(self, text, space):
@@ -615,180 +799,156 @@ class Moview():
 
     # Method to display details about the movie
     def movie_display(self, movie_id):
-        self.clear_screen()
-        
-        # Get information about the movie using the self.movie_details() method
-        self.movie_info = self.movie_details(movie_id)
-
-        # Obtain the movies genres, and remove spacing between genres (so that the
-        # string can be used in a url)
-        genres = self.movie_info["genres"]
-        genres = (''.join(genres.split()))
+        with self.service.metrics.span("screen", screen="movie_display"):
+            self.show_screen("movie_display", self.build_movie_display)
 
-        # Get similar movies using the self.similar_movies() method
-        self.similars = self.similar_movies(genres, movie_id)
+            # Hide the previous movie's details (the button to return back to the home screen
+            # stays, so that the user can leave while the movie is still loading)
+            self.canvas.itemconfigure("movie_info", state="hidden")
 
-        # Set the similar movies range to start at an index of 0
-        self.sim_range = 0
-
-        # Create the poster image
-        self.canvas.create_image(50, 50, anchor=NW, image=self.movie_info["image"])
-
-        # Create text with the movie's title
-        self.canvas.create_text(200, 50, anchor=NW, text=self.overflow(self.movie_info["fullTitle"], 30),
-                                font=(self.BODY_FONT, 30), fill="white")
-
-        # Create text with the movie's runtime
-        self.canvas.create_text(200, 105, anchor=NW, text=f'Runtime: {(self.movie_info["runtimeStr"])}',
-                                font=(self.BODY_FONT, 15), fill="white")
+            # Get the movie's information in the background using the self.load_movie() method,
+            # and show it with the self.show_movie() method once it has loaded
+            self.show_loading()
+            self.tasks.run(lambda: self.load_movie(movie_id), self.show_movie, self.load_failed)
 
-        # Create text with the movie's genres
-        self.canvas.create_text(200, 135, anchor=NW, text=f'Genres: {(self.movie_info["genres"])}',
-                                font=(self.BODY_FONT, 15), fill="white")
+    # Method to build the movie details screen's items (the first time it is shown). The
+    # items showing the movie's details are tagged with "movie_info", and filled in by the
+    # self.draw_movie() method
+    def build_movie_display(self):
+        info = ("movie_display", "movie_info")
 
-        # Create text with the movie's IMDb rating
-        self.canvas.create_text(750, 50, anchor=NW, text=f'IMDb: {(self.movie_info["imDb"])}',
-                                font=(self.BODY_FONT, 15), fill="white")
-        
-        # Create text with the movie's Metacritic rating
-        self.canvas.create_text(750, 80, anchor=NW, text=f'Metacritic: {(self.movie_info["metacritic"])}',
-                                font=(self.BODY_FONT, 15), fill="white")
+        # Create a button to return back to the home screen
+        go_home = Button(width=14, text="Back to Home", font=(self.BODY_FONT, 16),
+                    relief="ridge", bg="#060606", fg="white",
+                    command=self.home)
+        self.place_widget("movie_display", 800, 590, go_home, NW)
 
-        # Create text with the movie's Rotten Tomatoes rating
-        self.canvas.create_text(750, 110, anchor=NW, text=f'Rot. Tomatoes: {(self.movie_info["rottenTomatoes"])}',
-                                font=(self.BODY_FONT, 15), fill="white")
+        # Create the poster image (empty until a movie is shown)
+        self.canvas.create_image(50, 50, anchor=NW, tags=info + ("movie_poster",))
 
-        # Create text with the movie's content rating
-        self.canvas.create_text(750, 140, anchor=NW, text=f'Content Rating: {(self.movie_info["contentRating"])}',
-                                font=(self.BODY_FONT, 15), fill="white")
+        # Create text for the movie's title, runtime, genres, and ratings
+        self.canvas.create_text(200, 50, anchor=NW, font=(self.BODY_FONT, 30), fill="white", tags=info + ("movie_title",))
+        self.canvas.create_text(200, 105, anchor=NW, font=(self.BODY_FONT, 15), fill="white", tags=info + ("movie_runtime",))
+        self.canvas.create_text(200, 135, anchor=NW, font=(self.BODY_FONT, 15), fill="white", tags=info + ("movie_genres",))
+        self.canvas.create_text(750, 50, anchor=NW, font=(self.BODY_FONT, 15), fill="white", tags=info + ("movie_imdb",))
+        self.canvas.create_text(750, 80, anchor=NW, font=(self.BODY_FONT, 15), fill="white", tags=info + ("movie_metacritic",))
+        self.canvas.create_text(750, 110, anchor=NW, font=(self.BODY_FONT, 15), fill="white", tags=info + ("movie_tomatoes",))
+        self.canvas.create_text(750, 140, anchor=NW, font=(self.BODY_FONT, 15), fill="white", tags=info + ("movie_content",))
 
-        # Create text with the movie's plot
-        self.canvas.create_text(60, 250, anchor=NW, text=f'Plot: {self.overflow(self.movie_info["plot"], 280)}',
-                                font=(self.BODY_FONT, 15), fill="white", width=900)
+        # Create text for the movie's plot
+        self.canvas.create_text(60, 250, anchor=NW, font=(self.BODY_FONT, 15), fill="white", width=900, tags=info + ("movie_plot",))
 
         # Create heading text for the movie recommendation 
         self.canvas.create_text(60, 350, anchor=NW, text="Recommendations",
-                                font=(self.BODY_FONT, 20), fill="white")
+                                font=(self.BODY_FONT, 20), fill="white", tags=info)
+
+        # Create the 5 poster slots for similar movies (empty until their posters load),
+        # where clicking a slot shows the details of the movie in it
+        for slot in range(5):
+            self.canvas.create_image(150+(slot*160), 420, anchor=NW, tags=info + ("sim", f"sim{slot}"))
+            self.canvas.tag_bind(f"sim{slot}", "<ButtonPress-1>", lambda event, slot=slot: self.similar_clicked(slot))
 
         # Create left & right arrows to cycle through similar movies, and bind them to 
         # their respective methods
-        self.canvas.create_image(910, 470, anchor=NW, image=self.right_arrow, tags="right")
+        self.canvas.create_image(910, 470, anchor=NW, image=self.right_arrow, tags=info + ("right",))
         self.canvas.tag_bind("right", "<ButtonPress-1>", self.cycle_right)
 
-        self.canvas.create_image(80, 470, anchor=NW, image=self.left_arrow, tags="left")
+        self.canvas.create_image(80, 470, anchor=NW, image=self.left_arrow, tags=info + ("left",))
         self.canvas.tag_bind("left", "<ButtonPress-1>", self.cycle_left)
 
         # Create a button that allows the user to add/remove the current movie to/from
         # their watchlist
-        add_rem = Button(width=20, text="Watchlist: Add/Remove", font=(self.BODY_FONT, 12),
+        self.add_rem = Button(width=20, font=(self.BODY_FONT, 12),
                     relief="ridge", bg="#060606", fg="white",
                     command=self.modify_list)
-        self.canvas.create_window(200, 180, anchor=NW, window=add_rem)
+        self.place_widget("movie_display", 200, 180, self.add_rem, NW, ("movie_info",))
 
-        # Use the self.display_similars() display the similar movies on-screen
-        self.display_similars()
+        # No movie has been shown yet
+        self.sim_tasks = []
+        self.sim_items = {}
+        self.sim_images = {}
 
-        # Create a button to return back to the home screen
-        go_home = Button(width=14, text="Back to Home", font=(self.BODY_FONT, 16),
-                    relief="ridge", bg="#060606", fg="white",
-                    command=self.home)
-        self.canvas.create_window(800, 590, anchor=NW, window=go_home)
+    # Method for getting a movie's information and similar movies (runs in the background)
+    def load_movie(self, movie_id):
 
-    # Method to obtain the details for a movie
-    def movie_details(self, movie_id):
+        # Get information about the movie using the service's movie_details() method
+        movie_info = self.service.movie_details(movie_id)
 
-        # Tuple of all the relevant keys needed for movie information
-        KEY_LIST = ("fullTitle",
-                    "genres",
-                    "runtimeStr",
-                    "plot",
-                    "contentRating")
+        # Create an "image" key, and set it to a resized image that comes from the url of the poster
+        movie_info["image"] = self.service.poster_image(movie_info["image_url"], self.service.POSTER_SIZES[1])
 
-        # Tuple of all the relevant keys needed for rating information
-        RATING_LIST = ("imDb",
-                    "metacritic",
-                    "rottenTomatoes")
+        # Get similar movies to the movie's genres using the service's similar_movies() method
+        similars = self.service.similar_movies(movie_info["genres"], movie_id)
 
-        # Get the raw results using the API link and requests.get()
-        raw_details = requests.get(f"https://imdb-api.com/en/API/Title/{self.KEY}/{movie_id}")
-        
-        # Since the data is in json format, turn it into a Python-useable dictionary
-        details_dict = raw_details.json()
-        
-        # Initialize the dictionary for storing key details
-        key_details = {}
+        return movie_info, similars
 
-        # Create an "id" key, and set it to the movie's id
-        key_details["id"] = movie_id
+    # Method for showing a movie's details once they have loaded
+    def show_movie(self, movie):
+        with self.service.metrics.span("render", screen="movie_display"):
+            self.draw_movie(movie)
 
-        # Get the raw ratings using the API link and requests.get()
-        raw_ratings = requests.get(f"https://imdb-api.com/API/Ratings/{self.KEY}/{movie_id}")
-        
-        # Since the data is in json format, turn it into a Python-useable dictionary
-        ratings_dict = raw_ratings.json()
+    # Method for filling in the movie details screen with a movie's details
+    def draw_movie(self, movie):
+        self.canvas.delete("loading")
+
+        # Store the movie's information and similar movies, turning the movie's poster into an image object
+        self.movie_info, self.similars = movie
+        self.movie_info["image"] = ImageTk.PhotoImage(self.movie_info["image"])
 
-        # Create an "image_url" key, and set it to the url of the movie's poster
-        key_details["image_url"] = details_dict["image"]
+        # Set the similar movies range to start at an index of 0
+        self.sim_range = 0
 
-        # Create an "image" key, and set it to an image object that comes from the url of the poster
-        key_details["image"] = self.image_object((key_details["image_url"]), (122, 185))
+        # Show the poster image
+        self.canvas.itemconfigure("movie_poster", image=self.movie_info["image"])
+        self.image_registry.add("movie_display", "poster", self.movie_info["image"], self.release_poster)
 
-        # Iterates through the tuple of movie information keys, and appends the corresponding
-        # item from the details_dict (if it exists, otherwise set it to "N/A")
-        for i in KEY_LIST:
-            key_details[i] = (details_dict[i] if details_dict[i] != None else "N/A")
+        # Show the movie's title, runtime, genres, and ratings
+        self.canvas.itemconfigure("movie_title", text=self.overflow(self.movie_info["fullTitle"], 30))
+        self.canvas.itemconfigure("movie_runtime", text=f'Runtime: {(self.movie_info["runtimeStr"])}')
+        self.canvas.itemconfigure("movie_genres", text=f'Genres: {(self.movie_info["genres"])}')
+        self.canvas.itemconfigure("movie_imdb", text=f'IMDb: {(self.movie_info["imDb"])}')
+        self.canvas.itemconfigure("movie_metacritic", text=f'Metacritic: {(self.movie_info["metacritic"])}')
+        self.canvas.itemconfigure("movie_tomatoes", text=f'Rot. Tomatoes: {(self.movie_info["rottenTomatoes"])}')
+        self.canvas.itemconfigure("movie_content", text=f'Content Rating: {(self.movie_info["contentRating"])}')
+
+        # Show the movie's plot
+        self.canvas.itemconfigure("movie_plot", text=f'Plot: {self.overflow(self.movie_info["plot"], 280)}')
+
+        # Show whether clicking the watchlist button will add or remove the movie
+        self.add_rem.configure(text=self.list_button_text())
+
+        # Use the self.display_similars() display the similar movies on-screen, then show
+        # all of the movie's details
+        self.display_similars()
+        self.canvas.itemconfigure("movie_info", state="normal")
 
-        # Iterates through the tuple of movie rating keys, and appends the corresponding
-        # item from the ratings_dict (if it exists, otherwise set it to "N/A")
-        for i in RATING_LIST:
-            key_details[i] = (ratings_dict[i] if ratings_dict[i] not in (None, "") else "N/A")
+    # Method called by the image registry to let go of the movie's poster (the details
+    # screen loads the poster again whenever it is shown)
+    def release_poster(self):
+        self.movie_info["image"] = None
+        self.canvas.itemconfigure("movie_poster", image="")
+
+    # Method to get the text of the watchlist button, depending on whether the
+    # current movie is already in the user's watchlist
+    def list_button_text(self):
+        return "Watchlist: Remove" if self.movie_info["id"] in self.watchlist else "Watchlist: Add"
 
-        # Return the dictionary with the relevant information
-        return key_details
-    
     # Method to modify the user's watchlist
     def modify_list(self):
 
-        # Variable to indicate if the movie was found within the list
-        in_list = False
-        
-        # Create a string with information about the current movie to be added/removed
-        current_movie = f'{self.movie_info["id"]}|{self.movie_info["fullTitle"]}|{self.movie_info["image_url"]}'
-
-        # Opens the user's text file and stores all of the lines in a list
-        with open(f"database/{self.uname}.txt", "r") as f:
-            user_list = f.readlines()
-
-        # Opens the user's text file in write mode
-        with open(f"database/{self.uname}.txt", "w") as f:
-
-            # Iterate through the user's watchlist
-            for i in user_list:
-                
-                # Check if the movie (with the newline character stripped) is the same
-                # as the one that needs to be added/removed
-                if i.strip() == current_movie:
-
-                    # If its the same, then change the in_list variable to True to
-                    # indicate that the movie has been found (and do not write it to
-                    # the file, since it needs to be removed)
-                    in_list = True
-
-                # Otherwise, write the movie back into the file
-                else:
-                    f.write(i)
-            
-            # If the movie to be added/removed was not found in the list,
-            # that means it needs to be added to the list
-            if not in_list:
-                
-                # Write the current movie to the file with a newline character
-                f.write(current_movie+"\n")
-
-                # Display a message to show that the movie has been added to the list
-                messagebox.showinfo("List Modified","Added to list.")
-            
-            # Otherwise, if the movie was found in the list (and hence got removed),
-            # display a message to show that the movie has been removed from the list
-            else:
-                messagebox.showinfo("List Modified","Removed from list.")
+        with self.service.metrics.span("modify_list"):
+
+            # Add the current movie to the user's watchlist if it isn't in it, or remove
+            # it if it is (this only changes the watchlist in memory)
+            added = self.watchlist.toggle(self.movie_info["id"], self.movie_info["fullTitle"], self.movie_info["image_url"])
+
+            # Update the button to show the movie's new state, and write the change to
+            # the database once no more changes have been made for a little while
+            self.add_rem.configure(text=self.list_button_text())
+            self.schedule_flush()
+
+        # Display a message to show whether the movie has been added to or removed from the list
+        if added:
+            messagebox.showinfo("List Modified","Added to list.")
+        else:
+            messagebox.showinfo("List Modified","Removed from list.")
@@ -0,0 +1,145 @@
+# Name        : PosterCache class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains PosterCache class, which keeps the raw bytes of
+#               downloaded posters on disk (keyed by their URL) so that a
+#               poster only ever has to be downloaded once, even across
+#               restarts of the program.
+
+from AtomicWrite import atomic_write # Used to write cache files atomically
+from collections import OrderedDict # Used to keep the cached files in least-recently-used order
+import hashlib # Used to turn poster URLs into file names
+import os # Used to work with the cache directory and its files
+import threading # Used to make the cache safe to use from the poster worker threads
+
+# Class for the on-disk poster cache
+class PosterCache():
+
+    # Extension used for finished cache files (anything else in the directory,
+    # like a half-written temporary file, is left over from a crash)
+    EXTENSION = ".img"
+
+    # Class initialization
+    def __init__(self, directory, max_bytes):
+
+        # Set the cache directory and the maximum total size of the cache (in bytes)
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+        # Counters used to measure how well the cache is working
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Lock used so that the worker threads don't modify the cache at the same time
+        self.lock = threading.Lock()
+
+        # Dictionary of file name -> file size, ordered from least to most recently used,
+        # along with the total size of every file in the cache
+        self.files = OrderedDict()
+        self.total_bytes = 0
+
+        # Create the cache directory if it doesn't exist yet
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Rebuild the index from the files already on disk. The modification time of
+        # each file is updated whenever it is used, so sorting by it gives back the
+        # least-recently-used order from the last time the program was run
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+
+            # Remove temporary files left behind by writes that never finished
+            if not name.endswith(self.EXTENSION):
+                os.remove(path)
+                continue
+
+            stats = os.stat(path)
+            entries.append((stats.st_mtime, name, stats.st_size))
+
+        for mtime, name, size in sorted(entries):
+            self.files[name] = size
+            self.total_bytes += size
+
+        # In case the maximum size was lowered since the last run
+        with self.lock:
+            self.evict()
+
+    # Method to get the file name used for a URL
+    def file_name(self, url):
+        return hashlib.sha1(url.encode("utf-8")).hexdigest() + self.EXTENSION
+
+    # Method to check whether a URL is cached (used with "in")
+    def __contains__(self, url):
+        with self.lock:
+            return self.file_name(url) in self.files
+
+    # Method to get the cached bytes for a URL (or None if it isn't cached)
+    def get(self, url):
+        name = self.file_name(url)
+        path = os.path.join(self.directory, name)
+
+        with self.lock:
+            if name in self.files:
+                try:
+                    with open(path, "rb") as f:
+                        data = f.read()
+
+                    # Mark the file as the most recently used one, both in memory
+                    # and on disk (so that the order survives a restart)
+                    self.files.move_to_end(name)
+                    os.utime(path)
+
+                    self.hits += 1
+                    return data
+
+                # If the file was removed from outside the program, forget about it
+                except OSError:
+                    self.total_bytes -= self.files.pop(name)
+
+            self.misses += 1
+            return None
+
+    # Method to store the bytes for a URL in the cache
+    def put(self, url, data):
+        name = self.file_name(url)
+
+        # Don't bother storing anything that could never fit in the cache
+        if len(data) > self.max_bytes:
+            return
+
+        # Write the data atomically, so a crash can never leave a half-written poster behind
+        with atomic_write(os.path.join(self.directory, name), "wb") as f:
+            f.write(data)
+
+        with self.lock:
+            # If the URL was already cached, replace its old size with the new one
+            if name in self.files:
+                self.total_bytes -= self.files.pop(name)
+
+            self.files[name] = len(data)
+            self.total_bytes += len(data)
+            self.evict()
+
+    # Method to remove the least recently used files until the cache fits within
+    # its maximum size (the lock must be held when calling this)
+    def evict(self):
+        while self.total_bytes > self.max_bytes and self.files:
+            name, size = self.files.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    # Method to get the cache's counters, which can be used to pick a good maximum size
+    def stats(self):
+        with self.lock:
+            return {"hits": self.hits,
+                    "misses": self.misses,
+                    "evictions": self.evictions,
+                    "entries": len(self.files),
+                    "bytes": self.total_bytes,
+                    "max_bytes": self.max_bytes}
@@ -0,0 +1,115 @@
+# Name        : Prefetcher class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains Prefetcher class, which fills the caches with
+#               everything needed to view the movies in users' watchlists
+#               without an internet connection: each movie's poster,
+#               details, ratings, and recommendations (and the posters of
+#               the first recommendations). It remembers which movies are
+#               done, so that a run that was stopped can carry on later.
+
+from AtomicWrite import atomic_write # Used to save the files safely
+from concurrent.futures import ThreadPoolExecutor, as_completed # Used to prefetch several movies at once
+from RequestScheduler import RequestScheduler # Used to send every request as a prefetch
+import json # Used to save the progress and the report
+import os # Used to check whether an earlier run left its progress behind
+import time # Used to time the run
+
+# Class for prefetching users' watchlists
+class Prefetcher():
+
+    # Class initialization, with the service whose caches are filled, the number of movies
+    # prefetched at the same time, the number of each movie's recommendations whose posters
+    # are prefetched, and the files the progress and the report are saved to
+    def __init__(self, service, jobs, similar_posters, progress_path, report_path):
+        self.service = service
+        self.jobs = jobs
+        self.similar_posters = similar_posters
+        self.progress_path = progress_path
+        self.report_path = report_path
+
+        # Movies that have already been prefetched (by this run or an earlier one)
+        self.done = set()
+        if os.path.exists(self.progress_path):
+            with open(self.progress_path, "r") as f:
+                self.done = set(json.load(f)["done"])
+
+    # Method to forget the progress of earlier runs, so every movie is prefetched again
+    def restart(self):
+        self.done = set()
+
+    # Method to get the movies in the given users' watchlists (each movie only once), as a
+    # list of [id, title, poster url] lists
+    def watchlist_movies(self, names):
+        movies = {}
+        for name in names:
+            for movie in self.service.watchlist(name):
+                movies.setdefault(movie[0], movie)
+
+        return list(movies.values())
+
+    # Method to prefetch every movie in the given users' watchlists that hasn't been
+    # prefetched yet, printing the progress with report(). Returns the report
+    def run(self, names, report=print):
+        movies = self.watchlist_movies(names)
+        todo = [movie for movie in movies if movie[0] not in self.done]
+        failed = {}
+        start = time.time()
+
+        report(f"{len(movies)} movies in {len(names)} watchlist(s), {len(movies) - len(todo)} already prefetched")
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            futures = {pool.submit(self.prefetch_movie, movie): movie for movie in todo}
+
+            for count, future in enumerate(as_completed(futures), 1):
+                movie = futures[future]
+
+                if future.exception() is None:
+                    self.done.add(movie[0])
+                    failed.pop(movie[0], None)
+                    status = "ok"
+                else:
+                    failed[movie[0]] = f"{type(future.exception()).__name__}: {future.exception()}"
+                    status = f"failed ({failed[movie[0]]})"
+
+                # Save the progress after every movie, so a stopped run can carry on from here
+                self.save(self.progress_path, {"done": sorted(self.done)})
+                report(f"[{count}/{len(todo)}] {movie[0]} {movie[1]}: {status}")
+
+        summary = {"users": names,
+                   "movies": len(movies),
+                   "prefetched": len([movie for movie in movies if movie[0] in self.done]),
+                   "failed": failed,
+                   "seconds": round(time.time() - start, 2),
+                   "budget": self.service.budget()}
+        self.save(self.report_path, summary)
+        return summary
+
+    # Method to prefetch one movie: its poster, details, ratings, recommendations, and the
+    # posters of its first recommendations. Raises an error if any of them can't be fetched
+    def prefetch_movie(self, movie):
+        movie_id, title, image_url = movie
+        self.prefetch_poster(image_url)
+
+        details = self.service.movie_details(movie_id, RequestScheduler.PREFETCH)
+        self.prefetch_poster(details["image_url"])
+
+        similars = self.service.similar_movies(details["genres"], movie_id, RequestScheduler.PREFETCH)
+        for similar in similars[:self.similar_posters]:
+            self.prefetch_poster(similar[3])
+
+    # Method to download a poster into the poster cache. poster_image() shows the placeholder
+    # instead of raising an error when a download fails, so the cache is checked afterwards.
+    # A poster that is known to be broken (rather than just not downloaded yet) is shown as
+    # the bundled placeholder, so there is nothing to prefetch for it. Every size is made from
+    # the one download, so only the first size is asked for
+    def prefetch_poster(self, url):
+        self.service.poster_image(url, self.service.POSTER_SIZES[0], RequestScheduler.PREFETCH)
+        if url not in self.service.poster_cache and self.service.failed_posters.get(url) is None:
+            raise OSError(f"poster could not be downloaded: {url}")
+
+    # Method to save a dictionary as a json file. It is written atomically, so a stopped
+    # run never leaves a half-written file behind
+    def save(self, path, data):
+        with atomic_write(path) as f:
+            json.dump(data, f, indent=2)
@@ -0,0 +1,157 @@
+# Name        : Profiler class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains Profiler class, which (when profiling is turned
+#               on) runs every screen change of the Moview window under
+#               cProfile, including the background loading and the drawing
+#               that finish the screen, and saves one .prof file for each
+#               screen change. It also keeps a summary of the functions
+#               that took the most time on each screen.
+
+from AtomicWrite import atomic_write # Used to write the summary safely
+from contextlib import contextmanager, nullcontext # Used to profile a block of code with "with"
+import cProfile # Used to profile each screen change
+import io # Used to collect the summary text
+import os # Used to build the paths of the profile files
+import pstats # Used to combine the profiles and summarize them
+import threading # Used to profile the background loading as well
+
+# Class for the per-screen profiler
+class Profiler():
+
+    # Number of functions listed for each screen in the summary
+    TOP_FUNCTIONS = 20
+
+    # Class initialization, with the directory to save the profiles to, or None to turn
+    # profiling off
+    def __init__(self, directory=None):
+        self.directory = directory
+        self.enabled = directory is not None
+
+        # Screen change currently being profiled, as [screen, movie id, list of profiles,
+        # number of the screen change], and the number of screen changes profiled so far
+        self.current = None
+        self.transitions = 0
+
+        # Combined profile of every change to each screen, as screen -> [pstats.Stats, count]
+        self.totals = {}
+
+        # Profiles being made in each thread (a thread only ever has one running at a time)
+        self.active = threading.local()
+        self.lock = threading.Lock()
+
+        if self.enabled:
+            os.makedirs(self.directory, exist_ok=True)
+
+    # Method to wrap a method that changes to a screen, so that calling it starts profiling
+    # a new screen change (the first argument, if there is one, is the movie id)
+    def screen(self, name, method):
+        def wrapper(*args):
+            if getattr(self.active, "profile", None) is not None:
+                return method(*args)
+
+            self.begin(name, args[0] if args else None)
+            with self.profile(self.current):
+                return method(*args)
+
+        return wrapper
+
+    # Method to wrap a method that carries on the current screen change (loading it in the
+    # background, or drawing it once it has loaded), so that it is profiled as part of it
+    def step(self, method):
+        def wrapper(*args):
+            with self.profile(self.current):
+                return method(*args)
+
+        return wrapper
+
+    # Method to start profiling a new screen change, saving the previous one
+    def begin(self, screen, movie_id):
+        with self.lock:
+            previous = self.current
+            self.transitions += 1
+            self.current = [screen, movie_id, [], self.transitions]
+
+        if previous is not None:
+            self.finish(previous)
+
+    # Method to profile a block of code in the current thread as part of a screen change
+    # (used as "with profiler.profile(transition):")
+    def profile(self, transition):
+        if transition is None or getattr(self.active, "profile", None) is not None:
+            return nullcontext()
+
+        return self.profiled(transition)
+
+    # Generator used by profile() to profile the block of code, adding the profile to the
+    # screen change once the block is done
+    @contextmanager
+    def profiled(self, transition):
+
+        # Some versions of Python only allow one profile to run at a time, so a block that
+        # runs while another thread is being profiled isn't profiled
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            yield
+            return
+
+        self.active.profile = profile
+        try:
+            yield
+        finally:
+            profile.disable()
+            self.active.profile = None
+            with self.lock:
+                transition[2].append(profile)
+
+    # Method to save the profile of a screen change as "<number>-<screen>[-<movie id>].prof",
+    # and update the summary
+    def finish(self, transition):
+        with self.lock:
+            screen, movie_id, profiles, number = transition
+            profiles = list(profiles)
+
+        if not profiles:
+            return
+
+        # Combine the profiles of every part of the screen change into one file
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+
+        name = f"{number:04d}-{screen}" + (f"-{movie_id}" if movie_id is not None else "")
+        path = os.path.join(self.directory, f"{name}.prof")
+        stats.dump_stats(path)
+
+        # Add the screen change to the screen's combined profile
+        if screen in self.totals:
+            self.totals[screen][0].add(path)
+            self.totals[screen][1] += 1
+        else:
+            self.totals[screen] = [pstats.Stats(path), 1]
+
+        self.write_summary()
+
+    # Method to write "summary.txt", listing the functions with the most cumulative time
+    # on each screen (over every change to that screen)
+    def write_summary(self):
+        summary = io.StringIO()
+
+        for screen, (stats, count) in sorted(self.totals.items()):
+            summary.write(f"==== {screen} ({count} screen change{'s' if count != 1 else ''}) ====\n")
+            stats.stream = summary
+            stats.sort_stats("cumulative").print_stats(self.TOP_FUNCTIONS)
+
+        with atomic_write(os.path.join(self.directory, "summary.txt")) as f:
+            f.write(summary.getvalue())
+
+    # Method to save the screen change that is still being profiled (when the program closes)
+    def close(self):
+        with self.lock:
+            previous = self.current
+            self.current = None
+
+        if previous is not None:
+            self.finish(previous)
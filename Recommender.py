@@ -0,0 +1,191 @@
+# Name        : Recommender class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains Recommender class, which recommends similar movies
+#               using every movie the program has seen so far, ranking them
+#               by how many (and how rare) the genres they share are, and by
+#               their rating. This means recommendations usually don't need
+#               any IMDb-API calls, and always come back in the same order.
+
+from AtomicWrite import atomic_write # Used to save the file atomically
+import json # Used to store the movies that have been seen in a json file
+import math # Used to weigh rarer genres more heavily
+import threading # Used to make the recommender safe to use from background threads
+
+# Class for the local recommendation engine
+class Recommender():
+
+    # How much sharing genres counts towards a movie's score compared to its rating
+    # (a perfect genre match is worth 1, and a 10/10 rating is worth RATING_WEIGHT)
+    RATING_WEIGHT = 0.25
+
+    # Number of seconds to wait after movies are added before saving them, so that the
+    # movies added by a burst of requests are saved together in one write
+    SAVE_DELAY = 2.0
+
+    # Class initialization
+    def __init__(self, path):
+
+        # Set the path of the file the seen movies are saved in
+        self.path = path
+
+        # Lock used so that background threads don't modify the recommender at the same time
+        self.lock = threading.Lock()
+
+        # Lock used so that only one save writes the file at a time, and the timer that will
+        # save the movies added since the last save (None when nothing is waiting to be saved)
+        self.save_lock = threading.Lock()
+        self.save_timer = None
+
+        # Movies that have been seen, as movie id -> [title, description, poster url, genre bits, rating]
+        self.movies = {}
+
+        # Each genre is given a bit number, so that a movie's genres can be stored as a single
+        # integer (e.g. if Action is bit 0 and Drama is bit 2, an Action Drama is 0b101)
+        self.genre_bits = {}
+
+        # Inverted index of genre bit -> set of ids of the movies with that genre, so that
+        # the candidates for a recommendation can be found without looking at every movie
+        self.index = {}
+
+        # Load the movies seen in previous runs of the program
+        try:
+            with open(self.path, "r") as f:
+                for movie_id, title, description, image, genres, rating in json.load(f):
+                    self.add_movie(movie_id, title, description, image, self.genre_mask(self.split_genres(genres)), rating)
+
+        # If nothing has been saved yet (or the file is unreadable), start with no movies
+        except (OSError, ValueError):
+            pass
+
+    # Method to turn a comma-separated string of genres (like "Action, Drama") into a list
+    def split_genres(self, genres):
+        return [genre.strip() for genre in (genres or "").split(",") if genre.strip() not in ("", "N/A")]
+
+    # Method to turn a list of genres into the integer with each genre's bit set
+    # (adding any genres that haven't been seen before)
+    def genre_mask(self, genres):
+        mask = 0
+        for genre in genres:
+            if genre not in self.genre_bits:
+                self.genre_bits[genre] = len(self.genre_bits)
+                self.index[self.genre_bits[genre]] = set()
+            mask |= 1 << self.genre_bits[genre]
+
+        return mask
+
+    # Method to add a movie to the recommender, with its genres given as bits (the lock
+    # must be held when calling this)
+    def add_movie(self, movie_id, title, description, image, mask, rating):
+
+        # If the movie was seen before, take it out of the index for its old genres
+        if movie_id in self.movies:
+            self.unindex(movie_id, self.movies[movie_id][3])
+
+        self.movies[movie_id] = [title, description, image, mask, rating]
+
+        # Add the movie to the index for each of its genres
+        bit = 0
+        while mask >> bit:
+            if (mask >> bit) & 1:
+                self.index[bit].add(movie_id)
+            bit += 1
+
+    # Method to remove a movie from the index for each of the genres in mask
+    def unindex(self, movie_id, mask):
+        for bit, ids in self.index.items():
+            if (mask >> bit) & 1:
+                ids.discard(movie_id)
+
+    # Method to add movies that have been seen, where each movie is a tuple of
+    # (id, title, description, poster url, genres string, rating). They are saved a few
+    # seconds later (see SAVE_DELAY), so that recommend() isn't held up by the write
+    def add(self, movies):
+        with self.lock:
+            for movie_id, title, description, image, genres, rating in movies:
+
+                # Ratings come from the API as strings (or "N/A"), so they are converted here
+                try:
+                    rating = float(rating)
+                except (TypeError, ValueError):
+                    rating = 0.0
+
+                # Keep a movie's description, poster, genres and rating if it was seen without
+                # them the second time (e.g. a Title response with "N/A" genres)
+                old = self.movies.get(movie_id, [None, "", "", 0, 0.0])
+                self.add_movie(movie_id, title or old[0], description or old[1], image or old[2],
+                               self.genre_mask(self.split_genres(genres)) or old[3], rating or old[4])
+
+            # Start the timer to save the movies, unless one is already waiting
+            if self.save_timer is None:
+                self.save_timer = threading.Timer(self.SAVE_DELAY, self.save)
+                self.save_timer.daemon = True
+                self.save_timer.start()
+
+    # Method to save any movies that are waiting to be saved straight away (used when the
+    # program closes)
+    def flush(self):
+        with self.lock:
+            timer = self.save_timer
+        if timer is not None:
+            timer.cancel()
+            self.save()
+
+    # Method to save the seen movies to disk. Only copying the list of movies is done while
+    # holding the lock (a movie's list is replaced rather than changed when it is seen again),
+    # so recommendations can still be made while the file is written
+    def save(self):
+        with self.save_lock:
+            with self.lock:
+                self.save_timer = None
+                bits = sorted(self.genre_bits, key=self.genre_bits.get)
+                items = list(self.movies.items())
+
+            movies = [[movie_id, title, description, image,
+                       ", ".join(genre for i, genre in enumerate(bits) if (mask >> i) & 1), rating]
+                      for movie_id, (title, description, image, mask, rating) in items]
+
+            # The movies are only a cache of what has been seen, so if they can't be saved
+            # (e.g. the disk is full), they are learned again the next time they are seen
+            try:
+                self.write(movies)
+            except OSError:
+                pass
+
+    # Method to write the list of movies to the file (atomically, so a crash can never
+    # leave a half-written file behind)
+    def write(self, movies):
+        with atomic_write(self.path) as f:
+            json.dump(movies, f)
+
+    # Method to get a list of movies similar to one with the given genres string, best
+    # match first. Each movie is a list with its id, title, description, and poster url
+    def recommend(self, genres, avoid, limit):
+        with self.lock:
+            # Genres that no movie has any more (because the movies were seen again with other
+            # genres) are skipped, as nothing could be recommended for them
+            target = [self.genre_bits[genre] for genre in self.split_genres(genres)
+                      if genre in self.genre_bits and self.index[self.genre_bits[genre]]]
+            if not target:
+                return []
+
+            # Weigh each genre by how rare it is (like the "inverse document frequency"
+            # used by search engines), so sharing "Western" counts for more than sharing
+            # "Drama". Every weight is divided by the total so that a perfect match scores 1
+            weights = {bit: math.log(1 + len(self.movies) / len(self.index[bit])) for bit in target}
+            total = sum(weights.values())
+
+            # Add up the weights of the shared genres for each candidate by going through the
+            # index of each genre, so only movies sharing at least one genre are looked at
+            scores = {}
+            for bit in target:
+                for movie_id in self.index[bit]:
+                    scores[movie_id] = scores.get(movie_id, 0) + weights[bit] / total
+
+            scores.pop(avoid, None)
+
+            # Add each candidate's rating to its score, then sort by score (using the id to
+            # break ties, so that the same movie always gets the same recommendations)
+            ranked = sorted(scores, key=lambda movie_id: (-(scores[movie_id] + self.RATING_WEIGHT*self.movies[movie_id][4]/10), movie_id))
+
+            return [[movie_id] + self.movies[movie_id][:3] for movie_id in ranked[:limit]]
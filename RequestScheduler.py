@@ -0,0 +1,153 @@
+# Name        : RequestScheduler class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains RequestScheduler class, which every outbound
+#               request has to go through. Requests the user is waiting on
+#               go first, then visible posters, then prefetching, and the
+#               IMDb-API key's rate limit and daily quota are tracked so that
+#               less important requests are held back (or dropped) before
+#               the quota runs out.
+
+from AtomicWrite import atomic_write # Used to save the file atomically
+import datetime # Used to tell when the daily quota resets
+import json # Used to store the quota usage in a json file
+import threading # Used to make threads wait for their turn
+import time # Used to refill the token bucket over time
+
+# Error raised when a request is dropped to save the API key's daily quota
+class QuotaExceeded(Exception):
+    pass
+
+# Class for the outbound request scheduler
+class RequestScheduler():
+
+    # Priority classes, from most to least important
+    FOREGROUND = 0 # Searches and movie details the user is waiting on
+    VISIBLE = 1 # Posters (and recommendations) that are on screen
+    PREFETCH = 2 # Work done ahead of time in case it is needed
+
+    # Share of the daily quota that has to be left for a request of each priority to
+    # use it. Prefetching stops once less than 30% of the quota is left, and visible
+    # work once less than 10% is left, saving the rest for foreground requests
+    QUOTA_RESERVES = {FOREGROUND: 0.0, VISIBLE: 0.1, PREFETCH: 0.3}
+
+    # Share of the token bucket that has to be left for a request of each priority to
+    # take a token, so that prefetching waits for the bucket to refill rather than
+    # emptying it right before a foreground request
+    TOKEN_RESERVES = {FOREGROUND: 0.0, VISIBLE: 0.0, PREFETCH: 0.5}
+
+    # Class initialization
+    def __init__(self, path, daily_quota, rate, burst, slots):
+
+        # Set the path of the file the quota usage is saved in, and the number of
+        # API-key requests allowed per day
+        self.path = path
+        self.daily_quota = daily_quota
+
+        # Token bucket for API-key requests: it holds up to burst tokens, gains rate tokens
+        # every second, and each request takes one token
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.refilled = time.monotonic()
+
+        # Number of requests (of any kind) that can be sent at the same time
+        self.slots = slots
+
+        # Condition used to make threads wait for their turn, along with the number of
+        # threads waiting at each priority
+        self.condition = threading.Condition()
+        self.waiting = {self.FOREGROUND: 0, self.VISIBLE: 0, self.PREFETCH: 0}
+
+        # Number of requests dropped at each priority
+        self.shed = {self.FOREGROUND: 0, self.VISIBLE: 0, self.PREFETCH: 0}
+
+        # Load today's quota usage (from previous runs of the program)
+        self.day = self.today()
+        self.used = 0
+        try:
+            with open(self.path, "r") as f:
+                saved = json.load(f)
+            if saved["day"] == self.day:
+                self.used = saved["used"]
+
+        # If nothing has been saved yet (or the file is unreadable), start from zero
+        except (OSError, ValueError, KeyError):
+            pass
+
+    # Method to get today's date (IMDb-API quotas reset at midnight UTC)
+    def today(self):
+        return datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+
+    # Method to reset the quota usage if the day has changed, and add the tokens earned
+    # since the last refill to the bucket (the condition's lock must be held)
+    def update(self):
+        if self.today() != self.day:
+            self.day = self.today()
+            self.used = 0
+
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.refilled) * self.rate)
+        self.refilled = now
+
+    # Method to wait until a request of the given priority is allowed to be sent.
+    # uses_key is True for requests that count towards the API key's quota (posters
+    # don't). Raises QuotaExceeded if the request is dropped to save the quota
+    def acquire(self, priority, uses_key):
+        with self.condition:
+            self.update()
+
+            # Drop the request if it would dig into the quota saved for more important requests
+            if uses_key and self.daily_quota - self.used <= self.QUOTA_RESERVES[priority] * self.daily_quota:
+                self.shed[priority] += 1
+                raise QuotaExceeded(f"IMDb-API daily quota is running low ({self.daily_quota - self.used} calls left)")
+
+            self.waiting[priority] += 1
+            try:
+                while True:
+                    self.update()
+
+                    # Requests wait while a more important request is waiting, while every
+                    # slot is in use, or (for API-key requests) while the bucket is too low
+                    ahead = any(self.waiting[other] for other in self.waiting if other < priority)
+                    needed = 1 + self.TOKEN_RESERVES[priority] * self.burst
+                    if not ahead and self.slots > 0 and (not uses_key or self.tokens >= needed):
+                        break
+
+                    # Wait until woken by a finished request, or until the bucket should have
+                    # refilled enough (checking again at least every second)
+                    refill_time = (needed - self.tokens) / self.rate if uses_key else 1
+                    self.condition.wait(min(1, max(0.01, refill_time)))
+
+                self.slots -= 1
+                if uses_key:
+                    self.tokens -= 1
+                    self.used += 1
+                    self.save()
+
+            finally:
+                self.waiting[priority] -= 1
+                self.condition.notify_all()
+
+    # Method called once a request has finished, freeing its slot for the next one
+    def release(self):
+        with self.condition:
+            self.slots += 1
+            self.condition.notify_all()
+
+    # Method to save today's quota usage to disk (the condition's lock must be held)
+    def save(self):
+        with atomic_write(self.path) as f:
+            json.dump({"day": self.day, "used": self.used}, f)
+
+    # Method to get a report of the remaining budget
+    def budget(self):
+        with self.condition:
+            self.update()
+            return {"day": self.day,
+                    "daily_quota": self.daily_quota,
+                    "used": self.used,
+                    "remaining": self.daily_quota - self.used,
+                    "tokens": round(self.tokens, 2),
+                    "waiting": dict(self.waiting),
+                    "shed": dict(self.shed)}
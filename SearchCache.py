@@ -0,0 +1,82 @@
+# Name        : SearchCache class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains SearchCache class, which keeps the results of
+#               recent searches in memory. A search that was made before
+#               is answered straight away, and a longer search (like "star
+#               wa" after "star") gets a preview straight away by filtering
+#               the results of a shorter one, while IMDb-API is asked.
+
+from collections import OrderedDict # Used to keep the searches in least-recently-used order
+import threading # Used to make the cache safe to use from background threads
+
+# Class for the in-memory search results cache
+class SearchCache():
+
+    # Class initialization, with the most searches kept
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+
+        # Results of each search, as query -> list of search results, ordered from least
+        # to most recently used
+        self.searches = OrderedDict()
+        self.lock = threading.Lock()
+
+        # Counters used to measure how well the cache is working
+        self.hits = 0
+        self.filtered = 0
+        self.misses = 0
+
+    # Method to turn a query into the form it is cached under (ignoring case and spacing)
+    def normalize(self, query):
+        return " ".join(query.casefold().split())
+
+    # Method to check whether a title matches a query, meaning that every word of the query
+    # is the start of one of the title's words
+    def matches(self, query, title):
+        words = title.casefold().split()
+        return all(any(word.startswith(part) for word in words) for part in query.split())
+
+    # Method to get the results for a query, as (results, complete). If the query was searched
+    # for before, its results are returned, and they are complete. Otherwise, the results of
+    # the longest cached search that the query starts with are filtered down to the movies that
+    # match the query. These are never complete, as IMDb-API matches titles more loosely than
+    # matches() does (e.g. "spider man" finds "Spider-Man"). If there is nothing to go on, the
+    # results are None
+    def lookup(self, query):
+        query = self.normalize(query)
+
+        with self.lock:
+            if query in self.searches:
+                self.searches.move_to_end(query)
+                self.hits += 1
+                return list(self.searches[query]), True
+
+            shorter = max((cached for cached in self.searches if query.startswith(cached)), key=len, default=None)
+            if shorter is None:
+                self.misses += 1
+                return None, False
+
+            self.filtered += 1
+            return [result for result in self.searches[shorter] if self.matches(query, result[1])], False
+
+    # Method to store the results of a search
+    def put(self, query, results):
+        query = self.normalize(query)
+
+        with self.lock:
+            self.searches[query] = list(results)
+            self.searches.move_to_end(query)
+
+            # Forget the least recently used searches once there are too many
+            while len(self.searches) > self.max_entries:
+                self.searches.popitem(last=False)
+
+    # Method to get statistics about the cache
+    def stats(self):
+        with self.lock:
+            return {"hits": self.hits,
+                    "filtered": self.filtered,
+                    "misses": self.misses,
+                    "entries": len(self.searches),
+                    "max_entries": self.max_entries}
@@ -0,0 +1,34 @@
+# Name        : StartupTimer class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains StartupTimer class, which records how long each
+#               step of starting the program took (most importantly, how
+#               long until the first screen was drawn), so that changes to
+#               startup can be checked.
+
+import time # Used to time each step
+
+# Class for timing the program's startup
+class StartupTimer():
+
+    # Class initialization, with whether the report should be printed once startup is done
+    def __init__(self, verbose=False):
+        self.verbose = verbose
+
+        # Time startup began, and each step, as [(step, seconds since startup began)]
+        self.start = time.perf_counter()
+        self.marks = []
+
+    # Method to record that a step of startup has just finished
+    def mark(self, step):
+        self.marks.append((step, time.perf_counter() - self.start))
+
+    # Method to record the steps in the metrics, and print the report if it was asked for
+    def report(self, metrics):
+        for step, seconds in self.marks:
+            metrics.observe("startup_seconds", seconds, step=step)
+
+        if self.verbose:
+            print("Startup (seconds since the program started):")
+            for step, seconds in self.marks:
+                print(f"  {step:<14} {seconds:7.3f}")
@@ -0,0 +1,95 @@
+# Name        : TaskRunner class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains TaskRunner class, which runs slow work (like
+#               network requests and image decoding) on background
+#               threads and hands the results back to the Tkinter thread,
+#               so that the window never freezes while waiting.
+
+from concurrent.futures import ThreadPoolExecutor # Used to run tasks on background threads
+import queue # Used to pass finished tasks back to the Tkinter thread
+
+# Class for running background tasks
+class TaskRunner():
+
+    # How often (in milliseconds) the Tkinter thread checks for finished tasks
+    POLL_INTERVAL = 30
+
+    # Class initialization
+    def __init__(self, win, workers):
+
+        # Set window variable (used to schedule the polling with after())
+        self.win = win
+
+        # Create the pool of threads that the tasks run on
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+
+        # Queue of finished tasks. Tkinter isn't thread-safe, so the background threads
+        # only ever put finished tasks in here, and the Tkinter thread takes them out
+        self.finished = queue.Queue()
+
+        # Number that goes up every time the current tasks are cancelled. Each task
+        # remembers the number it was started with, so results from tasks started
+        # before the last cancel can be recognized as stale and thrown away
+        self.generation = 0
+
+        # Tasks that haven't been handed back to the Tkinter thread yet
+        self.pending = set()
+
+        # Start checking for finished tasks
+        self.win.after(self.POLL_INTERVAL, self.poll)
+
+    # Method to run work() on a background thread, then call done(result) on the
+    # Tkinter thread when it finishes (or failed(error) if it raised an error).
+    # A different pool of threads can be given to run the work on instead. Tasks
+    # started with keep=True don't belong to a screen, so they aren't cancelled
+    # when the screen changes
+    def run(self, work, done, failed, pool=None, keep=False):
+        generation = None if keep else self.generation
+
+        future = (pool or self.pool).submit(work)
+        if not keep:
+            self.pending.add(future)
+
+        # This callback runs on the background thread, so all it does is queue the task
+        future.add_done_callback(lambda future: self.finished.put((generation, future, done, failed)))
+        return future
+
+    # Method to cancel every task that is currently running or waiting to run. Tasks
+    # that haven't started yet won't run at all, and the results of tasks that are
+    # already running will be ignored
+    def cancel_all(self):
+        self.generation += 1
+
+        for future in self.pending:
+            future.cancel()
+        self.pending.clear()
+
+    # Method that hands finished tasks back to the Tkinter thread (called using after())
+    def poll(self):
+        try:
+            while True:
+                generation, future, done, failed = self.finished.get_nowait()
+                self.pending.discard(future)
+
+                # Ignore tasks that were cancelled, or that belong to a screen that
+                # the user has since navigated away from
+                if future.cancelled() or generation not in (None, self.generation):
+                    continue
+
+                if future.exception() is None:
+                    done(future.result())
+                else:
+                    failed(future.exception())
+
+        except queue.Empty:
+            pass
+
+        # Check again after the poll interval (even if one of the callbacks raised an error)
+        finally:
+            self.win.after(self.POLL_INTERVAL, self.poll)
+
+    # Method to stop the background threads (used when the program is closed)
+    def shutdown(self):
+        self.cancel_all()
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,85 @@
+# Name        : ThumbnailCache class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains ThumbnailCache class, which keeps decoded and
+#               resized posters in memory (keyed by their URL and size)
+#               so that showing the same poster again doesn't need any
+#               decoding or resizing work.
+
+from collections import OrderedDict # Used to keep the thumbnails in least-recently-used order
+import threading # Used to make the cache safe to use from the poster worker threads
+
+# Class for the in-memory thumbnail cache
+class ThumbnailCache():
+
+    # Class initialization
+    def __init__(self, max_bytes):
+
+        # Set the maximum amount of decoded pixel data (in bytes) the cache can hold
+        self.max_bytes = max_bytes
+
+        # Counters used to measure how well the cache is working
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Lock used so that the worker threads don't modify the cache at the same time
+        self.lock = threading.Lock()
+
+        # Dictionary of (url, dims) -> Pillow image, ordered from least to most
+        # recently used, along with the total pixel bytes of every image in it
+        self.images = OrderedDict()
+        self.total_bytes = 0
+
+    # Method to get the number of bytes of pixel data held by a decoded image
+    # (e.g. an 81x123 RGB image holds 81 * 123 * 3 bytes)
+    def image_bytes(self, image):
+        return image.width * image.height * len(image.getbands())
+
+    # Method to get the cached image for a URL at a certain size (or None if it isn't cached)
+    def get(self, url, dims):
+        key = (url, tuple(dims))
+
+        with self.lock:
+            image = self.images.get(key)
+
+            if image is None:
+                self.misses += 1
+            else:
+                self.images.move_to_end(key)
+                self.hits += 1
+
+            return image
+
+    # Method to store the resized image for a URL at a certain size
+    def put(self, url, dims, image):
+        key = (url, tuple(dims))
+        size = self.image_bytes(image)
+
+        # Don't bother storing anything that could never fit in the cache
+        if size > self.max_bytes:
+            return
+
+        with self.lock:
+            # If the key was already cached, replace its old image with the new one
+            if key in self.images:
+                self.total_bytes -= self.image_bytes(self.images.pop(key))
+
+            self.images[key] = image
+            self.total_bytes += size
+
+            # Remove the least recently used images until the cache fits within its maximum size
+            while self.total_bytes > self.max_bytes:
+                old_key, old_image = self.images.popitem(last=False)
+                self.total_bytes -= self.image_bytes(old_image)
+                self.evictions += 1
+
+    # Method to get the cache's counters
+    def stats(self):
+        with self.lock:
+            return {"hits": self.hits,
+                    "misses": self.misses,
+                    "evictions": self.evictions,
+                    "entries": len(self.images),
+                    "bytes": self.total_bytes,
+                    "max_bytes": self.max_bytes}
@@ -0,0 +1,285 @@
+# Name        : VirtualList class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains VirtualList class, which draws a scrollable list
+#               of movies on a canvas while only creating the rows that are
+#               on (or near) the screen, loading their posters as they
+#               scroll into view and letting go of them once they're far away.
+#               Long lists can draw their posters as atlas pages instead: one
+#               image holding the posters of several rows, put together in
+#               the background, so far fewer Tkinter images are made.
+
+from tkinter import * # Used for the canvas anchor constants
+from PIL import Image, ImageTk # Used to put atlas pages together, and to turn loaded posters into images Tkinter can display
+
+# Class for a virtualized, scrollable list of movies
+class VirtualList():
+
+    # Height of each row in pixels, and the gap above the first row
+    ROW_HEIGHT = 150
+    TOP_PADDING = 10
+
+    # Number of extra rows kept drawn above and below the visible ones, so that
+    # short scrolls don't show empty rows while posters load
+    OVERSCAN = 2
+
+    # Size of the posters in the list
+    POSTER_DIMS = (81, 123)
+
+    # Number of rows whose posters are put together in each atlas page
+    PAGE_ROWS = 8
+
+    # Class initialization
+    def __init__(self, canvas, scrollbar, movies, draw_row, load_poster, select, registry, screen,
+                 run_task, atlas_threshold):
+
+        # Set the canvas that the rows are drawn on, and its scrollbar
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+
+        # List of movies, where each movie is a list starting with its id and ending with its poster url
+        self.movies = movies
+
+        # Function that draws a movie's text on the canvas: draw_row(movie, y_pos, tags)
+        self.draw_row = draw_row
+
+        # Function that loads a poster in the background: load_poster(url, dims, done),
+        # calling done(image) on the Tkinter thread once the image is ready
+        self.load_poster = load_poster
+
+        # Function that runs work in the background: run_task(work, done), calling
+        # done(result) on the Tkinter thread once it finishes (used to put atlas pages together)
+        self.run_task = run_task
+
+        # Number of movies a list needs for its posters to be drawn as atlas pages (or None
+        # to always draw one image per row), and the colour behind the posters in each page
+        self.atlas_threshold = atlas_threshold
+        self.background = self.canvas.cget("bg")
+        self.atlas = False
+
+        # Function called with a movie's id when its row is clicked
+        self.select = select
+
+        # Registry that keeps track of the memory used by the posters, and the screen the
+        # list is on (the registry removes the list's rows while the screen is hidden if the
+        # window's images use too much memory, and they are drawn again when they come back
+        # into view)
+        self.registry = registry
+        self.screen = screen
+
+        # Rows that are currently drawn, as index -> image item on the canvas
+        self.drawn = {}
+
+        # PhotoImages for the drawn rows (Tkinter only keeps an image alive
+        # while Python holds a reference to it), as index -> PhotoImage
+        self.images = {}
+
+        # Posters that are still loading, as index -> background task
+        self.loading = {}
+
+        # Atlas pages that are currently drawn, as page -> image item on the canvas, along
+        # with their PhotoImages and the pages that are still loading (as page -> list of
+        # background tasks)
+        self.pages = {}
+        self.page_images = {}
+        self.page_loading = {}
+
+        # Whenever the visible part of the canvas changes, update the scrollbar and
+        # redraw the rows that are in view
+        self.canvas.configure(yscrollcommand=self.scrolled)
+
+        # Every row is tagged with "row", so one binding handles clicks on all of them
+        self.canvas.tag_bind("row", "<ButtonPress-1>", self.clicked)
+
+        # Let the mouse wheel scroll the list as well
+        self.canvas.bind("<MouseWheel>", lambda event: self.canvas.yview_scroll(int(-event.delta/120), "units"))
+
+        # Draw the rows that start off visible
+        self.set_movies(movies)
+
+    # Method to replace the movies in the list, scrolling back to the top
+    def set_movies(self, movies):
+        for index in list(self.drawn):
+            self.remove_row(index)
+        for page in list(self.pages):
+            self.remove_page(page)
+
+        self.movies = movies
+
+        # Long lists draw their posters as atlas pages
+        self.atlas = self.atlas_threshold is not None and len(self.movies) >= self.atlas_threshold
+
+        # Make the scrollable region fit every row, even though most of them aren't drawn
+        self.canvas.configure(scrollregion=(0, 0, 500, self.ROW_HEIGHT*len(self.movies)))
+        self.canvas.yview_moveto(0)
+        self.refresh()
+
+    # Method called by the canvas whenever it is scrolled
+    def scrolled(self, first, last):
+        self.scrollbar.set(first, last)
+        self.refresh()
+
+    # Method to get the range of row indexes that should currently be drawn
+    def visible_range(self):
+
+        # Convert the top and bottom of the visible window into canvas coordinates
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(int(self.canvas.cget("height")))
+
+        first = max(0, int(top // self.ROW_HEIGHT) - self.OVERSCAN)
+        last = min(len(self.movies), int(bottom // self.ROW_HEIGHT) + 1 + self.OVERSCAN)
+        return range(first, last)
+
+    # Method to draw the rows that are in view and remove the ones that aren't
+    def refresh(self):
+        visible = self.visible_range()
+
+        # Remove rows (and let go of their posters) once they have left the visible range
+        for index in [i for i in self.drawn if i not in visible]:
+            self.remove_row(index)
+
+        # Draw the rows that have just come into the visible range
+        for index in visible:
+            if index not in self.drawn:
+                self.add_row(index)
+
+        # Draw the atlas pages holding the visible rows' posters, and remove the rest
+        if self.atlas:
+            pages = range(visible.start // self.PAGE_ROWS, -(-visible.stop // self.PAGE_ROWS))
+
+            for page in [page for page in self.pages if page not in pages]:
+                self.remove_page(page)
+
+            for page in pages:
+                if page not in self.pages:
+                    self.add_page(page)
+
+    # Method to draw a single row
+    def add_row(self, index):
+        movie = self.movies[index]
+        y_pos = self.TOP_PADDING + index*self.ROW_HEIGHT
+        tags = ("row", f"row{index}")
+
+        # In atlas mode, only the movie's text is drawn (its poster is part of a page)
+        if self.atlas:
+            self.drawn[index] = None
+            self.draw_row(movie, y_pos, tags)
+            return
+
+        # Draw the poster (empty until it loads) and the movie's text
+        item = self.drawn[index] = self.canvas.create_image(10, y_pos, anchor=NW, tags=tags)
+        self.draw_row(movie, y_pos, tags)
+
+        # Start loading the poster
+        self.loading[index] = self.load_poster(movie[-1], self.POSTER_DIMS,
+                                               lambda image: self.poster_loaded(index, item, image))
+
+    # Method to remove a single row from the canvas
+    def remove_row(self, index):
+        self.canvas.delete(f"row{index}")
+        del self.drawn[index]
+
+        # Let go of the poster, and stop loading it if it hasn't started yet
+        if self.images.pop(index, None) is not None:
+            self.registry.remove(self.screen, ("row", index))
+        task = self.loading.pop(index, None)
+        if task is not None:
+            task.cancel()
+
+    # Method called (on the Tkinter thread) when a row's poster has loaded
+    def poster_loaded(self, index, item, image):
+
+        # Ignore posters for rows that have scrolled out of range (or been replaced by
+        # another movie's row) in the meantime
+        if self.drawn.get(index) == item:
+            self.loading.pop(index, None)
+            self.images[index] = ImageTk.PhotoImage(image)
+            self.canvas.itemconfigure(self.drawn[index], image=self.images[index])
+            self.registry.add(self.screen, ("row", index), self.images[index],
+                              lambda: self.release_row(index, item))
+
+    # Method called by the registry to let go of a row's poster, which removes the row (it
+    # is drawn again, loading its poster from the cache, once it is back in view)
+    def release_row(self, index, item):
+        if self.drawn.get(index) == item:
+            self.remove_row(index)
+
+    # Method to draw an atlas page (empty until its posters have loaded and been put together)
+    def add_page(self, page):
+        first = page * self.PAGE_ROWS
+        movies = self.movies[first:first + self.PAGE_ROWS]
+
+        item = self.pages[page] = self.canvas.create_image(10, self.TOP_PADDING + first*self.ROW_HEIGHT, anchor=NW,
+                                                           tags=("row", "page", f"page{page}"))
+
+        # Load each of the page's posters (so that every one of them can be cancelled if the
+        # page is removed), and put the page together once they have all loaded
+        posters = [None] * len(movies)
+        self.page_loading[page] = [self.load_poster(movie[-1], self.POSTER_DIMS,
+                                                    lambda image, i=i: self.page_poster_loaded(page, item, posters, i, image))
+                                   for i, movie in enumerate(movies)]
+
+    # Method called (on the Tkinter thread) when one of an atlas page's posters has loaded.
+    # Once every poster has loaded, the page is put together in the background
+    def page_poster_loaded(self, page, item, posters, i, image):
+        if self.pages.get(page) != item:
+            return
+
+        posters[i] = image
+        if all(poster is not None for poster in posters):
+            self.page_loading[page] = [self.run_task(lambda: self.compose_page(posters),
+                                                     lambda image: self.page_loaded(page, item, image))]
+
+    # Method to put a page's posters together into one image, one row apart (runs in the background)
+    def compose_page(self, posters):
+        image = Image.new("RGB", (self.POSTER_DIMS[0], len(posters)*self.ROW_HEIGHT), self.background)
+        for i, poster in enumerate(posters):
+            image.paste(poster, (0, i*self.ROW_HEIGHT))
+
+        return image
+
+    # Method to remove an atlas page from the canvas
+    def remove_page(self, page):
+        self.canvas.delete(self.pages.pop(page))
+
+        # Let go of the page's image, and stop loading it if it hasn't started yet
+        if self.page_images.pop(page, None) is not None:
+            self.registry.remove(self.screen, ("page", page))
+        for task in self.page_loading.pop(page, []):
+            task.cancel()
+
+    # Method called (on the Tkinter thread) when an atlas page has been put together
+    def page_loaded(self, page, item, image):
+
+        # Ignore pages that have scrolled out of range (or been replaced) in the meantime
+        if self.pages.get(page) == item:
+            self.page_loading.pop(page, None)
+            self.page_images[page] = ImageTk.PhotoImage(image)
+            self.canvas.itemconfigure(item, image=self.page_images[page])
+            self.registry.add(self.screen, ("page", page), self.page_images[page],
+                              lambda: self.release_page(page, item))
+
+    # Method called by the registry to let go of an atlas page's image, which removes the
+    # page (it is drawn again once it is back in view)
+    def release_page(self, page, item):
+        if self.pages.get(page) == item:
+            self.remove_page(page)
+
+    # Method called when a row is clicked
+    def clicked(self, event):
+        tags = self.canvas.gettags("current")
+
+        # An atlas page holds several posters, so the row is found from where it was clicked
+        # (clicks between the posters are ignored)
+        if "page" in tags:
+            y_pos = self.canvas.canvasy(event.y) - self.TOP_PADDING
+            index = int(y_pos // self.ROW_HEIGHT)
+            if 0 <= index < len(self.movies) and y_pos % self.ROW_HEIGHT < self.POSTER_DIMS[1]:
+                self.select(self.movies[index][0])
+            return
+
+        # Find which row the clicked item belongs to using its "row<index>" tag
+        for tag in tags:
+            if tag.startswith("row") and tag != "row":
+                self.select(self.movies[int(tag[3:])][0])
+                return
@@ -0,0 +1,63 @@
+# Name        : Watchlist class file for the Moview application
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains Watchlist class, which holds the logged-in user's
+#               watchlist in memory for the whole session, so that checking
+#               or changing it never has to wait on the database. Changes
+#               are remembered and written to the database in batches.
+
+from collections import OrderedDict # Used to keep the movies in the order they were added
+
+# Class for the logged-in user's watchlist
+class Watchlist():
+
+    # Class initialization
+    def __init__(self, db, name):
+
+        # Set the database and the name of the user the watchlist belongs to
+        self.db = db
+        self.name = name
+
+        # Movies in the watchlist in the order they were added, as movie id -> [id, title, poster url].
+        # Looking a movie up by its id (or adding/removing one) takes the same time no matter
+        # how long the watchlist is
+        self.movies = OrderedDict((movie[0], movie) for movie in self.db.watchlist(self.name))
+
+        # Changes that haven't been written to the database yet, in the order they were made,
+        # as movie id -> the movie's list if it was added, or None if it was removed
+        self.changes = OrderedDict()
+
+    # Method to check whether a movie is in the watchlist (used with "in")
+    def __contains__(self, movie_id):
+        return movie_id in self.movies
+
+    # Method to get the number of movies in the watchlist (used with len())
+    def __len__(self):
+        return len(self.movies)
+
+    # Method to get a list of the movies in the watchlist, in the order they were added
+    def entries(self):
+        return list(self.movies.values())
+
+    # Method to add a movie to the watchlist if it isn't in it, or remove it if it is.
+    # Returns True if the movie was added, and False if it was removed
+    def toggle(self, movie_id, title, image_url):
+        if movie_id in self.movies:
+            del self.movies[movie_id]
+            movie = None
+        else:
+            movie = [movie_id, title, image_url]
+            self.movies[movie_id] = movie
+
+        # Only the latest change to each movie needs to be written, but it is moved to the
+        # end so that the changes are written in the same order the movies were added
+        self.changes[movie_id] = movie
+        self.changes.move_to_end(movie_id)
+
+        return movie is not None
+
+    # Method to write any changes that haven't been saved yet to the database
+    def flush(self):
+        if self.changes:
+            self.db.apply_changes(self.name, list(self.changes.items()))
+            self.changes.clear()
@@ -0,0 +1,185 @@
+# Name        : Benchmark class file for the Moview benchmarks
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains Benchmark class, which times Moview's searching,
+#               movie details, recommendations and watchlist operations
+#               against a FakeImdbApi for several result set and watchlist
+#               sizes, measures how much memory each one needs at its peak,
+#               and compares the results with a saved baseline.
+
+from BenchmarkService import BenchmarkService # Used to run the benchmarked code against the fake API
+import math # Used to find the percentiles
+import platform # Used to record what the benchmarks were run on
+import tempfile # Used to give each size a fresh database and caches
+import time # Used to time each operation
+import tracemalloc # Used to measure the peak memory of each operation
+
+# Class for the benchmark suite
+class Benchmark():
+
+    # Operations that are benchmarked, in the order they are run
+    OPERATIONS = ("movie_search", "movie_details", "similar_movies", "poster_image", "get_list", "modify_list")
+
+    # Name and password of the user whose watchlist is benchmarked
+    USER = "benchmark"
+
+    # Smallest increase in p95 latency (ms) and peak memory (KiB) that counts as a regression,
+    # so that timer noise on operations that take microseconds isn't reported
+    NOISE = {"p95_ms": 1.0, "peak_kib": 64.0}
+
+    # Genres the recommendations are asked for (one after the other)
+    GENRE_SETS = ("Action, Adventure, Sci-Fi", "Comedy, Drama", "Crime, Drama, Thriller",
+                  "Animation, Family, Fantasy")
+
+    # Class initialization, with the fake API to run against and the number of times each
+    # operation is timed for each size
+    def __init__(self, api, repeat):
+        self.api = api
+        self.repeat = repeat
+
+        # Number used to make movie ids that haven't been requested before
+        self.next_id = 9000000
+
+    # Method to get the settings that affect the results (results are only comparable
+    # with a baseline made with the same settings)
+    def settings(self):
+        return {"repeat": self.repeat,
+                "latency": self.api.latency,
+                "failure_rate": self.api.failure_rate,
+                "python": platform.python_version(),
+                "machine": platform.machine()}
+
+    # Method to run every operation for every size, returning the settings and, for each
+    # operation, the results for each size
+    def run(self, sizes, report=print):
+        results = {operation: {} for operation in self.OPERATIONS}
+
+        for size in sizes:
+            for operation, result in self.run_size(size).items():
+                results[operation][str(size)] = result
+                report(self.format_result(operation, size, result))
+
+        return {"settings": self.settings(), "results": results}
+
+    # Method to run every operation for one size, each search returning "size" results and
+    # the watchlist holding "size" movies
+    def run_size(self, size):
+        self.api.size = size
+
+        # Every size starts with an empty database and empty caches
+        with tempfile.TemporaryDirectory() as directory:
+            service = BenchmarkService(directory, self.api.url)
+            try:
+                service.create_user(self.USER, self.USER)
+                watchlist = self.fill_watchlist(service, size)
+
+                return {operation: self.measure(lambda i: getattr(self, operation)(service, watchlist, i))
+                        for operation in self.OPERATIONS}
+
+            finally:
+                service.close()
+                service.db.connection.close()
+
+    # Method to fill the benchmark user's watchlist with "size" movies, returning it
+    # opened for the session
+    def fill_watchlist(self, service, size):
+        movies = [self.api.movie(number) for number in range(1, size + 1)]
+        service.db.apply_changes(self.USER, [(movie["id"], [movie["id"], movie["title"], movie["image"]])
+                                             for movie in movies])
+        return service.open_watchlist(self.USER)
+
+    # Method to get a movie id that hasn't been requested before (so it isn't cached)
+    def new_movie_id(self):
+        self.next_id += 1
+        return f"tt{self.next_id:07d}"
+
+    # Operation: searching for movies (each search returns "size" results)
+    def movie_search(self, service, watchlist, i):
+        service.movie_search(f"movie {i}")
+
+    # Operation: getting the details of a movie that isn't cached yet
+    def movie_details(self, service, watchlist, i):
+        service.movie_details(self.new_movie_id())
+
+    # Operation: getting the recommendations for a movie. IMDb-API is asked (for "size"
+    # results) until the recommender has seen enough movies with the genres
+    def similar_movies(self, service, watchlist, i):
+        service.similar_movies(self.GENRE_SETS[i % len(self.GENRE_SETS)], self.new_movie_id())
+
+    # Operation: downloading, decoding and resizing a poster that isn't cached yet, at the
+    # size used in movie lists
+    def poster_image(self, service, watchlist, i):
+        service.poster_image(self.api.movie(int(self.new_movie_id()[2:]))["image"], (81, 123))
+
+    # Operation: getting the watchlist to show it, like Moview.get_list()
+    def get_list(self, service, watchlist, i):
+        watchlist.entries()
+
+    # Operation: adding a movie to the watchlist (or removing it again) and saving the
+    # change, like Moview.modify_list() followed by its write to the database
+    def modify_list(self, service, watchlist, i):
+        movie = self.api.movie(1000000)
+        watchlist.toggle(movie["id"], movie["title"], movie["image"])
+        watchlist.flush()
+
+    # Method to time an operation "repeat" times, then run it once more to measure its peak
+    # memory (tracemalloc slows everything down, so it isn't used while timing)
+    def measure(self, work):
+        durations = []
+        errors = 0
+
+        for i in range(self.repeat):
+            start = time.perf_counter()
+            try:
+                work(i)
+            except Exception:
+                errors += 1
+                continue
+            durations.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            work(self.repeat)
+        except Exception:
+            errors += 1
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        return {"p50_ms": self.percentile(durations, 0.50) * 1000,
+                "p95_ms": self.percentile(durations, 0.95) * 1000,
+                "throughput": len(durations) / sum(durations) if durations and sum(durations) else 0.0,
+                "peak_kib": peak / 1024,
+                "errors": errors}
+
+    # Method to get a percentile (0 to 1) of a list of durations, using the nearest rank
+    def percentile(self, durations, fraction):
+        if not durations:
+            return 0.0
+
+        ordered = sorted(durations)
+        return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+    # Method to format one operation's results for one size as a line of the report
+    def format_result(self, operation, size, result):
+        return (f"{operation:<15} {size:>6}  p50 {result['p50_ms']:9.2f} ms  p95 {result['p95_ms']:9.2f} ms  "
+                f"{result['throughput']:9.1f} ops/s  peak {result['peak_kib']:10.1f} KiB  "
+                f"errors {result['errors']}")
+
+    # Method to compare results with a baseline. An operation has regressed if its p95
+    # latency or its peak memory is more than "tolerance" (e.g. 0.25 for 25%) higher than in
+    # the baseline (and by more than the noise). Returns a list of lines describing the regressions
+    def compare(self, results, baseline, tolerance):
+        regressions = []
+
+        for operation, sizes in results["results"].items():
+            for size, result in sizes.items():
+                old = baseline["results"].get(operation, {}).get(size)
+                if old is None:
+                    continue
+
+                for key, unit in (("p95_ms", "ms"), ("peak_kib", "KiB")):
+                    if result[key] > old[key] * (1 + tolerance) and result[key] - old[key] > self.NOISE[key]:
+                        regressions.append(f"{operation} ({size}): {key} {old[key]:.2f} -> {result[key]:.2f} {unit} "
+                                           f"(+{(result[key] / old[key] - 1) * 100 if old[key] else 100:.0f}%)")
+
+        return regressions
@@ -0,0 +1,30 @@
+# Name        : BenchmarkService class file for the Moview benchmarks
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains BenchmarkService class, a MovieService that
+#               keeps its database and caches in a directory of its own
+#               and sends its requests to a FakeImdbApi, without the
+#               real API key's quota or rate limit.
+
+from MovieService import MovieService # Used for the code being benchmarked
+import os # Used to build the paths of the service's directories
+
+# Class for the benchmarked Moview service
+class BenchmarkService(MovieService):
+
+    # The fake API has no quota or rate limit, so neither does the scheduler
+    DAILY_QUOTA = 10 ** 9
+    REQUEST_RATE = 10 ** 6
+    REQUEST_BURST = 10 ** 6
+
+    # Class initialization, with the directory to keep the database and caches in and
+    # the url of the fake API
+    def __init__(self, directory, api_url):
+        self.DATABASE_DIR = os.path.join(directory, "database")
+        self.CACHE_DIR = os.path.join(directory, "cache")
+        self.API_URL = api_url
+
+        # The database expects its directory to exist already
+        os.makedirs(self.DATABASE_DIR, exist_ok=True)
+
+        super().__init__()
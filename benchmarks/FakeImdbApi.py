@@ -0,0 +1,252 @@
+# Name        : FakeImdbApi class file for the Moview benchmarks
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Contains FakeImdbApi class, a local stand-in for
+#               imdb-api.com. It answers with the recorded JSON in the
+#               fixtures directory (repeated to make result sets of any
+#               size) and with generated poster images, after a set delay
+#               and with a set share of failed requests, so that the
+#               benchmarks never depend on (or use up) the real API.
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler # Used to serve the fake API
+from urllib.parse import urlsplit, parse_qs, unquote # Used to read the parts of each request's path
+from PIL import Image # Used to generate the poster images
+from io import BytesIO # Used to save the generated posters as JPEG data in memory
+import copy # Used to copy the recorded JSON before changing it
+import json # Used to read the recorded JSON and write the responses
+import os # Used to find the fixtures directory
+import random # Used to decide which requests fail
+import re # Used to recognize requests for posters at other sizes
+import threading # Used to serve requests in the background
+import time # Used to delay each response
+import zlib # Used to pick a poster image for each url
+
+# Class for the fake IMDb-API server
+class FakeImdbApi():
+
+    # Directory with one recorded IMDb-API response for each kind of request
+    FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+    # Genres given to the generated movies (each movie gets three of them in a row)
+    GENRES = ("Action", "Adventure", "Animation", "Comedy", "Crime", "Drama", "Family",
+              "Fantasy", "Horror", "Mystery", "Romance", "Sci-Fi", "Thriller")
+
+    # Size of the generated posters (about the size IMDb-API's posters are sent at),
+    # and the number of different posters generated
+    POSTER_SIZE = (600, 889)
+    POSTER_COUNT = 8
+
+    # Class for handling each request to the server (the server's "api" attribute is
+    # the FakeImdbApi that is answering)
+    class Handler(BaseHTTPRequestHandler):
+
+        # Keep connections alive between requests, like the real API does, and send
+        # each response straight away (rather than waiting to fill a network packet)
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        # Method called for every GET request
+        def do_GET(self):
+            status, content_type, body = self.server.api.respond(self.path)
+
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        # Method called to log each request (left quiet so it doesn't slow the benchmarks down)
+        def log_message(self, format, *args):
+            pass
+
+    # Class initialization. Every response is delayed by latency seconds, failure_rate is
+    # the share of requests (0 to 1) answered with a 503 error instead, and size is the
+    # number of results in every search
+    def __init__(self, latency=0.0, failure_rate=0.0, size=10, seed=0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.size = size
+
+        # Random number generator used to pick the failed requests (seeded, so that
+        # every run fails the same requests)
+        self.random = random.Random(seed)
+
+        # Load the recorded response for each kind of request
+        self.fixtures = {}
+        for kind in ("SearchMovie", "AdvancedSearch", "Title", "Ratings"):
+            with open(os.path.join(self.FIXTURES_DIR, f"{kind}.json"), "r") as f:
+                self.fixtures[kind] = json.load(f)
+
+        # Generate the poster images
+        self.posters = [self.make_poster(i) for i in range(self.POSTER_COUNT)]
+
+        # Posters already resized, as (poster number, dims) -> bytes
+        self.resized = {}
+
+        # Encoded search responses, as (kind, size, genres) -> bytes, since every search
+        # of the same size returns the same movies
+        self.responses = {}
+
+        # Number of requests answered, and how many of them were failed on purpose
+        self.requests = 0
+        self.failures = 0
+        self.lock = threading.Lock()
+
+        # Create the server on a free port on this computer
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.Handler)
+        self.server.daemon_threads = True
+        self.server.api = self
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    # Method to start answering requests in the background
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    # Method to stop the server
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    # Method to get the number of requests answered so far, and how many were failed
+    def stats(self):
+        with self.lock:
+            return {"requests": self.requests, "failures": self.failures}
+
+    # Method to generate a poster. Noise is used for the picture so that the JPEG is about
+    # as large (and as slow to decode) as a real poster
+    def make_poster(self, number):
+        red = Image.effect_noise(self.POSTER_SIZE, 20 + number * 5)
+        green = Image.linear_gradient("L").resize(self.POSTER_SIZE)
+        blue = Image.new("L", self.POSTER_SIZE, number * 30 % 256)
+
+        poster_bytes = BytesIO()
+        Image.merge("RGB", (red, green, blue)).save(poster_bytes, "JPEG", quality=85)
+        return poster_bytes.getvalue()
+
+    # Method to get poster number "number" resized to dims, as JPEG data
+    def resized_poster(self, number, dims):
+        key = (number, dims)
+        with self.lock:
+            body = self.resized.get(key)
+        if body is not None:
+            return body
+
+        poster_bytes = BytesIO()
+        Image.open(BytesIO(self.posters[number])).resize(dims, Image.LANCZOS).save(poster_bytes, "JPEG", quality=85)
+        body = poster_bytes.getvalue()
+
+        with self.lock:
+            self.resized[key] = body
+        return body
+
+    # Method to get the id, title, genres and poster url of generated movie number "number"
+    def movie(self, number):
+        movie_id = f"tt{number:07d}"
+        genres = [self.GENRES[(number + i) % len(self.GENRES)] for i in range(3)]
+        return {"id": movie_id,
+                "title": f"Benchmark Movie {number}",
+                "image": f"{self.url}/images/original/{movie_id}.jpg",
+                "genres": ", ".join(genres),
+                "genreList": [{"key": genre, "value": genre} for genre in genres],
+                "imDbRating": f"{number % 91 / 10:.1f}"}
+
+    # Method to get the status, content type and body of the response to a path
+    def respond(self, path):
+
+        # Wait as long as the real API would take
+        if self.latency:
+            time.sleep(self.latency)
+
+        # Fail the request if it has been picked to fail
+        with self.lock:
+            self.requests += 1
+            failed = self.random.random() < self.failure_rate
+            if failed:
+                self.failures += 1
+
+        if failed:
+            return 503, "application/json", b'{"errorMessage": "Service Unavailable"}'
+
+        url = urlsplit(path)
+        parts = [unquote(part) for part in url.path.strip("/").split("/")]
+
+        # Posters are chosen by url, so the same url always gets the same image
+        if parts[:2] == ["images", "original"]:
+            return 200, "image/jpeg", self.posters[zlib.crc32(url.path.encode()) % self.POSTER_COUNT]
+
+        # Like IMDb-API, a poster can also be asked for at another size, given as
+        # "<width>x<height>" in place of "original"
+        if len(parts) == 3 and parts[0] == "images" and re.fullmatch(r"\d+x\d+", parts[1]):
+            number = zlib.crc32(f"/images/original/{parts[2]}".encode()) % self.POSTER_COUNT
+            return 200, "image/jpeg", self.resized_poster(number, tuple(map(int, parts[1].split("x"))))
+
+        # IMDb-API's paths look like "[en/]API/<kind>/<key>/<search or movie id>"
+        if parts[0] == "en":
+            parts = parts[1:]
+
+        if len(parts) >= 3 and parts[0] == "API":
+            kind = parts[1]
+
+            if kind in ("SearchMovie", "AdvancedSearch"):
+                genres = parse_qs(url.query).get("genres", [""])[0]
+                return 200, "application/json", self.search(kind, genres)
+
+            if kind == "Title" and len(parts) == 4:
+                return 200, "application/json", self.title(parts[3])
+
+            if kind == "Ratings" and len(parts) == 4:
+                return 200, "application/json", self.ratings(parts[3])
+
+        return 404, "application/json", b'{"errorMessage": "Not Found"}'
+
+    # Method to get the encoded response to a SearchMovie or AdvancedSearch request. The
+    # recorded result is repeated once for every generated movie
+    def search(self, kind, genres):
+        key = (kind, self.size, genres)
+        with self.lock:
+            body = self.responses.get(key)
+        if body is not None:
+            return body
+
+        response = copy.deepcopy(self.fixtures[kind])
+        template = response["results"][0]
+        results = []
+
+        for number in range(1, self.size + 1):
+            result = dict(template)
+            movie = self.movie(number)
+            result["id"] = movie["id"]
+            result["title"] = movie["title"]
+            result["image"] = movie["image"]
+
+            # Movies from an AdvancedSearch always have the genres that were searched for
+            if kind == "AdvancedSearch":
+                result["genres"] = ", ".join(dict.fromkeys([genre for genre in genres.split(",") if genre] +
+                                                           movie["genres"].split(", ")))
+                result["imDbRating"] = movie["imDbRating"]
+
+            results.append(result)
+
+        response["results"] = results
+        body = json.dumps(response).encode()
+
+        with self.lock:
+            self.responses[key] = body
+        return body
+
+    # Method to get the encoded response to a Title request
+    def title(self, movie_id):
+        response = copy.deepcopy(self.fixtures["Title"])
+        movie = self.movie(int(movie_id[2:]) if movie_id[2:].isdigit() else 0)
+        response.update(id=movie_id, title=movie["title"], fullTitle=f"{movie['title']} (2010)",
+                        image=movie["image"], genres=movie["genres"], genreList=movie["genreList"],
+                        imDbRating=movie["imDbRating"])
+        return json.dumps(response).encode()
+
+    # Method to get the encoded response to a Ratings request
+    def ratings(self, movie_id):
+        response = copy.deepcopy(self.fixtures["Ratings"])
+        movie = self.movie(int(movie_id[2:]) if movie_id[2:].isdigit() else 0)
+        response.update(imDbId=movie_id, title=movie["title"], fullTitle=f"{movie['title']} (2010)",
+                        imDb=movie["imDbRating"])
+        return json.dumps(response).encode()
@@ -0,0 +1,79 @@
+# Name        : Moview benchmarks
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Runs the Moview benchmark suite against a local fake
+#               IMDb-API server, reporting the p50/p95 latency,
+#               throughput and peak memory of each operation for each
+#               result set and watchlist size. The results can be saved
+#               as a baseline, and later runs are compared with it, so
+#               that a change that makes Moview slower is noticed.
+#
+#               Usage: python benchmarks/run.py [--save-baseline]
+
+import argparse # Used to read the command-line options
+import json # Used to read and write the baseline
+import os # Used to find the Moview code and the baseline
+import sys # Used to import the Moview code, and to exit with an error on a regression
+
+# The benchmarks run the Moview code from the directory above this one
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+
+from AtomicWrite import atomic_write # Used to save the baseline safely
+from FakeImdbApi import FakeImdbApi # Used to stand in for imdb-api.com
+from Benchmark import Benchmark # Used to run the benchmarks
+
+# Main function to start the fake API, run the benchmarks, and compare the results with
+# (or save them as) the baseline
+def main():
+    parser = argparse.ArgumentParser(description="Moview benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000],
+                        help="result set and watchlist sizes to benchmark")
+    parser.add_argument("--repeat", type=int, default=20, help="number of times each operation is timed per size")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds the fake API waits before each response")
+    parser.add_argument("--failure-rate", type=float, default=0.0,
+                        help="share of requests (0 to 1) the fake API fails with a 503 error")
+    parser.add_argument("--baseline", default=os.path.join(BENCHMARKS_DIR, "baseline.json"),
+                        help="JSON file with the baseline results")
+    parser.add_argument("--save-baseline", action="store_true", help="save the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="how much higher (e.g. 0.5 for 50%%) p95 latency or peak memory can be before it counts as a regression")
+    args = parser.parse_args()
+
+    api = FakeImdbApi(args.latency, args.failure_rate)
+    api.start()
+    try:
+        benchmark = Benchmark(api, args.repeat)
+        results = benchmark.run(args.sizes)
+    finally:
+        api.stop()
+
+    print(f"\nFake API: {api.stats()['requests']} requests, {api.stats()['failures']} failed on purpose")
+
+    if args.save_baseline:
+        with atomic_write(args.baseline) as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved the results as the baseline in {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare with (run with --save-baseline to make one)")
+        return
+
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)
+
+    # Results are only comparable with a baseline made with the same settings
+    if baseline["settings"] != results["settings"]:
+        print(f"Warning: the baseline was made with different settings: {baseline['settings']}")
+
+    regressions = benchmark.compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) compared with the baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+    print("No regressions compared with the baseline")
+
+main() # Call the main function
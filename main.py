@@ -15,15 +15,58 @@
 #               Background music from https://tiny.one/musbg
 #               Direction arrows from https://tiny.one/micons
 
-# Import the Moview and Tkinter classes
-from Moview import Moview
-from tkinter import *
+# Import the argparse library, used to read the command-line options, and the os
+# library, used to read the profiling and image budget settings from the environment
+import argparse
+import os
+
+# Import the StartupTimer class, used to time how long the program takes to start
+from StartupTimer import StartupTimer
 
 # Main function to create a new Tkitner window and instantiate a new
-# Moview object using the window (and also set up the tkinter mainloop)
+# Moview object using the window (and also set up the tkinter mainloop).
+# With the "--serve" option, the headless JSON server is run instead
 def main():
-    root = Tk()
-    window = Moview(root)
-    root.mainloop()
+    timer = StartupTimer()
+
+    parser = argparse.ArgumentParser(description="Moview movie watchlist application")
+    parser.add_argument("--serve", action="store_true", help="run the JSON server instead of the window")
+    parser.add_argument("--host", default="127.0.0.1", help="address for the JSON server to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port for the JSON server to listen on")
+    parser.add_argument("--startup-report", action="store_true", help="print how long each step of startup took")
+    parser.add_argument("--profile", nargs="?", const="profiles", default=os.environ.get("MOVIEW_PROFILE"),
+                        metavar="DIR", help="save a profile of every screen change to DIR (default: profiles); "
+                                            "can also be turned on with the MOVIEW_PROFILE environment variable")
+    parser.add_argument("--image-budget", type=float, default=os.environ.get("MOVIEW_IMAGE_BUDGET"), metavar="MB",
+                        help="most memory (in MB) the window's images can use before the images on hidden screens "
+                             "are let go of; can also be set with the MOVIEW_IMAGE_BUDGET environment variable")
+    args = parser.parse_args()
+
+    # The classes are imported here, so that the server can run without Tkinter
+    # (or a display) and the window doesn't need to load the server
+    if args.serve:
+        from MovieService import MovieService
+        from MovieServer import MovieServer
+        import asyncio
+
+        service = MovieService()
+        server = MovieServer(service, MovieService.POSTER_WORKERS)
+        try:
+            asyncio.run(server.serve(args.host, args.port))
+        finally:
+            service.close()
+
+    else:
+        timer.verbose = args.startup_report
+
+        from Moview import Moview
+        from tkinter import Tk
+        timer.mark("imports")
+
+        root = Tk()
+        timer.mark("window")
+        image_budget = int(float(args.image_budget) * 1024 * 1024) if args.image_budget else None
+        window = Moview(root, args.profile, timer, image_budget)
+        root.mainloop()
 
 main() # Call the main function
\ No newline at end of file
@@ -0,0 +1,53 @@
+# Name        : Moview prefetch command
+# Programmers : Sanchaai, Aqib, & Landry
+# Date        : 10/18/26
+# Description : Fills Moview's caches with everything needed to view the
+#               movies in one user's (or every user's) watchlist without
+#               an internet connection: posters, details, ratings, and
+#               recommendations. Several movies are prefetched at once,
+#               and a run that is stopped carries on where it left off
+#               the next time it is run.
+#
+#               Usage: python prefetch.py [--user NAME] [--jobs N]
+
+# Import the argparse library, used to read the command-line options, and the os
+# library, used to build the paths of the progress and report files
+import argparse
+import os
+
+# Import the classes used to fill the caches
+from MovieService import MovieService
+from Prefetcher import Prefetcher
+
+# Main function to prefetch the watchlists and print a summary of the run
+def main():
+    parser = argparse.ArgumentParser(description="Prefetch Moview watchlists for offline use")
+    parser.add_argument("--user", help="only prefetch this user's watchlist (default: every user)")
+    parser.add_argument("--jobs", type=int, default=4, help="number of movies prefetched at the same time")
+    parser.add_argument("--similar-posters", type=int, default=10,
+                        help="number of each movie's recommendations whose posters are prefetched")
+    parser.add_argument("--restart", action="store_true", help="prefetch every movie again, ignoring earlier runs")
+    args = parser.parse_args()
+
+    service = MovieService()
+    try:
+        names = [args.user] if args.user else service.db.users()
+        if args.user and not service.user_exists(args.user):
+            parser.error(f"no user called {args.user!r}")
+
+        prefetcher = Prefetcher(service, args.jobs, args.similar_posters,
+                                os.path.join(MovieService.CACHE_DIR, "prefetch.json"),
+                                os.path.join(MovieService.CACHE_DIR, "prefetch-report.json"))
+        if args.restart:
+            prefetcher.restart()
+
+        summary = prefetcher.run(names)
+
+    finally:
+        service.close()
+
+    print(f"Prefetched {summary['prefetched']} of {summary['movies']} movies in {summary['seconds']}s "
+          f"({len(summary['failed'])} failed, {summary['budget']['remaining']} API calls left today)")
+    print(f"Report saved to {os.path.join(MovieService.CACHE_DIR, 'prefetch-report.json')}")
+
+main() # Call the main function